@@ -3,18 +3,12 @@
 # SPDX-License-Identifier: MIT
 
 # -*- coding: utf-8 -*-
-from typing import List
+from typing import Iterator, List
 
 from .api.AbstractPackageCheck import AbstractPackageCheck
 from .helper.CheckType import CheckType
-from .helper.CheckAttributes import check_attributes
-
-try:
-    from tts.core.logging import SPrint, WPrint, EPrint
-    from tts.core.api.internalApi.Api import Api
-    api = Api()
-except:
-    from logging import info as SPrint, warning as WPrint, error as EPrint
+from .helper.CheckAttributes import AttributeRules, iter_check_attributes, parse_attribute_rules
+from .helper.ecu_test_api import SPrint, WPrint, EPrint
 
 # module type: mandatory
 MODULE_TYPE = CheckType.PACKAGE.value
@@ -65,10 +59,13 @@ class CheckPackageAttributes(AbstractPackageCheck):
     - <attribute name> does not match pattern. <CustomMessage>
     - <attribute name> does not match pattern: <RegexPattern>
     - "No field: 'RegexPattern' was provided!"
-    - "<Provided pattern> is not a valid pattern!"
+
+    Invalid patterns are reported once as configuration error when the config.yaml is loaded.
 
     """
 
+    INDEXED = True
+
     def __init__(self, internalApi):  # pylint: disable=W0613
         """
         Constructor to load the check parameters from config.yaml
@@ -82,4 +79,10 @@ class CheckPackageAttributes(AbstractPackageCheck):
         return type(self).__name__
 
     def check(self, test_item, parameters) -> List:
-        return check_attributes(test_item, MODULE_TYPE, self.config, parameters)
+        return list(self.iter_check(test_item, parameters))
+
+    def parse_parameters(self, parameters) -> AttributeRules:
+        return parse_attribute_rules(parameters, self.config)
+
+    def iter_check(self, test_item, parameters) -> Iterator:
+        return iter_check_attributes(test_item, MODULE_TYPE, self.config, parameters)
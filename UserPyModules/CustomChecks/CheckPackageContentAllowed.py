@@ -3,20 +3,17 @@
 # SPDX-License-Identifier: MIT
 
 # -*- coding: utf-8 -*-
-from typing import List
+from dataclasses import dataclass
+from itertools import chain
+from typing import Iterator, List
 
 from .api.CheckResult import CheckResult
 from .api.AbstractPackageCheck import AbstractPackageCheck
 from .helper.CheckType import CheckType
 from .helper.ConfigKeys import ParameterKeys as pk
-
-try:
-    from tts.core.logging import SPrint, WPrint, EPrint
-    from tts.core.api.internalApi.Api import Api
-
-    api = Api()
-except:
-    from logging import info as SPrint, warning as WPrint, error as EPrint
+from .helper.ItemSnapshot import get_child_test_steps, iter_test_step_tree
+from .helper.PackageVisitor import PackageVisitor
+from .helper.ecu_test_api import SPrint, WPrint, EPrint
 
 # module type: mandatory
 MODULE_TYPE = CheckType.PACKAGE.value
@@ -27,6 +24,37 @@ MODULE_TYPE = CheckType.PACKAGE.value
 # ParameterKeys.SEARCH_DEPTH
 
 
+@dataclass(frozen=True)
+class AllowedContent:
+    """
+    Parsed parameters of CheckPackageContentAllowed.
+    """
+
+    allow_list: frozenset
+    # infinite if all package layers are checked
+    search_depth: float
+
+
+class AllowedContentVisitor(PackageVisitor):
+    """
+    Collects the test steps up to the search depth during the fused traversal of a package.
+    """
+
+    def __init__(self, parameters: AllowedContent):
+        """
+        Constructor
+        """
+        self.allow_list = parameters.allow_list
+        self.search_depth = parameters.search_depth
+        self.test_steps = []
+
+    def on_step(self, layer, test_step):
+        self.test_steps.append(test_step)
+
+    def results(self) -> Iterator:
+        return CheckPackageContentAllowed.check_test_steps(self.test_steps, self.allow_list)
+
+
 class CheckPackageContentAllowed(AbstractPackageCheck):
     """
     Check Package for allowed test steps
@@ -48,6 +76,8 @@ class CheckPackageContentAllowed(AbstractPackageCheck):
     Return messages:
     ---------------------
      - "Not allowed content of type <ts_type> in line <ts_line>!"
+
+    A missing AllowList is reported once as configuration error.
     """
 
     def __init__(self, internalApi):  # pylint: disable=W0613
@@ -55,7 +85,6 @@ class CheckPackageContentAllowed(AbstractPackageCheck):
         Constructor
         """
         super().__init__()
-        self.checkResults = []
 
     # needs to be there, leave untouched
     def GetName(self) -> str:
@@ -65,37 +94,38 @@ class CheckPackageContentAllowed(AbstractPackageCheck):
         return type(self).__name__
 
     def check(self, test_item, parameters) -> List:
-        allow_list = parameters.get(pk.ALLOWLIST)
-        search_depth = parameters.get(pk.SEARCH_DEPTH)
+        return list(self.iter_check(test_item, parameters))
 
+    def parse_parameters(self, parameters) -> AllowedContent:
+        allow_list = parameters.get(pk.ALLOWLIST)
         if not allow_list:
-            return [CheckResult(
-                f'Parameter {pk.ALLOWLIST!r} not configured '
-                f'for the check {self.GetName()!r} in the config. '
-                f'Please check {self.config.config_rel_path!r}!')]
+            raise ValueError(f'Parameter {pk.ALLOWLIST!r} not configured')
 
-        if not search_depth:
-            search_depth = float('inf')
+        return AllowedContent(allow_list=frozenset(allow_list),
+                              search_depth=parameters.get(pk.SEARCH_DEPTH) or float('inf'))
 
-        for test_step in self.get_test_steps_of_item(test_item):
-            self.check_test_step(test_step=test_step,
-                                 layer=0,
-                                 allow_list=allow_list,
-                                 search_depth=search_depth)
+    def iter_check(self, test_item, parameters) -> Iterator:
+        if not isinstance(parameters, AllowedContent):
+            parameters = self.parse_parameters(parameters)
+        # reuses the flattened test step tree of a snapshot
+        test_steps = (test_step for _, test_step
+                      in iter_test_step_tree(test_item, parameters.search_depth))
+        yield from self.check_test_steps(test_steps, parameters.allow_list)
 
-        return self.checkResults
+    def visitor(self, test_item, parameters) -> AllowedContentVisitor:
+        return AllowedContentVisitor(parameters)
 
-    def check_test_step(self, test_step, layer, allow_list, search_depth) -> None:
+    def check_test_step(self, test_step, layer, allow_list, search_depth) -> List:
         """
         Check if the test step is allowed by the defined allow list;
-        checks child test steps recursively as well for the given search depth
+        checks child test steps as well for the given search depth
 
         Parameters
         ----------
         test_step: TestStep object
             the test step item
         layer: int
-            the current package layer
+            the package layer of the test step
         allow_list: List[str]
             allowed test step types
         search_depth: int
@@ -103,21 +133,37 @@ class CheckPackageContentAllowed(AbstractPackageCheck):
 
         Returns
         -------
-        None
+        check results
         """
         if layer >= search_depth:
-            return
+            return []
 
-        if test_step.GetType() not in allow_list:
-            self.checkResults.append(CheckResult(
-                f"Not allowed content of type {test_step.GetType()} in line "
-                f"{test_step.GetLineNo()}!"))
+        children = (child for _, child
+                    in iter_test_step_tree(test_step, search_depth - layer - 1))
+        return list(self.check_test_steps(chain([test_step], children), frozenset(allow_list)))
 
-        for child in self.get_test_steps_of_item(test_step):
-            self.check_test_step(test_step=child,
-                                 layer=layer + 1,
-                                 allow_list=allow_list,
-                                 search_depth=search_depth)
+    @staticmethod
+    def check_test_steps(test_steps, allow_list) -> Iterator:
+        """
+        Checks the given test steps against the allow list.
+
+        Parameters
+        ----------
+        test_steps: iterable of TestStep objects
+            the test steps to check
+        allow_list: frozenset of str
+            allowed test step types
+
+        Returns
+        -------
+        iterator of check results
+        """
+        for test_step in test_steps:
+            test_step_type = test_step.GetType()
+            if test_step_type not in allow_list:
+                line_no = test_step.GetLineNo()
+                yield CheckResult("Not allowed content of type {} in line {}!",
+                                  test_step_type, line_no, rule=pk.ALLOWLIST, line=line_no)
 
     def get_test_steps_of_item(self, item) -> List:
         """
@@ -132,11 +178,4 @@ class CheckPackageContentAllowed(AbstractPackageCheck):
         -------
         test step items
         """
-        try:
-            return item.GetTestSteps(skipDisabledSteps=False,
-                                     recursive=False,
-                                     whiteList=None,
-                                     blackList=None)
-        except AttributeError:
-            # test step does not have test step children
-            return []
+        return get_child_test_steps(item)
@@ -3,19 +3,17 @@
 # SPDX-License-Identifier: MIT
 
 # -*- coding: utf-8 -*-
-from typing import List
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterator, List, Tuple
 
 from .api.CheckResult import CheckResult
 from .api.AbstractPackageCheck import AbstractPackageCheck
 from .helper.CheckType import CheckType
 from .helper.ConfigKeys import ParameterKeys as pk
-
-try:
-    from tts.core.logging import SPrint, WPrint, EPrint
-    from tts.core.api.internalApi.Api import Api
-    api = Api()
-except:
-    from logging import info as SPrint, warning as WPrint, error as EPrint
+from .helper.PackageVisitor import PackageVisitor
+from .helper.ecu_test_api import SPrint, WPrint, EPrint
 
 # module type: mandatory
 MODULE_TYPE = CheckType.PACKAGE.value
@@ -24,6 +22,53 @@ MODULE_TYPE = CheckType.PACKAGE.value
 # ParameterKeys.DENYLIST
 
 
+@dataclass(frozen=True)
+class ForbiddenContent:
+    """
+    Parsed parameters of CheckPackageContentForbidden.
+    """
+
+    denylist: Tuple[str, ...]
+    # finds any forbidden content with a single search, None for an empty denylist
+    matcher: Any
+
+
+class ForbiddenContentVisitor(PackageVisitor):
+    """
+    Collects the test steps with forbidden content, grouped by denylist entry. Used for the fused
+    traversal of a package as well as by CheckPackageContentForbidden.iter_check.
+    """
+
+    def __init__(self, parameters: ForbiddenContent):
+        """
+        Constructor
+        """
+        self.denylist = parameters.denylist
+        self.matcher = parameters.matcher
+        self.forbidden_steps = [[] for _ in parameters.denylist]
+
+    def on_recursive_step(self, test_step):
+        self.add_test_step(test_step)
+
+    def add_test_step(self, test_step):
+        """
+        Searches the text of the test step for all denylist entries at the same time.
+        """
+        text = str(test_step)
+        if self.matcher.search(text) is None:
+            return
+        for index, forbidden in enumerate(self.denylist):
+            if forbidden in text:
+                self.forbidden_steps[index].append(test_step)
+
+    def results(self) -> Iterator:
+        for test_steps in self.forbidden_steps:
+            for test_step in test_steps:
+                line_no = test_step.GetLineNo()
+                yield CheckResult("Forbidden content of type {} in line {}!",
+                                  test_step.GetType(), line_no, rule=pk.DENYLIST, line=line_no)
+
+
 class CheckPackageContentForbidden(AbstractPackageCheck):
     """
     Check Package Content
@@ -47,6 +92,9 @@ class CheckPackageContentForbidden(AbstractPackageCheck):
 
     - "Forbidden content of type <ts_type> in line <ts_line>!"
 
+    The test steps are converted to text once and searched for all denylist entries at the same
+    time. The results are ordered by denylist entry, then by test step.
+
 
     Limitations
     -----------
@@ -66,18 +114,47 @@ class CheckPackageContentForbidden(AbstractPackageCheck):
         return type(self).__name__
 
     def check(self, test_item, parameters) -> List:
-        # init clean check result list
-        checkResults = []
+        return list(self.iter_check(test_item, parameters))
+
+    def parse_parameters(self, parameters) -> ForbiddenContent:
+        if pk.DENYLIST not in parameters:
+            raise ValueError(f'Parameter {pk.DENYLIST!r} not configured')
 
-        # Check for forbidden content
-        ts_list = test_item.GetTestSteps(recursive=True)
-        forbiddenContent = parameters[pk.DENYLIST]
+        denylist = tuple(parameters[pk.DENYLIST] or ())
+        return ForbiddenContent(denylist=denylist,
+                                matcher=compile_denylist(denylist) if denylist else None)
 
-        for forbidden in forbiddenContent:
-            for testStep in ts_list:
-                if forbidden in str(testStep):
-                    checkResults.append(
-                    CheckResult(f"Forbidden content of type {testStep.GetType()} in line "
-                                f"{testStep.GetLineNo()}!"))
+    def iter_check(self, test_item, parameters) -> Iterator:
+        if not isinstance(parameters, ForbiddenContent):
+            parameters = self.parse_parameters(parameters)
+        if not parameters.denylist:
+            return
 
-        return checkResults
+        visitor = ForbiddenContentVisitor(parameters)
+        for testStep in test_item.GetTestSteps(recursive=True):
+            visitor.add_test_step(testStep)
+        yield from visitor.results()
+
+    def visitor(self, test_item, parameters) -> PackageVisitor:
+        if not parameters.denylist:
+            # nothing to search for, the test steps are not read
+            return PackageVisitor()
+        return ForbiddenContentVisitor(parameters)
+
+
+@lru_cache(maxsize=64)
+def compile_denylist(denylist):
+    """
+    Compiles all denylist entries into one alternation, which finds out with a single search
+    whether a test step contains any forbidden content.
+
+    Parameters
+    ----------
+    denylist: tuple of str
+        the forbidden contents
+
+    Returns
+    -------
+    compiled pattern
+    """
+    return re.compile('|'.join(re.escape(entry) for entry in sorted(set(denylist))))
@@ -3,20 +3,14 @@
 # SPDX-License-Identifier: MIT
 
 # -*- coding: utf-8 -*-
-import re
-from typing import List
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional
 
 from .api.CheckResult import CheckResult
 from .api.AbstractPackageCheck import AbstractPackageCheck
 from .helper.CheckType import CheckType
 from .helper.ConfigKeys import ParameterKeys as pk
-
-try:
-    from tts.core.logging import SPrint, WPrint, EPrint
-    from tts.core.api.internalApi.Api import Api
-    api = Api()
-except:
-    from logging import info as SPrint, warning as WPrint, error as EPrint
+from .helper.ecu_test_api import SPrint, WPrint, EPrint
 
 # module type: mandatory
 MODULE_TYPE = CheckType.PACKAGE.value
@@ -31,6 +25,38 @@ MODULE_TYPE = CheckType.PACKAGE.value
 # ParameterKeys.VERSION
 
 
+@dataclass(frozen=True)
+class TextPattern:
+    """
+    Parsed RegexPattern entry of the description or the version.
+    """
+
+    regex: Optional[str]
+    # compiled pattern, None if it is missing or invalid (reported once as config error)
+    pattern: Any
+    custom_message: Optional[str] = None
+    # whether a CustomMessage is configured, also if it is empty
+    has_custom_message: bool = False
+
+
+@dataclass(frozen=True)
+class GeneralInformation:
+    """
+    Parsed parameters of CheckPackageGeneralInformation.
+    """
+
+    # whether the description is checked
+    check_description: bool = False
+    # None if not configured
+    min_description_length: Optional[int] = None
+    description_pattern: Optional[TextPattern] = None
+    # True or False, None if not configured
+    test_case_flag: Optional[bool] = None
+    # True or False if the version must be set or not, a TextPattern if it must match a pattern,
+    # None if not configured
+    version: Any = None
+
+
 class CheckPackageGeneralInformation(AbstractPackageCheck):
     """
     Check Package General Information
@@ -59,7 +85,6 @@ class CheckPackageGeneralInformation(AbstractPackageCheck):
     - "Description should contain pattern: <RegexPattern>"
     - "TestCaseFlag must be set!"
     - "TestCaseFlag must not be set!"
-    - "'<RegexPattern>' is not a valid regular expression pattern. Check <config file>!"
     - "'<Version>' does not match pattern <RegexPattern>"
 
 
@@ -70,6 +95,8 @@ class CheckPackageGeneralInformation(AbstractPackageCheck):
 
     """
 
+    INDEXED = True
+
     def __init__(self, internalApi):  # pylint: disable=W0613
         """
         Constructor to load the check parameters from config.yaml
@@ -83,24 +110,61 @@ class CheckPackageGeneralInformation(AbstractPackageCheck):
         return type(self).__name__
 
     def check(self, test_item, parameters) -> List:
-        # init clean check result list
-        checkResults = []
+        return list(self.iter_check(test_item, parameters))
+
+    def parse_parameters(self, parameters) -> GeneralInformation:
+        description = parameters.get(pk.DESCRIPTION)
+        check_description = description is not None and description.get(pk.CHECK) is True
+        if not check_description:
+            description = {}
+
+        version = parameters.get(pk.VERSION)
+        if version is not None and not isinstance(version, bool):
+            version = self.parse_pattern(version)
+
+        return GeneralInformation(
+            check_description=check_description,
+            min_description_length=description.get(pk.MINLENGTH),
+            description_pattern=self.parse_pattern(description)
+            if pk.REGEX_PATTERN in description else None,
+            test_case_flag=parameters.get(pk.TESTCASEFLAG),
+            version=version)
+
+    def parse_pattern(self, entry) -> TextPattern:
+        """
+        Parses the RegexPattern and CustomMessage of the description or the version.
+
+        Parameters
+        ----------
+        entry: dict
+            Description or Version entry in the configuration
+
+        Returns
+        -------
+        TextPattern
+        """
+        regex = entry.get(pk.REGEX_PATTERN)
+        return TextPattern(regex=regex, pattern=self.config.get_regex(regex),
+                           custom_message=entry.get(pk.CUSTOM_MESSAGE),
+                           has_custom_message=pk.CUSTOM_MESSAGE in entry)
+
+    def iter_check(self, test_item, parameters) -> Iterator:
+        if not isinstance(parameters, GeneralInformation):
+            parameters = self.parse_parameters(parameters)
 
         # Check the Description
-        if pk.DESCRIPTION in parameters.keys() and parameters[pk.DESCRIPTION].get(pk.CHECK) is True:
-            checkResults.extend(self.check_description(test_item, parameters[pk.DESCRIPTION]))
+        if parameters.check_description:
+            yield from self.check_description(test_item, parameters)
 
         # Check the TestCaseFlag
-        if pk.TESTCASEFLAG in parameters.keys():
-            checkResults.extend(self.check_test_case_flag(test_item, parameters[pk.TESTCASEFLAG]))
+        if parameters.test_case_flag is not None:
+            yield from self.check_test_case_flag(test_item, parameters.test_case_flag)
 
         # Check the Version
-        if pk.VERSION in parameters.keys():
-            checkResults.extend(self.check_version(test_item, parameters[pk.VERSION]))
-
-        return checkResults
+        if parameters.version is not None:
+            yield from self.check_version(test_item, parameters.version)
 
-    def check_description(self, package, description):
+    def check_description(self, package, parameters):
         """
         Checks the description
 
@@ -108,51 +172,44 @@ class CheckPackageGeneralInformation(AbstractPackageCheck):
         ----------
         package: Package object
             the package
-        description: dict
-            Description entry in the configuration
+        parameters: GeneralInformation
+            the parsed custom check parameters
 
         Returns
         -------
-        check results
+        iterator of check results
 
         """
-        checkResults = []
         desc_len = len(package.GetDescription())
 
         # Check if description is empty
         if desc_len == 0:
-            checkResults.append(
-                CheckResult('Description must not be empty!'))
-            return checkResults
+            yield CheckResult('Description must not be empty!', rule=pk.DESCRIPTION)
+            return
 
         # Check if description contains at least MINLENGTH characters
-        if pk.MINLENGTH in description:
-            min_desc_len = description[pk.MINLENGTH]
+        min_desc_len = parameters.min_description_length
+        if min_desc_len is not None:
             if desc_len < min_desc_len:
-                checkResults.append(CheckResult(f'Description insufficient. '
-                                                f'Should contain at least {min_desc_len} '
-                                                f'characters!'))
+                yield CheckResult(f'Description insufficient. '
+                                  f'Should contain at least {min_desc_len} '
+                                  f'characters!', rule=pk.DESCRIPTION)
 
         # Check if descriptions contains the declared pattern
-        if pk.REGEX_PATTERN in description:
-            regex = description.get(pk.REGEX_PATTERN)
-            try:
-                re.compile(regex)
-            except re.error:
-                checkResults.append(CheckResult(f'"{regex}" is not a valid pattern. '
-                                                f'Check "{self.config.config_rel_path}"!'))
-            else:
-                # if re.compile is successful the description check will be performed
-                if not re.search(regex, package.GetDescription()):
+        text_pattern = parameters.description_pattern
+        if text_pattern is not None:
+            # invalid patterns are reported once as config error
+            pattern = text_pattern.pattern
+            if pattern is not None:
+                # if the pattern is valid the description check will be performed
+                if not pattern.search(package.GetDescription()):
                     # check if message for pattern should be more specific
-                    if pk.CUSTOM_MESSAGE in description:
+                    if text_pattern.has_custom_message:
                         msg = f'Description should contain pattern. ' \
-                              f'{description.get(pk.CUSTOM_MESSAGE)}'
+                              f'{text_pattern.custom_message}'
                     else:
-                        msg = f'Description should contain pattern: "{regex}"'
-                    checkResults.append(CheckResult(msg))
-
-        return checkResults
+                        msg = f'Description should contain pattern: "{text_pattern.regex}"'
+                    yield CheckResult(msg, rule=pk.DESCRIPTION)
 
     def check_test_case_flag(self, package, tc_flag):
         """
@@ -167,18 +224,14 @@ class CheckPackageGeneralInformation(AbstractPackageCheck):
 
         Returns
         -------
-        check results
+        iterator of check results
 
         """
-        checkResults = []
-
         if tc_flag is True and not package.HasTestCaseFlag():
-            checkResults.append(CheckResult('"Test case" flag must be set!'))
+            yield CheckResult('"Test case" flag must be set!', rule=pk.TESTCASEFLAG)
 
         elif tc_flag is False and package.HasTestCaseFlag():
-            checkResults.append(CheckResult('"Test case" flag must not be set!'))
-
-        return checkResults
+            yield CheckResult('"Test case" flag must not be set!', rule=pk.TESTCASEFLAG)
 
     def check_version(self, package, version):
         """
@@ -188,46 +241,40 @@ class CheckPackageGeneralInformation(AbstractPackageCheck):
         ----------
         package: Package object
             the package
-        version: any
-            entry from the configuration
+        version: bool or TextPattern
+            the parsed Version entry of the configuration
 
         Returns
         -------
-        check results
+        iterator of check results
 
         """
-        checkResults = []
-
         # Check if version must be set at all
         if isinstance(version, bool):
             if not package.GetVersion() and version:
-                checkResults.append(CheckResult('Version must be set!'))
+                yield CheckResult('Version must be set!', rule=pk.VERSION)
             elif version is False:
                 WPrint('Version check is disabled!')
-            return checkResults
+            return
 
         # check whether version is set when it should be
         if not package.GetVersion():
-            checkResults.append(CheckResult('Version must be set!'))
-            return checkResults
-
-        # Check if given regex pattern is valid, given that the version is set
-        regex = version.get(pk.REGEX_PATTERN)
-        try:
-            re.compile(regex)
-        except re.error:
-            checkResults.append(CheckResult(f'"{regex}" is not a valid pattern. '
-                                            f'Check "{self.config.config_rel_path}"!'))
-            return checkResults
+            yield CheckResult('Version must be set!', rule=pk.VERSION)
+            return
+
+        # Check if given regex pattern is valid, given that the version is set; invalid patterns
+        # are reported once as config error
+        pattern = version.pattern
+        if pattern is None:
+            return
 
         # Check if pattern matches the provided value
-        if not re.search(regex, package.GetVersion()):
+        if not pattern.search(package.GetVersion()):
             # check if message for pattern should be more specific
-            if pk.CUSTOM_MESSAGE in version:
+            if version.has_custom_message:
                 msg = f'Version "{package.GetVersion()}" does not match pattern. ' \
-                      f'{version.get(pk.CUSTOM_MESSAGE)}'
+                      f'{version.custom_message}'
             else:
-                msg = f'Version "{package.GetVersion()}" does not match pattern: "{regex}"'
-            checkResults.append(CheckResult(msg))
-
-        return checkResults
+                msg = f'Version "{package.GetVersion()}" does not match pattern: ' \
+                      f'"{version.regex}"'
+            yield CheckResult(msg, rule=pk.VERSION)
@@ -3,20 +3,15 @@
 # SPDX-License-Identifier: MIT
 
 # -*- coding: utf-8 -*-
-from typing import List
+from dataclasses import dataclass
+from typing import Iterator, List
 
 from .api.AbstractPackageCheck import AbstractPackageCheck
 from .api.CheckResult import CheckResult
 from .helper.CheckType import CheckType
 from .helper.ConfigKeys import ParameterKeys as pk
-
-try:
-    from tts.core.logging import SPrint, WPrint, EPrint
-    from tts.core.api.internalApi.Api import Api
-
-    api = Api()
-except:
-    from logging import info as SPrint, warning as WPrint, error as EPrint
+from .helper.PackageVisitor import PackageVisitor
+from .helper.ecu_test_api import SPrint, WPrint, EPrint
 
 # module type: mandatory
 MODULE_TYPE = CheckType.PACKAGE.value
@@ -25,6 +20,36 @@ MODULE_TYPE = CheckType.PACKAGE.value
 # keys declared in "parameters" in config.yaml:
 # ParameterKeys.DENYLIST
 
+@dataclass(frozen=True)
+class MappingDenylist:
+    """
+    Parsed parameters of CheckPackageLocalMapping.
+    """
+
+    deny_list: frozenset
+
+
+class MappingVisitor(PackageVisitor):
+    """
+    Checks the local mapping items during the fused traversal of a package.
+    """
+
+    def __init__(self, check, parameters: MappingDenylist):
+        """
+        Constructor
+        """
+        self.check = check
+        self.deny_list = parameters.deny_list
+        self.check_results = []
+
+    def on_mapping_item(self, mapping_item):
+        self.check_results.extend(
+            self.check.check_mapping_item_mapping_type(mapping_item, self.deny_list))
+
+    def results(self) -> Iterator[CheckResult]:
+        return iter(self.check_results)
+
+
 class CheckPackageLocalMapping(AbstractPackageCheck):
     """
     Check Local Package Mapping
@@ -47,12 +72,16 @@ class CheckPackageLocalMapping(AbstractPackageCheck):
 
     - "mapping item with name '<mapping name>' is of type '<mapping type>' which is forbidden!"
 
+    A missing Denylist is reported once as configuration error.
+
 
     Limitations
     -----------
 
     """
 
+    INDEXED = True
+
     def __init__(self, internalApi):  # pylint: disable=W0613
         """
         Constructor
@@ -66,11 +95,21 @@ class CheckPackageLocalMapping(AbstractPackageCheck):
         return type(self).__name__
 
     def check(self, test_item, parameters) -> List[CheckResult]:
-        checkResults = []
-        checkResults.extend(self.check_package_mapping_types(test_item, parameters))
-        return checkResults
+        return list(self.iter_check(test_item, parameters))
+
+    def parse_parameters(self, parameters) -> MappingDenylist:
+        deny_list = parameters.get(pk.DENYLIST)
+        if not deny_list:
+            raise ValueError(f'Parameter {pk.DENYLIST!r} not configured')
+        return MappingDenylist(deny_list=frozenset(deny_list))
+
+    def iter_check(self, test_item, parameters) -> Iterator[CheckResult]:
+        yield from self.check_package_mapping_types(test_item, parameters)
 
-    def check_package_mapping_types(self, package, parameters) -> List[CheckResult]:
+    def visitor(self, test_item, parameters) -> MappingVisitor:
+        return MappingVisitor(self, parameters)
+
+    def check_package_mapping_types(self, package, parameters) -> Iterator[CheckResult]:
         """
         Check a package for forbidden mapping types in local mapping
 
@@ -78,32 +117,23 @@ class CheckPackageLocalMapping(AbstractPackageCheck):
         ----------
         package: Package object
             the package
-        parameters: Dict
-            the custom check parameters
+        parameters: MappingDenylist or Dict
+            the parsed or the configured custom check parameters
 
         Returns
         -------
-        check results
+        iterator of check results
         """
-        checkResults = []
-
-        deny_list = parameters.get(pk.DENYLIST)
-
-        if not deny_list:
-            return [CheckResult(
-                f'Parameter {pk.DENYLIST!r} not configured for the check {self.GetName()!r} '
-                f'in the config. Please check {self.config.config_rel_path!r}!')]
+        if not isinstance(parameters, MappingDenylist):
+            parameters = self.parse_parameters(parameters)
+        deny_list = parameters.deny_list
 
         local_mapping = package.GetMapping()
 
         for mapping_item in local_mapping.GetItems():
-            checkResults.extend(
-                self.check_mapping_item_mapping_type(mapping_item, deny_list)
-            )
-
-        return checkResults
+            yield from self.check_mapping_item_mapping_type(mapping_item, deny_list)
 
-    def check_mapping_item_mapping_type(self, mapping_item, deny_list) -> List[CheckResult]:
+    def check_mapping_item_mapping_type(self, mapping_item, deny_list) -> Iterator[CheckResult]:
         """
         Check a single mapping item for forbidden types
 
@@ -111,19 +141,16 @@ class CheckPackageLocalMapping(AbstractPackageCheck):
         ----------
         mapping_item: Mapping item object
             the mapping item
-        deny_list: List
-            list of forbidden mapping types
+        deny_list: frozenset or List
+            forbidden mapping types
 
         Returns
         -------
-        check results
+        iterator of check results
         """
-        checkResults = []
         mapping_type = mapping_item.GetAccessType()
 
         if mapping_type in deny_list:
-            checkResults.append(CheckResult(
-                f'Mapping item with name {mapping_item.GetReferenceName()!r} '
-                f'is of type {mapping_type!r} which is forbidden!'))
-
-        return checkResults
+            yield CheckResult(
+                'Mapping item with name {!r} is of type {!r} which is forbidden!',
+                mapping_item.GetReferenceName(), mapping_type, rule=pk.DENYLIST)
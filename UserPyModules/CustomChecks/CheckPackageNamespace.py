@@ -3,20 +3,14 @@
 # SPDX-License-Identifier: MIT
 
 # -*- coding: utf-8 -*-
-import re
-from typing import List
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional
 
 from .api.CheckResult import CheckResult
 from .api.AbstractPackageCheck import AbstractPackageCheck
 from .helper.CheckType import CheckType
 from .helper.ConfigKeys import ParameterKeys as pk
-
-try:
-    from tts.core.logging import SPrint, WPrint, EPrint
-    from tts.core.api.internalApi.Api import Api
-    api = Api()
-except:
-    from logging import info as SPrint, warning as WPrint, error as EPrint
+from .helper.ecu_test_api import SPrint, WPrint, EPrint
 
 # module type: mandatory
 MODULE_TYPE = CheckType.PACKAGE.value
@@ -26,6 +20,20 @@ MODULE_TYPE = CheckType.PACKAGE.value
 # ParameterKeys.CUSTOM_MESSAGE
 
 
+@dataclass(frozen=True)
+class NamePattern:
+    """
+    Parsed parameters of CheckPackageNamespace.
+    """
+
+    regex: Optional[str]
+    # compiled pattern, None if it is missing or invalid (reported once as config error)
+    pattern: Any
+    custom_message: Optional[str] = None
+    # whether a CustomMessage is configured, also if it is empty
+    has_custom_message: bool = False
+
+
 class CheckPackageNamespace(AbstractPackageCheck):
     """
     Check Package Namespace
@@ -46,10 +54,11 @@ class CheckPackageNamespace(AbstractPackageCheck):
     Return messages:
     ---------------------
      - "Please save the package <package_name>. Could not find folder location!"
-     - "<RegexPattern> is not a valid pattern!"
      - "<PackageName> does not follow name pattern. <CustomMessage>"
      - "<PackageName> does not follow name pattern: <Regex>"
 
+    A missing RegexPattern is reported once as configuration error.
+
 
     Limitations
     -----------
@@ -58,6 +67,8 @@ class CheckPackageNamespace(AbstractPackageCheck):
 
     """
 
+    INDEXED = True
+
     def __init__(self, internalApi):  # pylint: disable=W0613
         """
         Constructor to load the check parameters from config.yaml
@@ -71,38 +82,36 @@ class CheckPackageNamespace(AbstractPackageCheck):
         return type(self).__name__
 
     def check(self, test_item, parameters) -> List:
+        return list(self.iter_check(test_item, parameters))
+
+    def parse_parameters(self, parameters) -> NamePattern:
+        # missing and invalid patterns are reported once as config error, the check for unsaved
+        # packages is still performed
+        regex = parameters.get(pk.REGEX_PATTERN)
+        return NamePattern(regex=regex,
+                           pattern=self.config.get_regex(regex) if regex is not None else None,
+                           custom_message=parameters.get(pk.CUSTOM_MESSAGE),
+                           has_custom_message=pk.CUSTOM_MESSAGE in parameters)
+
+    def iter_check(self, test_item, parameters) -> Iterator:
         """
         Checks if package name matches regex pattern
         """
-        # init clean check result list
-        checkResults = []
+        if not isinstance(parameters, NamePattern):
+            parameters = self.parse_parameters(parameters)
 
         package_name = test_item.GetName()
         # Determine package type based on file location
         if test_item.GetFilename() is None:
-            checkResults.append(
-                CheckResult(f'Please save the package "{package_name}". Could not find folder '
-                            f'location!'))
-        else:
-            try:
-                regex = parameters[pk.REGEX_PATTERN]
-                re.compile(regex)
-            except KeyError:
-                checkResults.append(CheckResult(f'No pattern configuration provided. '
-                                                f'Please check "{self.config.config_rel_path}"!'))
-            except re.error:
-                checkResults.append(CheckResult(
-                    f'"{parameters[pk.REGEX_PATTERN]}" is not a valid pattern. Check '
-                    f'"{self.config.config_rel_path}"!'))
-            else:
-                # if re.compile is successful the package name check will be performed
-                if not re.match(regex, package_name):
-                    # check if message for pattern should be more specific
-                    if pk.CUSTOM_MESSAGE in parameters:
-                        msg = f'{package_name} does not follow name pattern. ' \
-                              f'{parameters.get(pk.CUSTOM_MESSAGE)}'
-                    else:
-                        msg = f'{package_name} does not follow name pattern: "{regex}"'
-                    checkResults.append(CheckResult(msg))
-
-        return checkResults
+            yield CheckResult(f'Please save the package "{package_name}". Could not find folder '
+                              f'location!')
+        elif parameters.pattern is not None:
+            # if the pattern is valid the package name check will be performed
+            if not parameters.pattern.match(package_name):
+                # check if message for pattern should be more specific
+                if parameters.has_custom_message:
+                    msg = f'{package_name} does not follow name pattern. ' \
+                          f'{parameters.custom_message}'
+                else:
+                    msg = f'{package_name} does not follow name pattern: "{parameters.regex}"'
+                yield CheckResult(msg, rule=pk.REGEX_PATTERN)
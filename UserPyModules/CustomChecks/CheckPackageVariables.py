@@ -3,20 +3,16 @@
 # SPDX-License-Identifier: MIT
 
 # -*- coding: utf-8 -*-
-import re
-from typing import List
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
 
 from .api.CheckResult import CheckResult
 from .api.AbstractPackageCheck import AbstractPackageCheck
 from .helper.CheckType import CheckType
 from .helper.ConfigKeys import ParameterKeys as pk
-
-try:
-    from tts.core.logging import SPrint, WPrint, EPrint
-    from tts.core.api.internalApi.Api import Api
-    api = Api()
-except:
-    from logging import info as SPrint, warning as WPrint, error as EPrint
+from .helper.ItemSnapshot import VariableSnapshot, get_variable_kind
+from .helper.PackageVisitor import PackageVisitor
+from .helper.ecu_test_api import SPrint, WPrint, EPrint
 
 # module type: mandatory
 MODULE_TYPE = CheckType.PACKAGE.value
@@ -35,6 +31,70 @@ MODULE_TYPE = CheckType.PACKAGE.value
 # ParameterKeys.CUSTOM_MESSAGE
 # ParameterKeys.ALLOW_UNDEFINED
 
+VARIABLE_KINDS = (pk.PARAMETER, pk.RETURNVALUE, pk.LOCALVAR, pk.FUNCTION)
+
+
+@dataclass(frozen=True)
+class VariablePattern:
+    """
+    Parsed Name or Description entry of a variable kind.
+    """
+
+    regex: Optional[str]
+    # compiled pattern, None if it is missing or invalid (reported once as config error)
+    pattern: Any
+    custom_message: Optional[str] = None
+    # whether a CustomMessage is configured, also if it is empty
+    has_custom_message: bool = False
+
+
+@dataclass(frozen=True)
+class VariableKind:
+    """
+    Parsed parameters of one variable kind.
+    """
+
+    # None if the entry is not configured
+    name: Optional[VariablePattern] = None
+    description: Optional[VariablePattern] = None
+
+
+@dataclass(frozen=True)
+class VariableRules:
+    """
+    Parsed parameters of CheckPackageVariables.
+    """
+
+    # variable kind -> parsed parameters, for the configured kinds
+    kinds: Dict[str, VariableKind]
+    allow_undefined: Any
+    sort_method: str
+    # None if the full variable names are compared
+    relevant_chars: Optional[int]
+
+
+class VariablesVisitor(PackageVisitor):
+    """
+    Collects the variables during the fused traversal of a package, so they are read from the
+    object API once for all checks of the variables.
+    """
+
+    def __init__(self, check, package, parameters):
+        """
+        Constructor
+        """
+        self.check = check
+        self.package = package
+        self.parameters = parameters
+        self.variables = []
+
+    def on_variable(self, variable):
+        self.variables.append(variable)
+
+    def results(self) -> Iterator:
+        yield from self.check.check_variable(self.package, self.parameters, self.variables)
+        yield from self.check.check_variable_order(self.package, self.parameters, self.variables)
+
 
 class CheckPackageVariables(AbstractPackageCheck):
     """
@@ -61,6 +121,8 @@ class CheckPackageVariables(AbstractPackageCheck):
         - Required parameters
         - Validation of the parameters (Type check, Regex Pattern compile)
 
+    Missing Order parameters are reported once as configuration error.
+
     Limitations
     -----------
 
@@ -79,10 +141,53 @@ class CheckPackageVariables(AbstractPackageCheck):
         return type(self).__name__
 
     def check(self, test_item, parameters) -> List:
-        checkResults = []
-        checkResults.extend(self.check_variable(test_item, parameters))
-        checkResults.extend(self.check_variable_order(test_item, parameters))
-        return checkResults
+        return list(self.iter_check(test_item, parameters))
+
+    def parse_parameters(self, parameters) -> VariableRules:
+        kinds = {}
+        for kind in VARIABLE_KINDS:
+            if kind in parameters:
+                entry = parameters[kind]
+                kinds[kind] = VariableKind(
+                    name=self.parse_pattern(entry[pk.NAME]) if pk.NAME in entry else None,
+                    description=self.parse_pattern(entry[pk.DESCRIPTION])
+                    if pk.DESCRIPTION in entry else None)
+
+        relevant_chars = parameters[pk.ORDER][pk.NUMBER_OF_RELEVANT_CHARACTERS]
+        return VariableRules(kinds=kinds,
+                             allow_undefined=parameters.get(pk.ALLOW_UNDEFINED, False),
+                             sort_method=parameters[pk.ORDER][pk.SORT_METHOD],
+                             relevant_chars=relevant_chars
+                             if relevant_chars and relevant_chars != 'None' else None)
+
+    def parse_pattern(self, entry) -> VariablePattern:
+        """
+        Parses the Name or Description entry of a variable kind.
+
+        Parameters
+        ----------
+        entry: dict
+            the entry with RegexPattern and CustomMessage
+
+        Returns
+        -------
+        VariablePattern
+        """
+        regex = entry.get(pk.REGEX_PATTERN)
+        return VariablePattern(regex=regex, pattern=self.config.get_regex(regex),
+                               custom_message=entry.get(pk.CUSTOM_MESSAGE),
+                               has_custom_message=pk.CUSTOM_MESSAGE in entry)
+
+    def iter_check(self, test_item, parameters) -> Iterator:
+        if not isinstance(parameters, VariableRules):
+            parameters = self.parse_parameters(parameters)
+        yield from self.check_variable(test_item, parameters)
+        yield from self.check_variable_order(test_item, parameters)
+
+    def visitor(self, test_item, parameters) -> VariablesVisitor:
+        if not isinstance(parameters, VariableRules):
+            parameters = self.parse_parameters(parameters)
+        return VariablesVisitor(self, test_item, parameters)
 
     def get_var_type(self, variable):
         """
@@ -98,29 +203,10 @@ class CheckPackageVariables(AbstractPackageCheck):
 
         """
 
-        variable_is_parameter = variable.IsParameter()
-        variable_is_return = variable.IsReturn()
-        #variable_name = variable.GetName() # keep for possible future use
-        variable_type = variable.GetType()
-
-        if variable_type != pk.FUNCTION:
-            if variable_is_parameter and not variable_is_return:
-                return pk.PARAMETER
-            if variable_is_return and not variable_is_parameter:
-                return pk.RETURNVALUE
-            if not (variable_is_parameter or variable_is_return):
-                return pk.LOCALVAR
-            return None
+        if isinstance(variable, VariableSnapshot):
+            return variable.kind
 
-
-        if not (variable_is_parameter or variable_is_return):
-            return pk.FUNCTION
-
-        return None
-
-        # This code is unreachable by the current logic, but should be kept.
-        #EPrint(f'Variable type is not supported: {variablename} - {variable_type} - \
-        #         P_{variable_is_parameter} - R_{variable_is_return}')
+        return get_variable_kind(variable.GetType(), variable.IsParameter(), variable.IsReturn())
 
     def check_unused_variable(self, package):
         """
@@ -132,13 +218,10 @@ class CheckPackageVariables(AbstractPackageCheck):
 
         Returns
         -------
-        check results
+        iterator of check results
 
         """
 
-        # init clean check result list
-        checkResults = []
-
         unused_varibles_list = []
         unused_varibles = []
 
@@ -151,210 +234,190 @@ class CheckPackageVariables(AbstractPackageCheck):
         if unused_varibles:
             for variable in unused_varibles:
                 unused_varibles_list.append(variable.GetName())
-            checkResults.append(CheckResult(f'Unused variables detected: {unused_varibles_list}'))
+            yield CheckResult(f'Unused variables detected: {unused_varibles_list}')
 
-        return checkResults
-
-    def check_variable(self, package, parameters):
+    def check_variable(self, package, parameters, variables=None):
         """
         Checks name and description of a given variable.
 
         Parameters
         ----------
         variable: the package to be checked
-        parameters: contains the expected values (name and description) of the checked parameters
+        parameters: VariableRules or dict, the parsed or the configured custom check parameters
+        variables: the variables of the package, read from the package if not given
 
         Returns
         -------
-        check results
+        iterator of check results
 
         """
 
-        # init clean check result list
-        checkResults = []
+        if not isinstance(parameters, VariableRules):
+            parameters = self.parse_parameters(parameters)
 
-        checkResults.extend(self.check_unused_variable(package))
+        yield from self.check_unused_variable(package)
 
-        if pk.ALLOW_UNDEFINED in parameters:
-            allow_undefined_variable = parameters[pk.ALLOW_UNDEFINED]
-        else:
-            allow_undefined_variable = False
+        allow_undefined_variable = parameters.allow_undefined
 
-        for variable in package.GetVariables():
+        if variables is None:
+            variables = package.GetVariables()
+
+        for variable in variables:
             if not allow_undefined_variable:
-                checkResults.extend(self.check_undefined_type(variable))
+                yield from self.check_undefined_type(variable)
             var_type = self.get_var_type(variable)
             if var_type is None:
-                checkResults.extend(self.check_variable_type(variable))
+                yield from self.check_variable_type(variable)
             else:
-                if pk.NAME in parameters[var_type]:
-                    checkResults.extend(self.check_variable_name(variable, parameters))
-                if pk.DESCRIPTION in parameters[var_type]:
-                    checkResults.extend(self.check_variable_description(variable, parameters))
-
-        return checkResults
+                kind = parameters.kinds[var_type]
+                if kind.name is not None:
+                    yield from self.check_variable_name(variable, parameters, var_type)
+                if kind.description is not None:
+                    yield from self.check_variable_description(variable, parameters, var_type)
 
-    def check_variable_order(self, package, parameters):
+    def check_variable_order(self, package, parameters, variables=None):
         """
-        Checks the order of the variable list.
+        Checks the order of the variable list in a single pass and reports the first pair of
+        adjacent variables which is out of order.
 
         Parameters
         ----------
         variable: the package to be checked
-        parameters: contains the expected ordering
+        parameters: VariableRules or dict, the parsed or the configured custom check parameters
+        variables: the variables of the package, read from the package if not given
 
         Returns
         -------
-        check results
+        iterator of check results
 
         """
 
-        # init clean check result list
-        checkResults = []
+        if not isinstance(parameters, VariableRules):
+            parameters = self.parse_parameters(parameters)
 
-        # check the Description
-        sortMethod = parameters[pk.ORDER][pk.SORT_METHOD]
-        relevantChars = parameters[pk.ORDER][pk.NUMBER_OF_RELEVANT_CHARACTERS]
+        sortMethod = parameters.sort_method
+        relevantChars = parameters.relevant_chars
         checkResultSuffix = ''
 
-        # get list of package variable
-        variableNames = []
-        for variable in package.GetVariables():
-            variableNames.append(variable.GetName())
-
-        # truncate list of variable names after the number of relevant characters
-        if relevantChars and relevantChars != 'None':
-            variableNames = [v[:relevantChars] for v in variableNames]
-            checkResultSuffix = f', considering the first {relevantChars} characters'
-        sortedVariableNames = variableNames.copy()
-
-        # check config and sort list
+        # check config
         if sortMethod == 'None':
             SPrint('Sort check is disabled!')
+            return
+        if sortMethod not in ('ascending', 'descending'):
+            yield CheckResult(f'Sort method "{sortMethod}" is not supported!', rule=pk.ORDER)
+            return
 
-        elif sortMethod == 'ascending':
-            sortedVariableNames.sort(reverse=False, key=str.casefold)
-            # check order ascending
-            if sortedVariableNames != variableNames:
-                checkResults.append(CheckResult(f'Variables are not sorted in ascending '
-                                                f'order{checkResultSuffix}!'))
-
-        elif sortMethod == 'descending':
-            sortedVariableNames.sort(reverse=True, key=str.casefold)
-            # check order descending
-            if sortedVariableNames != variableNames:
-                checkResults.append(CheckResult(f'Variables are not sorted in descending '
-                                                f'order{checkResultSuffix}!'))
-
-        else:
-            checkResults.append(CheckResult(f'Sort method "{sortMethod}" is not supported!'))
-
-        return checkResults
+        # compare the variable names only up to the number of relevant characters
+        if relevantChars is not None:
+            checkResultSuffix = f', considering the first {relevantChars} characters'
 
-    def check_variable_name(self, variable, parameters):
+        if variables is None:
+            variables = package.GetVariables()
+
+        # a stable sort leaves the list unchanged if and only if no two adjacent names are out
+        # of order, so the first inversion is reported without sorting
+        descending = sortMethod == 'descending'
+        previousName = previousKey = None
+        for variable in variables:
+            name = variable.GetName()
+            key = name[:relevantChars].casefold()
+            if previousKey is not None and (key > previousKey if descending
+                                            else key < previousKey):
+                yield CheckResult(f'Variables are not sorted in {sortMethod} '
+                                  f'order{checkResultSuffix}! "{name}" should come before '
+                                  f'"{previousName}".', rule=pk.ORDER)
+                return
+            previousName, previousKey = name, key
+
+    def check_variable_name(self, variable, parameters, var_type=None):
         """
         Checks name of a given variable.
 
         Parameters
         ----------
         variable: the variable to be checked
-        parameters: contains the expected name
+        parameters: VariableRules or dict, the parsed or the configured custom check parameters
+        var_type: the type of the variable, determined from the variable if not given
 
         Returns
         -------
-        check results
+        iterator of check results
 
         """
 
-        # init clean check result list
-        checkResults = []
-
-        var_type = self.get_var_type(variable)
-        param_var_name = parameters[var_type][pk.NAME]
+        if not isinstance(parameters, VariableRules):
+            parameters = self.parse_parameters(parameters)
+        if var_type is None:
+            var_type = self.get_var_type(variable)
+        param_var_name = parameters.kinds[var_type].name
 
         variablename = variable.GetName()
 
-        # check variable name
-        regex = param_var_name.get(pk.REGEX_PATTERN)
-        try:
-            re.compile(regex)
-        except re.error:
-            checkResults.append(CheckResult(f'"{regex}" is not a '
-                                            f'valid pattern. Check '
-                                            f'"{self.config.config_rel_path}"!'))
-            return checkResults
+        # check variable name, invalid patterns are reported once as config error
+        pattern = param_var_name.pattern
+        if pattern is None:
+            return
 
         try:
-            param_var_name = parameters[var_type][pk.NAME]
-            if not re.match(param_var_name.get(pk.REGEX_PATTERN), variablename):
-                if pk.CUSTOM_MESSAGE in param_var_name:
+            if not pattern.match(variablename):
+                if param_var_name.has_custom_message:
                     msg = f'Variable "{variablename}" does not match pattern. ' \
-                        f'{param_var_name.get(pk.CUSTOM_MESSAGE)}'
+                        f'{param_var_name.custom_message}'
                 else:
                     msg = f'Variable "{variablename}" does not match pattern: ' \
-                        f'"{param_var_name.get(pk.REGEX_PATTERN)}"'
-                checkResults.append(CheckResult(msg))
+                        f'"{param_var_name.regex}"'
+                yield CheckResult(msg, rule=pk.NAME)
 
         except TypeError:
             WPrint(f'Expected string or byte-like object: {variablename}')
 
-        finally:
-            return checkResults  # pylint: disable=W0150
-
-    def check_variable_description(self, variable, parameters):  # pylint: disable=R1710
+    def check_variable_description(self, variable, parameters, var_type=None):
         """
         Checks the description of the variables.
 
         Parameters
         ----------
         variable: the variable to be checked
-        parameters: contains the expected description
+        parameters: VariableRules or dict, the parsed or the configured custom check parameters
+        var_type: the type of the variable, determined from the variable if not given
 
         Returns
         -------
-        check results
+        iterator of check results
 
         """
-        checkResults = []
 
-        var_type = self.get_var_type(variable)
-        param_desc = parameters[var_type][pk.DESCRIPTION]
+        if not isinstance(parameters, VariableRules):
+            parameters = self.parse_parameters(parameters)
+        if var_type is None:
+            var_type = self.get_var_type(variable)
+        param_desc = parameters.kinds[var_type].description
 
         variablename = variable.GetName()
 
-        # check variable description
-        regex = param_desc.get(pk.REGEX_PATTERN)
-        try:
-            re.compile(regex)
-        except re.error:
-            checkResults.append(CheckResult(f'"{regex}" '
-                                            f'is not a valid pattern. Check '
-                                            f'"{self.config.config_rel_path}"!'))
-            return checkResults
-
-        if not pk.DESCRIPTION in parameters[var_type]:
-            return checkResults
+        # check variable description, invalid patterns are reported once as config error
+        pattern = param_desc.pattern
+        if pattern is None:
+            return
 
         # check if a variable has a description
-        if param_desc.get(pk.REGEX_PATTERN):
+        if param_desc.regex:
             if variable.GetDescription() is None or len(variable.GetDescription()) == 0:
-                checkResults.append(CheckResult(f'Description for {var_type} "{variablename}" '
-                                                f'should not be empty'))
-                return checkResults
+                yield CheckResult(f'Description for {var_type} "{variablename}" '
+                                  f'should not be empty', rule=pk.DESCRIPTION)
+                return
 
             # check if description follows declared pattern
-            if not re.match(param_desc.get(pk.REGEX_PATTERN), variable.GetDescription()):
-                if pk.CUSTOM_MESSAGE in param_desc:
+            if not pattern.match(variable.GetDescription()):
+                if param_desc.has_custom_message:
                     msg = f'Description for {var_type} "{variablename}": ' \
                           f'[{variable.GetDescription()}] does not match pattern. ' \
-                          f'{param_desc.get(pk.CUSTOM_MESSAGE)}'
+                          f'{param_desc.custom_message}'
                 else:
                     msg = f'Description for {var_type} "{variablename}": ' \
                                   f'[{variable.GetDescription()}] does not match pattern: ' \
-                                  f'"{param_desc.get(pk.REGEX_PATTERN)}"'
-                checkResults.append(CheckResult(msg))
-
-            return checkResults
+                                  f'"{param_desc.regex}"'
+                yield CheckResult(msg, rule=pk.DESCRIPTION)
 
     def check_variable_type(self, variable):
         """
@@ -366,23 +429,18 @@ class CheckPackageVariables(AbstractPackageCheck):
 
         Returns
         -------
-        check results
+        iterator of check results
 
         """
 
-        # init clean check result list
-        checkResults = []
-
         variablename = variable.GetName()
 
         if variable.GetType() == pk.FUNCTION:
-            checkResults.append(CheckResult(
-                f'Function "{variablename}" is not allowed to be "Parameter" or "ReturnValue"'))
+            yield CheckResult(
+                f'Function "{variablename}" is not allowed to be "Parameter" or "ReturnValue"')
         else:
-            checkResults.append(CheckResult(
-                f'Variable "{variablename}" may be only of type "Parameter" OR "ReturnValue"'))
-
-        return checkResults
+            yield CheckResult(
+                f'Variable "{variablename}" may be only of type "Parameter" OR "ReturnValue"')
 
     def check_undefined_type(self, variable):
         """
@@ -394,17 +452,13 @@ class CheckPackageVariables(AbstractPackageCheck):
 
         Returns
         -------
-        check results
+        iterator of check results
 
         """
 
-        # init clean check result list
-        checkResults = []
-
         variablename = variable.GetName()
 
         if variable.GetType() == pk.UNDEFINED:
-            checkResults.append(CheckResult(
-                f'Variable type for "{variablename}" should not be "{pk.UNDEFINED}"'))      
-
-        return checkResults
+            yield CheckResult(
+                f'Variable type for "{variablename}" should not be "{pk.UNDEFINED}"',
+                rule=pk.ALLOW_UNDEFINED)
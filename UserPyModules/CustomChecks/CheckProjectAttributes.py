@@ -3,18 +3,12 @@
 # SPDX-License-Identifier: MIT
 
 # -*- coding: utf-8 -*-
-from typing import List
+from typing import Iterator, List
 
 from .api.AbstractProjectCheck import AbstractProjectCheck
 from .helper.CheckType import CheckType
-from .helper.CheckAttributes import check_attributes
-
-try:
-    from tts.core.logging import SPrint, WPrint, EPrint
-    from tts.core.api.internalApi.Api import Api
-    api = Api()
-except:
-    from logging import info as SPrint, warning as WPrint, error as EPrint
+from .helper.CheckAttributes import AttributeRules, iter_check_attributes, parse_attribute_rules
+from .helper.ecu_test_api import SPrint, WPrint, EPrint
 
 
 # keys declared in "parameters" in config.yaml:
@@ -61,7 +55,6 @@ class CheckProjectAttributes(AbstractProjectCheck):
     - "<attribute name> must not be set
     - "<attribute name> no valid option out of: <attributes options>"
     - "No field: 'Regex Pattern' was provided!"
-    - "<Provided pattern> is not a valid pattern!"
     - "<Provided pattern> does not match description: 'Regex Description' "
     - "<Provided pattern> does not match pattern: 'Regex Pattern'"
 
@@ -80,4 +73,10 @@ class CheckProjectAttributes(AbstractProjectCheck):
         return type(self).__name__
 
     def check(self, test_item, parameters) -> List:
-        return check_attributes(test_item, MODULE_TYPE, self.config, parameters)
+        return list(self.iter_check(test_item, parameters))
+
+    def parse_parameters(self, parameters) -> AttributeRules:
+        return parse_attribute_rules(parameters, self.config)
+
+    def iter_check(self, test_item, parameters) -> Iterator:
+        return iter_check_attributes(test_item, MODULE_TYPE, self.config, parameters)
@@ -1,3 +1,5 @@
 # Copyright (C) 2023 tracetronic GmbH
 #
 # SPDX-License-Identifier: MIT
+
+__version__ = '1.0'
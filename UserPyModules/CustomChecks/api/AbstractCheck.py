@@ -2,11 +2,16 @@
 #
 # SPDX-License-Identifier: MIT
 
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from contextlib import nullcontext
+from typing import Iterator, List
 
-from ..helper.RunHelper import package_type, get_check_activity
+from ..helper.RunHelper import package_type, get_active_checks
 from ..helper.Configuration import Configuration
+from ..helper.ItemSnapshot import ItemSnapshot
+from ..helper.PackageVisitor import CheckVisit
+from ..helper import ApiRecorder, Profiling
 
 
 class AbstractCheck(ABC):
@@ -15,11 +20,20 @@ class AbstractCheck(ABC):
     actual checks.
     """
 
+    # whether the check only reads the values kept in the workspace index (name, file name,
+    # test case flag, version, description, attributes and local mapping), so the batch runner
+    # can run it without opening unchanged packages, see batch.WorkspaceIndex
+    INDEXED = False
+
     def __init__(self):
         """
         Constructor.
         """
         self.config = Configuration()
+        self._active_checks = ()
+        self._active_checks_version = None
+        self._profiler = None
+        self._recorder = None
 
     @abstractmethod
     def GetName(self) -> str:
@@ -54,37 +68,194 @@ class AbstractCheck(ABC):
         """
         raise NotImplementedError
 
-    def Run(self, test_item):
+    def iter_check(self, test_item, parameters) -> Iterator:
         """
-        Executes the checks. Uses the template method 'check', which must be implemented in the
-        check modules. Belongs to the CustomChecks interface for ecu.test.
+        Yields the results of the custom check one by one. Uses 'check' by default, checks
+        overwrite it to produce their results without building intermediate lists.
 
         Parameters
         ----------
         test_item: item from Object API
             generic test item; Package, Project or AnalysisPackage
+        parameters: any
+            the Parameters entry from config.yaml
 
         Returns
         -------
-            list of CheckResult (empty if no violation was found)
+        iterator of CheckResult
 
         """
-        check_results = []
+        return iter(self.check(test_item, parameters))
+
+    def visitor(self, test_item, parameters):
+        """
+        Returns a PackageVisitor which produces the results of 'check' during a single,
+        fused traversal of the package shared by all checks. Returns None by default, the
+        check is then run on its own by 'check'.
+
+        Parameters
+        ----------
+        test_item: ItemSnapshot
+            the visited test item
+        parameters: any
+            the Parameters entry from config.yaml, see 'parse_parameters'
+
+        Returns
+        -------
+        PackageVisitor or None
+
+        """
+        return None
+
+    def parse_parameters(self, parameters):
+        """
+        Converts the Parameters entry of a check into the model consumed by 'check'. It is called
+        once per configuration version and check, not for every test item. Returns the
+        parameters unchanged by default.
+
+        Parameters
+        ----------
+        parameters: any
+            the Parameters entry from config.yaml
+
+        Returns
+        -------
+        the parameters handed to 'check'
+
+        Raises
+        ------
+        ValueError
+            if the parameters are invalid; the error is reported once as configuration error
+            and the check is not executed. TypeError, AttributeError and KeyError, e.g. for
+            parameters of the wrong structure, are reported the same way.
+
+        """
+        return parameters
 
+    def get_active_checks(self):
+        """
+        Returns the enabled checks of this CustomCheck with their precompiled conditions and
+        parsed parameters. They are computed once per configuration version.
+
+        Returns
+        -------
+            tuple of ActiveCheck (empty if the CustomCheck is disabled)
+
+        """
+        if self._active_checks_version != self.config.version:
+            self._active_checks = get_active_checks(self.config, self.GetName(),
+                                                    self.parse_parameters)
+            self._active_checks_version = self.config.version
+            self._profiler = Profiling.configure(self.config)
+            self._recorder = ApiRecorder.get_recorder()
+        return self._active_checks
+
+    def iter_results(self, test_item) -> Iterator:
+        """
+        Executes the checks and yields their results one by one. Uses the method 'iter_check',
+        which falls back to the template method 'check' of the check modules.
+
+        Parameters
+        ----------
+        test_item: item from Object API
+            generic test item; Package, Project or AnalysisPackage, or its ItemSnapshot
+
+        Returns
+        -------
+            iterator of CheckResult
+
+        """
         check_name = self.GetName()
 
-        is_active, active_checks = get_check_activity(self.config.get_all_checks(check_name))
+        # reload the shared configuration only if config.yaml changed meanwhile
+        self.config.refresh()
+        active_checks = self.get_active_checks()
+
+        if self._profiler is not None or self._recorder is not None:
+            yield from self._iter_instrumented_results(test_item, active_checks)
+            return
 
-        if not is_active:
-            return check_results
+        # object API values are read once and shared by the conditions and all checks of the
+        # current Run pass
+        test_item = ItemSnapshot.shared(test_item, self)
 
-        for check in active_checks:
+        for active_check in active_checks:
 
             # internal conditions check for the package type
-            if package_type(check_name, test_item, check):
+            if package_type(check_name, test_item, active_check.name, active_check.conditions):
 
                 # returns a list of the parameters configured in config file
-                parameters = self.config.get_check_parameters(check_name, check)
-                check_results.extend(self.check(test_item, parameters))
+                parameters = active_check.get_parameters()
+                for result in self.iter_check(test_item, parameters):
+                    yield result.bind(check_name, active_check.name, test_item.GetFilename())
+
+    def visit(self, test_item) -> CheckVisit:
+        """
+        Prepares the checks for a fused traversal of the package, see PackageVisitor.traverse:
+        evaluates the conditions and creates the visitors of the checks to be executed.
+
+        Parameters
+        ----------
+        test_item: ItemSnapshot
+            the test item
+
+        Returns
+        -------
+            CheckVisit, which yields the results after the traversal
+
+        """
+        check_name = self.GetName()
+        self.config.refresh()
+
+        parts = []
+        for active_check in self.get_active_checks():
+            if package_type(check_name, test_item, active_check.name, active_check.conditions):
+                parameters = active_check.get_parameters()
+                parts.append((active_check.name, self.visitor(test_item, parameters),
+                              parameters))
+        return CheckVisit(self, test_item, parts)
 
-        return check_results
+    def _iter_instrumented_results(self, test_item, active_checks) -> Iterator:
+        # same as iter_results, but records the durations of the check, its sub-checks and the
+        # object API calls; the results of the check are collected before they are handed out
+        profiler = self._profiler
+        recorder = self._recorder
+        check_name = self.GetName()
+        start = time.perf_counter()
+
+        if not isinstance(test_item, ItemSnapshot):
+            test_item = ItemSnapshot(Profiling.instrument(test_item))
+
+        check_results = []
+        with recorder.check(check_name) if recorder is not None else nullcontext():
+            for active_check in active_checks:
+                if not package_type(check_name, test_item, active_check.name,
+                                    active_check.conditions):
+                    continue
+                parameters = active_check.get_parameters()
+                with profiler.timer(Profiling.SUB_CHECK, f'{check_name}/{active_check.name}') \
+                        if profiler is not None else nullcontext():
+                    results = list(self.iter_check(test_item, parameters))
+                check_results.extend(result.bind(check_name, active_check.name,
+                                                 test_item.GetFilename()) for result in results)
+
+        if profiler is not None:
+            profiler.record(Profiling.CHECK, check_name, time.perf_counter() - start)
+        yield from check_results
+
+    def Run(self, test_item):
+        """
+        Executes the checks. Collects the results of 'iter_results' in a list.
+        Belongs to the CustomChecks interface for ecu.test.
+
+        Parameters
+        ----------
+        test_item: item from Object API
+            generic test item; Package, Project or AnalysisPackage, or its ItemSnapshot
+
+        Returns
+        -------
+            list of CheckResult (empty if no violation was found)
+
+        """
+        return list(self.iter_results(test_item))
@@ -2,13 +2,159 @@
 #
 # SPDX-License-Identifier: MIT
 
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
+from enum import Enum
+
+
+class Severity(Enum):
+    """
+    Severity of a check violation.
+    """
+
+    ERROR = 'error'
+    WARNING = 'warning'
+    INFO = 'info'
+
+
+# fields compared, hashed and pickled besides the message
+_FIELDS = ('check_name', 'sub_check', 'rule', 'item_path', 'line', 'severity')
+
+
+def _restore(message, *values):
+    # unpickles a CheckResult, the message is transferred formatted
+    return CheckResult(message, **dict(zip(_FIELDS, values)))
 
 
-@dataclass
 class CheckResult:
     """
     A check result for check violations.
+
+    The message is either given formatted, or as str.format template with its arguments, which
+    is only formatted when the message is read. Check name, sub check and item path are set by
+    the check run if the check does not set them.
+
+    Attributes
+    ----------
+    message : str
+        the violation message
+    check_name : str
+        name of the CustomCheck, e.g. 'CheckPackageVariables'
+    sub_check : str
+        name of the configured check in the config.yaml, e.g. 'CheckTestCases'
+    rule : str
+        the parameter key or value which was violated, e.g. 'Description'
+    item_path : str
+        file name of the checked test item
+    line : int
+        line number of the violating test step
+    severity : Severity
+        severity of the violation
     """
 
-    message: str
+    # '_message' holds the formatted message or the tuple (template, arguments)
+    __slots__ = ('_message',) + _FIELDS
+
+    def __init__(self, message, *args, check_name=None, sub_check=None, rule=None,
+                 item_path=None, line=None, severity=Severity.ERROR):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        message: str
+            the message, or a str.format template if arguments are given
+        args: any
+            arguments of the message template
+        check_name, sub_check, rule, item_path, line, severity:
+            see class attributes
+        """
+        setter = object.__setattr__
+        setter(self, '_message', (message, args) if args else message)
+        setter(self, 'check_name', check_name)
+        setter(self, 'sub_check', sub_check)
+        setter(self, 'rule', rule)
+        setter(self, 'item_path', item_path)
+        setter(self, 'line', line)
+        setter(self, 'severity', severity)
+
+    @property
+    def message(self) -> str:
+        """
+        The violation message, formatted on first access
+        """
+        message = self._message
+        if isinstance(message, tuple):
+            template, args = message
+            message = template.format(*args)
+            object.__setattr__(self, '_message', message)
+        return message
+
+    def _copy(self, **fields):
+        # copy constructor, the message is taken over without formatting it
+        result = object.__new__(type(self))
+        setter = object.__setattr__
+        setter(result, '_message', self._message)
+        for name in _FIELDS:
+            setter(result, name, fields.get(name, getattr(self, name)))
+        return result
+
+    def bind(self, check_name, sub_check, item_path) -> 'CheckResult':
+        """
+        Returns the result with check name, sub check and item path, unless the check set them
+        already. The result itself is not changed, it is returned as is if all are set. Used by
+        the check run before the result is handed out.
+        """
+        fields = {}
+        if self.check_name is None:
+            fields['check_name'] = check_name
+        if self.sub_check is None:
+            fields['sub_check'] = sub_check
+        if self.item_path is None:
+            fields['item_path'] = item_path
+        return self._copy(**fields) if fields else self
+
+    def to_dict(self) -> dict:
+        """
+        Returns the result as JSON serializable dict, fields which are not set are left out.
+        """
+        data = {'message': self.message}
+        for name in _FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value.value if isinstance(value, Severity) else value
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Creates a result from a dict returned by 'to_dict'.
+        """
+        fields = {name: data[name] for name in _FIELDS if name in data}
+        if 'severity' in fields:
+            fields['severity'] = Severity(fields['severity'])
+        return cls(data['message'], **fields)
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f'cannot assign to field {name!r}')
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f'cannot delete field {name!r}')
+
+    def _key(self):
+        return (self.message,) + tuple(getattr(self, name) for name in _FIELDS)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        fields = ''.join(f', {name}={getattr(self, name)!r}' for name in _FIELDS
+                         if getattr(self, name) is not None)
+        return f'{type(self).__name__}(message={self.message!r}{fields})'
+
+    def __reduce__(self):
+        return _restore, self._key()
@@ -0,0 +1,610 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Headless batch execution of all CustomChecks for a workspace or a list of test items.
+"""
+
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..api.AbstractAnalysisPackageCheck import AbstractAnalysisPackageCheck
+from ..api.AbstractPackageCheck import AbstractPackageCheck
+from ..api.AbstractProjectCheck import AbstractProjectCheck
+from ..api.CheckResult import CheckResult
+from ..helper.CheckType import CheckType
+from ..helper.Configuration import Configuration, set_config_file
+from ..helper.ItemSnapshot import ItemSnapshot
+from ..helper import ApiRecorder, Profiling
+from ..helper.PackageVisitor import traverse
+from ..helper.ecu_test_api import ObjApiProvider, SPrint, WPrint, EPrint, is_available
+
+# file extensions of the test items and their check types
+ITEM_TYPES = {
+    '.pkg': CheckType.PACKAGE.value,
+    '.prj': CheckType.PROJECT.value,
+    '.ta': CheckType.ANALYSIS.value,
+}
+
+# object API stand-in used with --offline
+OFFLINE_LOADER = f'{__package__}.OfflineLoader:create_loader'
+
+# base class of the checks for each check type
+CHECK_BASES = {
+    CheckType.PACKAGE.value: AbstractPackageCheck,
+    CheckType.PROJECT.value: AbstractProjectCheck,
+    CheckType.ANALYSIS.value: AbstractAnalysisPackageCheck,
+}
+
+# package containing the Check* modules
+CHECKS_PACKAGE = __name__.rsplit('.', 2)[0]
+
+
+def get_item_type(path) -> Optional[str]:
+    """
+    Determines the check type of a test item by its file extension.
+
+    Parameters
+    ----------
+    path: str
+        path of the test item
+
+    Returns
+    -------
+        value of CheckType, None if the file is no test item
+    """
+    return ITEM_TYPES.get(os.path.splitext(path)[1].lower())
+
+
+def discover_checks(package_name=CHECKS_PACKAGE) -> Dict[str, List[type]]:
+    """
+    Imports all Check* modules of the CustomChecks and sorts their check classes by the
+    MODULE_TYPE of the module.
+
+    Parameters
+    ----------
+    package_name: str
+        name of the package containing the Check* modules
+
+    Returns
+    -------
+        dict of check type (value of CheckType) and list of check classes
+    """
+    package = importlib.import_module(package_name)
+    checks = {check_type: [] for check_type in CHECK_BASES}
+
+    for module_info in sorted(pkgutil.iter_modules(package.__path__), key=lambda m: m.name):
+        if module_info.ispkg or not module_info.name.startswith('Check'):
+            continue
+
+        module = importlib.import_module(f'{package_name}.{module_info.name}')
+        check_type = getattr(module, 'MODULE_TYPE', None)
+        base = CHECK_BASES.get(check_type)
+        if base is None:
+            WPrint(f'Module "{module_info.name}" has no valid MODULE_TYPE and is skipped!')
+            continue
+
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if name.startswith('Check') and cls.__module__ == module.__name__ \
+                    and issubclass(cls, base):
+                checks[check_type].append(cls)
+
+    return checks
+
+
+def collect_items(paths) -> Iterator[str]:
+    """
+    Yields all test items (.pkg, .prj, .ta) of the given files and folders. Folders are searched
+    recursively in a stable order, hidden folders are skipped.
+
+    Parameters
+    ----------
+    paths: iterable of str
+        test item files and workspace folders
+
+    Returns
+    -------
+        iterator of test item paths
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+                for name in sorted(files):
+                    if get_item_type(name) is not None:
+                        yield os.path.join(root, name)
+        elif get_item_type(path) is not None:
+            yield path
+        else:
+            WPrint(f'"{path}" is no package, project or analysis package and is skipped!')
+
+
+class ObjectApiLoader(ObjApiProvider):
+    """
+    Opens the test items with the ecu.test Object API. Any object providing 'open_item' and
+    'close_item' can be used as stand-in, e.g. to run the checks without ecu.test.
+    """
+
+    def open_item(self, path, item_type):
+        """
+        Opens a test item.
+
+        Parameters
+        ----------
+        path: str
+            path of the test item
+        item_type: str
+            value of CheckType
+
+        Returns
+        -------
+            Package, Project or AnalysisPackage object
+        """
+        if item_type == CheckType.PROJECT.value:
+            return self.prj_api.OpenProject(path)
+        return self.pkg_api.OpenPackage(path)
+
+    def close_item(self, item):
+        """
+        Releases a test item opened by 'open_item'.
+        """
+
+
+@dataclass
+class ItemResult:
+    """
+    The results of one check for one test item.
+    """
+
+    path: str
+    check_name: Optional[str]
+    results: List[CheckResult] = field(default_factory=list)
+    error: Optional[str] = None
+    cached: bool = False
+
+
+class BatchRunner:
+    """
+    Runs all discovered CustomChecks on many test items, one check instance per check class.
+
+    Attributes
+    ----------
+    loader : object
+        opens the test items, see ObjectApiLoader
+    checks : dict
+        check type (value of CheckType) and list of check instances
+    cache : ResultCache
+        cache of the results of unchanged test items, None to run all checks
+    index : WorkspaceIndex
+        index of the package metadata, None to open every package
+    """
+
+    def __init__(self, loader=None, checks=None, cache=None, index=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        loader: object
+            object API stand-in, the ecu.test Object API is used if not given
+        checks: dict
+            check type and list of check classes, all Check* modules are used if not given
+        cache: ResultCache
+            cache of the results of unchanged test items
+        index: WorkspaceIndex
+            index of the package metadata; indexed checks run on the index for unchanged
+            packages, opened packages are indexed
+        """
+        self.loader = loader if loader is not None else ObjectApiLoader()
+        self.cache = cache
+        self.index = index
+        check_classes = checks if checks is not None else discover_checks()
+        self.checks = {check_type: [check_class(None) for check_class in check_classes]
+                       for check_type, check_classes in check_classes.items()}
+
+    def run(self, paths) -> Iterator[ItemResult]:
+        """
+        Runs the checks on all test items of the given files and folders.
+
+        Parameters
+        ----------
+        paths: iterable of str
+            test item files and workspace folders
+
+        Returns
+        -------
+            iterator of ItemResult, one per test item and check
+        """
+        for path in collect_items(paths):
+            yield from self.run_item(path)
+
+    def run_item(self, path) -> List[ItemResult]:
+        """
+        Runs all checks matching the type of the given test item.
+
+        Parameters
+        ----------
+        path: str
+            path of the test item
+
+        Returns
+        -------
+            list of ItemResult, one per check
+        """
+        checks = self.checks.get(get_item_type(path))
+        if not checks:
+            return []
+
+        keys = self.cache.item_keys(path, checks) if self.cache is not None else None
+        cached = self.cache.lookup(path, keys) if keys else {}
+
+        item_results = {}
+        pending = [check for check in checks if check.GetName() not in cached]
+
+        content_hash = None
+        if pending and self.index is not None \
+                and get_item_type(path) == CheckType.PACKAGE.value:
+            content_hash, pending = self.run_indexed(pending, path, item_results)
+
+        if pending:
+            try:
+                item = self.loader.open_item(path, get_item_type(path))
+            except Exception as error:  # pylint: disable=W0703
+                EPrint(f'Could not open "{path}": {error}')
+                return [ItemResult(path, None, error=f'{type(error).__name__}: {error}')]
+
+            try:
+                # one snapshot per test item, shared by all checks
+                snapshot = ItemSnapshot(Profiling.instrument(item))
+                if Profiling.get_profiler() is None and ApiRecorder.get_recorder() is None:
+                    item_results.update(self.run_fused(pending, path, snapshot))
+                else:
+                    # the durations and object API calls are recorded check by check
+                    for check in pending:
+                        item_results[check.GetName()] = self.run_check(check, path, snapshot)
+                if content_hash is not None:
+                    self.index.store(path, content_hash, snapshot)
+            finally:
+                self.loader.close_item(item)
+
+            if keys:
+                # results of failed check runs are not cached
+                self.cache.store(path, keys, {name: item_result.results
+                                              for name, item_result in item_results.items()
+                                              if item_result.error is None})
+
+        return [item_results[check.GetName()] if check.GetName() in item_results
+                else ItemResult(path, check.GetName(), cached[check.GetName()], cached=True)
+                for check in checks]
+
+    def run_indexed(self, checks, path, item_results) -> Tuple[Optional[str], List]:
+        """
+        Runs the indexed checks on the indexed package if the package file is unchanged.
+
+        Parameters
+        ----------
+        checks: list of check instances
+            the checks to run
+        path: str
+            path of the package
+        item_results: dict
+            check name and ItemResult, the results of the indexed checks are added
+
+        Returns
+        -------
+            tuple (content hash of the package file if the package needs to be indexed,
+            list of the checks which need the opened package)
+        """
+        from .ResultCache import hash_file  # pylint: disable=C0415
+        try:
+            content_hash = hash_file(path)
+        except OSError as error:
+            WPrint(f'Could not hash "{path}", the package is not indexed: {error}')
+            return None, checks
+
+        package = self.index.lookup(path, content_hash)
+        if package is None:
+            return content_hash, checks
+
+        indexed = [check for check in checks if check.INDEXED]
+        if indexed:
+            item_results.update(self.run_fused(indexed, path, package))
+        return None, [check for check in checks if not check.INDEXED]
+
+    @staticmethod
+    def run_check(check, path, item) -> ItemResult:
+        """
+        Runs one check on an opened test item, errors of the check are part of the result.
+        """
+        try:
+            return ItemResult(path, check.GetName(), list(check.iter_results(item)))
+        except Exception as error:  # pylint: disable=W0703
+            return BatchRunner.check_failed(check, path, error)
+
+    @staticmethod
+    def run_fused(checks, path, item) -> Dict[str, ItemResult]:
+        """
+        Runs the checks on an opened test item with a single traversal of the test item shared by
+        all checks, see PackageVisitor.traverse. Errors of a check are part of its result.
+
+        Returns
+        -------
+            dict of the check names and their ItemResult
+        """
+        item_results = {}
+        visits = []
+        for check in checks:
+            try:
+                visits.append(check.visit(item))
+            except Exception as error:  # pylint: disable=W0703
+                item_results[check.GetName()] = BatchRunner.check_failed(check, path, error)
+
+        errors = traverse(item, [visitor for visit in visits for visitor in visit.visitors])
+
+        for visit in visits:
+            check = visit.check
+            try:
+                item_results[check.GetName()] = ItemResult(path, check.GetName(),
+                                                           list(visit.results(errors)))
+            except Exception as error:  # pylint: disable=W0703
+                item_results[check.GetName()] = BatchRunner.check_failed(check, path, error)
+        return item_results
+
+    @staticmethod
+    def check_failed(check, path, error) -> ItemResult:
+        """
+        Reports a failed check run and returns its result.
+        """
+        EPrint(f'{check.GetName()} failed for "{path}": {error}')
+        return ItemResult(path, check.GetName(), error=f'{type(error).__name__}: {error}')
+
+
+class JsonLinesSink:
+    """
+    Writes every ItemResult with violations or errors as one JSON line and counts the results.
+    Each violation is written with its structured fields, see CheckResult.to_dict.
+    """
+
+    def __init__(self, stream):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        stream: text stream the JSON lines are written to
+        """
+        self.stream = stream
+        self.checked = 0
+        self.violations = 0
+        self.errors = 0
+
+    def write(self, item_result):
+        """
+        Writes one ItemResult.
+        """
+        self.checked += 1
+        self.violations += len(item_result.results)
+
+        if not item_result.results and item_result.error is None:
+            return
+
+        record = {'path': item_result.path,
+                  'check': item_result.check_name,
+                  'results': [result.to_dict() for result in item_result.results]}
+        if item_result.error is not None:
+            self.errors += 1
+            record['error'] = item_result.error
+        self.stream.write(json.dumps(record) + '\n')
+
+
+def load_loader(spec):
+    """
+    Creates an object API stand-in from a "module:factory" specification.
+    """
+    module_name, _, factory_name = spec.partition(':')
+    return getattr(importlib.import_module(module_name), factory_name or 'create_loader')()
+
+
+def read_item_list(list_path) -> Iterator[str]:
+    """
+    Yields the test item paths of a file with one path per line.
+    """
+    with open(list_path, 'r', encoding='utf-8') as stream:
+        for line in stream:
+            if line.strip():
+                yield line.strip()
+
+
+def positive_int(value) -> int:
+    """
+    Parses a command line argument which must be a number of at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'invalid int value: {value!r}') from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1: {value!r}')
+    return number
+
+
+def job_count(value) -> Optional[int]:
+    """
+    Parses the --jobs argument: the number of worker processes, None for 'auto'.
+    """
+    if value == 'auto':
+        return None
+    return positive_int(value)
+
+
+def parse_args(argv):
+    """
+    Parses the command line arguments of the batch runner.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m UserPyModules.CustomChecks.batch',
+        description='Runs the CustomChecks on all packages, projects and analysis packages of '
+                    'the given workspace folders or files.')
+    parser.add_argument('paths', nargs='*', help='workspace folders or .pkg/.prj/.ta files')
+    parser.add_argument('--config', help='config.yaml to use, default: config.yaml of the '
+                                         'ecu.test workspace')
+    parser.add_argument('--items-from', help='file with one test item path per line')
+    loader = parser.add_mutually_exclusive_group()
+    loader.add_argument('--loader', help='object API stand-in given as "module:factory", '
+                                         'default: ecu.test Object API')
+    loader.add_argument('--offline', action='store_const', dest='loader', const=OFFLINE_LOADER,
+                        help='read the test items from their files, without ecu.test')
+    parser.add_argument('--output', help='file for the JSON lines results, default: stdout')
+    parser.add_argument('--jobs', type=job_count, default=1,
+                        help='number of worker processes for the packages, "auto" for one per '
+                             'CPU, default: 1 (no worker processes)')
+    parser.add_argument('--shard-size', type=positive_int, default=64,
+                        help='number of test items sent to a worker process at once')
+    parser.add_argument('--threads', type=int, default=0,
+                        help='number of threads overlapping the object API calls of several '
+                             'test items, default: 0 (no threads)')
+    parser.add_argument('--max-in-flight', type=int,
+                        help='maximum number of test items processed by the threads at once, '
+                             'default: twice the number of threads')
+    parser.add_argument('--changed-since', metavar='REF',
+                        help='only check the test items changed since the git revision, and the '
+                             'projects referencing changed or deleted packages')
+    parser.add_argument('--references', action='store_true',
+                        help='also check the packages referenced by the projects, every package '
+                             'only once')
+    parser.add_argument('--cache',
+                        help='result cache database; checks are only run again for test items, '
+                             'configurations or CustomChecks versions which changed')
+    parser.add_argument('--index',
+                        help='workspace index database of the package metadata; checks which '
+                             'only need the metadata run without opening unchanged packages')
+    args = parser.parse_args(argv)
+
+    # the config.yaml of the workspace is only known within ecu.test
+    if args.config is None and not is_available():
+        parser.error('--config is required when ecu.test is not available')
+    return args
+
+
+def iter_paths(args) -> Iterable[str]:
+    """
+    Yields the test item files and folders given on the command line.
+    """
+    yield from args.paths
+    if args.items_from:
+        yield from read_item_list(args.items_from)
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point of the batch runner.
+
+    Returns
+    -------
+        exit code, 1 if violations, errors or configuration errors were found
+    """
+    args = parse_args(argv)
+
+    if args.threads and args.jobs != 1:
+        print('--threads cannot be combined with --jobs', file=sys.stderr)
+        return 2
+
+    if args.config:
+        set_config_file(args.config)
+
+    # configuration errors are logged once when the configuration is loaded
+    config = Configuration()
+    config_errors = config.config_errors
+    Profiling.configure(config)
+
+    paths = iter_paths(args)
+    if args.changed_since:
+        from .ChangeSelector import ChangeSelector
+        selector = ChangeSelector(args.changed_since)
+        try:
+            paths = selector.select(list(paths))
+        except (OSError, subprocess.CalledProcessError) as error:
+            stderr = getattr(error, 'stderr', None)
+            print(f'Could not select the changed test items: '
+                  f'{os.fsdecode(stderr).strip() if stderr else error}', file=sys.stderr)
+            return 2
+        print(f'changed since {args.changed_since}: {selector.changed} test items, '
+              f'{selector.projects} projects referencing changed or deleted packages',
+              file=sys.stderr)
+
+    loader = load_loader(args.loader) if args.loader and args.jobs == 1 else None
+
+    references = missing = None
+    if args.references:
+        from .ProjectFile import PackageIndex, expand_references
+        references, missing = PackageIndex(), []
+        # the offline loader takes over the projects read for their references
+        paths = expand_references(collect_items(paths), references, missing,
+                                  getattr(loader, 'parsed_projects', None))
+
+    cache = None
+    if args.cache:
+        from .ResultCache import ResultCache
+        cache = ResultCache(args.cache)
+    index = None
+    if args.index:
+        from .WorkspaceIndex import WorkspaceIndex
+        index = WorkspaceIndex(args.index)
+    if args.threads and args.jobs == 1:
+        from .ThreadedRunner import ThreadedRunner
+        runner = ThreadedRunner(threads=args.threads, max_in_flight=args.max_in_flight,
+                                loader=loader, cache=cache, index=index)
+    elif args.jobs == 1:
+        runner = BatchRunner(loader=loader, cache=cache, index=index)
+    else:
+        from .ParallelRunner import ParallelRunner
+        runner = ParallelRunner(workers=args.jobs,
+                                shard_size=args.shard_size,
+                                config_file=args.config and os.path.abspath(args.config),
+                                loader_spec=args.loader,
+                                cache_file=args.cache and os.path.abspath(args.cache),
+                                index_file=args.index and os.path.abspath(args.index))
+
+    cache_hits = 0
+    stream = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        sink = JsonLinesSink(stream)
+        for item_result in runner.run(paths):
+            cache_hits += item_result.cached
+            sink.write(item_result)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    if args.jobs != 1:
+        print(runner.format_worker_stats(), file=sys.stderr)
+    Profiling.emit_summary(lambda text: print(text, file=sys.stderr))
+    if references is not None:
+        for package in sorted(set(missing)):
+            WPrint(f'Referenced package "{package}" does not exist!')
+        print(f'project references: {len(references.packages)} projects, '
+              f'{len(references.projects)} referenced packages, {references.shared} shared',
+              file=sys.stderr)
+    if cache is not None:
+        evicted = cache.evict()
+        cache.close()
+        print(f'result cache: {cache_hits} hits, {sink.checked - cache_hits} misses, '
+              f'{evicted} stale entries removed', file=sys.stderr)
+    if index is not None:
+        evicted = index.evict()
+        indexed = index.query('SELECT COUNT(*) FROM packages')[0][0]
+        index.close()
+        print(f'workspace index: {indexed} packages, {evicted} stale entries removed',
+              file=sys.stderr)
+    print(f'{sink.checked} check runs, {sink.violations} violations, {sink.errors} errors, '
+          f'{len(config_errors)} configuration errors', file=sys.stderr)
+    return 1 if sink.violations or sink.errors or config_errors else 0
@@ -0,0 +1,181 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Selection of the test items changed since a git revision.
+"""
+
+import os
+import re
+import subprocess
+from typing import Iterable, List, Set
+
+from .BatchRunner import get_item_type
+from ..helper.CheckType import CheckType
+
+
+def run_git(args, cwd) -> bytes:
+    """
+    Runs a git command and returns its output.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        if git fails, e.g. for an unknown revision
+    """
+    return subprocess.run(['git'] + list(args), cwd=cwd, check=True,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout
+
+
+def split_paths(output, toplevel) -> List[str]:
+    """
+    Converts the NUL separated output of a git command into absolute paths.
+    """
+    return [os.path.normpath(os.path.join(toplevel, os.fsdecode(name)))
+            for name in output.split(b'\0') if name]
+
+
+def git_toplevel(path) -> str:
+    """
+    Returns the root folder of the git repository containing the given file or folder.
+    """
+    folder = path if os.path.isdir(path) else os.path.dirname(path) or '.'
+    return os.fsdecode(run_git(['rev-parse', '--show-toplevel'], folder).strip())
+
+
+class ChangeSelector:
+    """
+    Limits the test items of a batch run to those changed since a git revision, using plain
+    'git diff --name-only'. Projects are selected as well if they reference a changed or
+    deleted package of the repository; the references are found by searching the project files
+    for the file names of these packages, so a project is selected rather once too often than
+    missed.
+
+    Attributes
+    ----------
+    ref : str
+        the git revision, e.g. 'origin/main'
+    changed : int
+        number of changed test items of the last selection
+    projects : int
+        number of unchanged projects selected for referencing a changed or deleted package
+    """
+
+    def __init__(self, ref):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        ref: str
+            the git revision
+        """
+        self.ref = ref
+        self.changed = 0
+        self.projects = 0
+
+    def changed_files(self, toplevel) -> Set[str]:
+        """
+        Returns the files changed since the revision, including uncommitted and untracked
+        files, as absolute paths. Renamed files are reported with their old and their new path,
+        so the projects referencing the old path are selected as well.
+        """
+        diff = run_git(['diff', '--name-only', '--no-renames', '-z', self.ref, '--'], toplevel)
+        untracked = run_git(['ls-files', '--others', '--exclude-standard', '-z'], toplevel)
+        return set(split_paths(diff, toplevel) + split_paths(untracked, toplevel))
+
+    @staticmethod
+    def project_files(toplevel) -> List[str]:
+        """
+        Returns all tracked and untracked project files of the repository.
+        """
+        output = run_git(['ls-files', '--cached', '--others', '--exclude-standard', '-z',
+                          '--', '*.prj'], toplevel)
+        return split_paths(output, toplevel)
+
+    @staticmethod
+    def referencing_projects(projects, packages) -> List[str]:
+        """
+        Returns the projects whose file contains the file name of one of the packages.
+
+        Parameters
+        ----------
+        projects: iterable of str
+            paths of the project files
+        packages: iterable of str
+            paths of the packages
+
+        Returns
+        -------
+            list of project paths
+        """
+        names = sorted({os.fsencode(os.path.basename(package)) for package in packages})
+        if not names:
+            return []
+
+        matcher = re.compile(b'|'.join(re.escape(name) for name in names))
+        selected = []
+        for project in projects:
+            try:
+                with open(project, 'rb') as stream:
+                    if matcher.search(stream.read()):
+                        selected.append(project)
+            except OSError:
+                continue
+        return selected
+
+    def select(self, paths) -> List[str]:
+        """
+        Selects the changed test items within the given files and folders.
+
+        Parameters
+        ----------
+        paths: iterable of str
+            test item files and workspace folders limiting the selection
+
+        Returns
+        -------
+            sorted list of test item paths
+        """
+        # git reports the real paths of the repository
+        scopes = [os.path.realpath(path) for path in paths] or [os.path.realpath('.')]
+
+        changed = set()
+        projects = set()
+        for toplevel in sorted({git_toplevel(scope) for scope in scopes}):
+            changed_files = self.changed_files(toplevel)
+            # only the existing test items are run, but changed and deleted packages both select
+            # the projects referencing them
+            changed_items = {path for path in changed_files
+                             if get_item_type(path) is not None and os.path.isfile(path)
+                             and in_scope(path, scopes)}
+            packages = [path for path in changed_files
+                        if get_item_type(path) == CheckType.PACKAGE.value]
+            candidates = [project for project in self.project_files(toplevel)
+                          if project not in changed_items and in_scope(project, scopes)]
+            changed |= changed_items
+            projects.update(self.referencing_projects(candidates, packages))
+
+        self.changed = len(changed)
+        self.projects = len(projects)
+        return sorted(changed | projects)
+
+
+def in_scope(path, scopes: Iterable[str]) -> bool:
+    """
+    Whether the path is one of the given files or within one of the given folders, outside of
+    hidden folders just like the items found by collect_items.
+    """
+    for scope in scopes:
+        if path == scope:
+            return True
+        try:
+            relative = os.path.relpath(path, scope)
+        except ValueError:
+            # different drives
+            continue
+        if not relative.startswith(os.pardir) and not any(
+                part.startswith('.') for part in relative.split(os.sep)[:-1]):
+            return True
+    return False
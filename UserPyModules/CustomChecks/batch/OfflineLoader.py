@@ -0,0 +1,75 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Object API stand-in which reads the test items from their files, so the batch runner works on
+machines without ecu.test, e.g. Linux build agents.
+
+Usage: python -m UserPyModules.CustomChecks.batch --offline path/to/workspace
+"""
+
+import os
+from typing import Dict
+
+from ..helper.CheckType import CheckType
+from .PackageFile import read_package
+from .ProjectFile import ProjectFile, read_project
+
+
+class OfflineLoader:
+    """
+    Opens the test items with the offline file readers; see BatchRunner.ObjectApiLoader.
+
+    Attributes
+    ----------
+    parsed_projects : dict
+        projects which were already read, e.g. by ProjectFile.expand_references, keyed by their
+        normalized absolute path; they are not read again when they are opened
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.parsed_projects: Dict[str, ProjectFile] = {}
+
+    def open_item(self, path, item_type):
+        """
+        Reads a test item.
+
+        Parameters
+        ----------
+        path: str
+            path of the test item
+        item_type: str
+            value of CheckType
+
+        Returns
+        -------
+            PackageFile or ProjectFile
+
+        Raises
+        ------
+        ValueError
+            if the test item type cannot be read offline
+        """
+        if item_type == CheckType.PACKAGE.value:
+            return read_package(path)
+        if item_type == CheckType.PROJECT.value:
+            project = self.parsed_projects.pop(os.path.normpath(os.path.abspath(path)), None)
+            return project if project is not None else read_project(path)
+        raise ValueError(f'"{path}" cannot be read without ecu.test, only packages and '
+                         f'projects are supported')
+
+    def close_item(self, item):
+        """
+        Releases a test item opened by 'open_item'.
+        """
+
+
+def create_loader() -> OfflineLoader:
+    """
+    Factory used by the --loader and --offline options of the batch runner.
+    """
+    return OfflineLoader()
@@ -0,0 +1,555 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Offline reader of ecu.test package files (.pkg), which provides the object API methods used by
+the CustomChecks without ecu.test. The XML is streamed with iterparse and every element is
+released as soon as it is read, so the memory stays bounded by the extracted values.
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Set
+from xml.etree.ElementTree import iterparse
+
+
+class PackageTags:
+    """
+    Element and attribute names of the package file format read by PackageFile:
+
+    .. code-block:: xml
+
+        <PACKAGE>
+            <VERSION>1.0</VERSION>
+            <DESCRIPTION>...</DESCRIPTION>
+            <TESTCASE>true</TESTCASE>
+            <ATTRIBUTES>
+                <ATTRIBUTE NAME="Owner"><VALUE>...</VALUE></ATTRIBUTE>
+            </ATTRIBUTES>
+            <VARIABLES>
+                <VARIABLE NAME="V_x" TYPE="Integer" IS-PARAMETER="true" IS-RETURN="false">
+                    <DESCRIPTION>...</DESCRIPTION>
+                </VARIABLE>
+            </VARIABLES>
+            <TESTSTEPS>
+                <TESTSTEP TYPE="TsBlock" DISABLED="false">...</TESTSTEP>
+            </TESTSTEPS>
+            <MAPPING>
+                <MAPPINGITEM REFERENCE-NAME="..." ACCESS-TYPE="SIGNAL"/>
+            </MAPPING>
+        </PACKAGE>
+
+    Only the TESTSTEPS element is required. The content of a test step is free, except that
+    its child test steps are TESTSTEP elements at any depth. A variable is used if its name
+    occurs as identifier in the text or an XML attribute value of any test step, e.g. in the
+    EXPRESSION of a calculation. Other elements outside of test steps are ignored together with
+    their content.
+    """
+
+    PACKAGE = 'PACKAGE'
+    VERSION = 'VERSION'
+    DESCRIPTION = 'DESCRIPTION'
+    TESTCASE = 'TESTCASE'
+    ATTRIBUTES = 'ATTRIBUTES'
+    ATTRIBUTE = 'ATTRIBUTE'
+    VALUE = 'VALUE'
+    VARIABLES = 'VARIABLES'
+    VARIABLE = 'VARIABLE'
+    TESTSTEPS = 'TESTSTEPS'
+    TESTSTEP = 'TESTSTEP'
+    MAPPING = 'MAPPING'
+    MAPPING_ITEM = 'MAPPINGITEM'
+
+    # XML attributes
+    NAME = 'NAME'
+    TYPE = 'TYPE'
+    DISABLED = 'DISABLED'
+    IS_PARAMETER = 'IS-PARAMETER'
+    IS_RETURN = 'IS-RETURN'
+    REFERENCE_NAME = 'REFERENCE-NAME'
+    ACCESS_TYPE = 'ACCESS-TYPE'
+
+
+# read child elements of the elements outside of test steps
+_CHILDREN = {
+    PackageTags.PACKAGE: (PackageTags.VERSION, PackageTags.DESCRIPTION, PackageTags.TESTCASE,
+                          PackageTags.ATTRIBUTES, PackageTags.VARIABLES, PackageTags.TESTSTEPS,
+                          PackageTags.MAPPING),
+    PackageTags.ATTRIBUTES: (PackageTags.ATTRIBUTE,),
+    PackageTags.ATTRIBUTE: (PackageTags.VALUE,),
+    PackageTags.VARIABLES: (PackageTags.VARIABLE,),
+    PackageTags.VARIABLE: (PackageTags.DESCRIPTION,),
+    PackageTags.TESTSTEPS: (PackageTags.TESTSTEP,),
+    PackageTags.MAPPING: (PackageTags.MAPPING_ITEM,),
+}
+
+_TRUE = ('true', '1')
+
+# names which may reference a variable in the texts and expressions of the test steps
+_IDENTIFIER = re.compile(r'[^\W\d]\w*')
+
+
+def _is_true(value) -> bool:
+    return (value or '').strip().lower() in _TRUE
+
+
+def local_name(tag) -> str:
+    """
+    Returns the tag of an XML element without its namespace.
+    """
+    return tag.rpartition('}')[2]
+
+
+def is_read(children, parent, tag) -> bool:
+    """
+    Whether an element is read in its parent element; other elements are skipped together with
+    their content.
+
+    Parameters
+    ----------
+    children: dict
+        element names and the names of their read child elements
+    parent: str
+        name of the parent element
+    tag: str
+        name of the element
+    """
+    return tag in children.get(parent, ())
+
+
+def release(elements, element):
+    """
+    Clears a read element and removes it from its parent element, so only the values extracted
+    from it are kept.
+
+    Parameters
+    ----------
+    elements: list
+        the open elements as (name, element), without the released element
+    element: xml.etree.ElementTree.Element
+        the released element
+    """
+    element.clear()
+    if elements and len(elements[-1][1]) and elements[-1][1][-1] is element:
+        del elements[-1][1][-1]
+
+
+def get_required(filename, element, name) -> str:
+    """
+    Returns the value of an XML attribute, raises a ValueError if it is missing or empty.
+    """
+    value = element.get(name)
+    if not value:
+        raise ValueError(f'"{filename}": element {local_name(element.tag)!r} has no {name!r}')
+    return value
+
+
+class Variable:
+    """
+    Variable of an offline package.
+    """
+
+    __slots__ = ('name', 'type', 'is_parameter', 'is_return', 'description')
+
+    def __init__(self, name, var_type, is_parameter, is_return, description=''):
+        self.name = name
+        self.type = var_type
+        self.is_parameter = is_parameter
+        self.is_return = is_return
+        self.description = description
+
+    def GetName(self):  # pylint: disable=C0103
+        """
+        Name of the variable
+        """
+        return self.name
+
+    def GetType(self):  # pylint: disable=C0103
+        """
+        Type of the variable
+        """
+        return self.type
+
+    def IsParameter(self):  # pylint: disable=C0103
+        """
+        Whether the variable is a parameter
+        """
+        return self.is_parameter
+
+    def IsReturn(self):  # pylint: disable=C0103
+        """
+        Whether the variable is a return value
+        """
+        return self.is_return
+
+    def GetDescription(self):  # pylint: disable=C0103
+        """
+        Description of the variable
+        """
+        return self.description
+
+
+class MappingItem:
+    """
+    Item of the local mapping of an offline package.
+    """
+
+    __slots__ = ('reference_name', 'access_type')
+
+    def __init__(self, reference_name, access_type):
+        self.reference_name = reference_name
+        self.access_type = access_type
+
+    def GetReferenceName(self):  # pylint: disable=C0103
+        """
+        Reference name of the mapping item
+        """
+        return self.reference_name
+
+    def GetAccessType(self):  # pylint: disable=C0103
+        """
+        Access type of the mapping item
+        """
+        return self.access_type
+
+
+class Mapping:
+    """
+    Local mapping of an offline package.
+    """
+
+    __slots__ = ('items',)
+
+    def __init__(self, items):
+        self.items = items
+
+    def GetItems(self):  # pylint: disable=C0103
+        """
+        Mapping items of the local mapping
+        """
+        return self.items
+
+
+class Attributes:
+    """
+    Attributes of an offline test item.
+    """
+
+    __slots__ = ('values',)
+
+    def __init__(self, values):
+        self.values = values
+
+    def GetNamesAndValues(self):  # pylint: disable=C0103
+        """
+        Dict of attribute names and values
+        """
+        return dict(self.values)
+
+
+class TestStep:
+    """
+    Test step of an offline package. Its text, see __str__, consists of the test step type and
+    all texts and XML attribute values of the test step element without its child test steps.
+    """
+
+    __slots__ = ('type', 'line_no', 'disabled', 'text', 'children')
+
+    def __init__(self, step_type, line_no, disabled):
+        self.type = step_type
+        self.line_no = line_no
+        self.disabled = disabled
+        self.text = ''
+        self.children = []
+
+    def __str__(self):
+        return self.text
+
+    def GetType(self):  # pylint: disable=C0103
+        """
+        Type of the test step
+        """
+        return self.type
+
+    def GetLineNo(self):  # pylint: disable=C0103
+        """
+        Line of the test step in the package, counted from 1 in depth-first order
+        """
+        return self.line_no
+
+    def IsEnabled(self):  # pylint: disable=C0103
+        """
+        Whether the test step is enabled
+        """
+        return not self.disabled
+
+    def GetTestSteps(self, skipDisabledSteps=True, recursive=False,  # pylint: disable=C0103
+                     whiteList=None, blackList=None):  # pylint: disable=C0103
+        """
+        Child test steps, see PackageFile.GetTestSteps
+        """
+        return select_test_steps(self.children, skipDisabledSteps, recursive, whiteList,
+                                 blackList)
+
+
+def select_test_steps(test_steps, skip_disabled, recursive, white_list, black_list) -> List:
+    """
+    Selects test steps like the GetTestSteps method of the object API.
+
+    Parameters
+    ----------
+    test_steps: list of TestStep
+        the test steps of one layer
+    skip_disabled: bool
+        whether disabled test steps and their children are left out
+    recursive: bool
+        whether the children are included, in depth-first order
+    white_list: list of str
+        test step types to include, all if not given
+    black_list: list of str
+        test step types to leave out
+
+    Returns
+    -------
+        list of TestStep
+    """
+    selected = []
+    stack = list(reversed(test_steps))
+    while stack:
+        test_step = stack.pop()
+        if skip_disabled and test_step.disabled:
+            continue
+        if (not white_list or test_step.type in white_list) \
+                and not (black_list and test_step.type in black_list):
+            selected.append(test_step)
+        if recursive:
+            stack.extend(reversed(test_step.children))
+    return selected
+
+
+class PackageFile:
+    """
+    Package read from a package file, provides the object API methods used by the checks.
+
+    Attributes
+    ----------
+    filename : str
+        path of the package file
+    Attributes : Attributes
+        the attributes of the package
+    references : frozenset of str
+        the identifiers occurring in the test steps, see PackageTags
+    """
+
+    def __init__(self, filename, version='', description='', test_case=False,
+                 attributes=None, variables=None, test_steps=None, mapping_items=None,
+                 references=None):
+        """
+        Constructor, see 'read_package'
+        """
+        self.filename = filename
+        self.version = version
+        self.description = description
+        self.test_case = test_case
+        self.Attributes = Attributes(attributes or {})  # pylint: disable=C0103
+        self.variables = variables or []
+        self.test_steps = test_steps or []
+        self.mapping_items = mapping_items or []
+        self.references = frozenset(references or ())
+
+    def GetName(self):  # pylint: disable=C0103
+        """
+        Name of the package, i.e. its file name without extension
+        """
+        return os.path.splitext(os.path.basename(self.filename))[0]
+
+    def GetFilename(self):  # pylint: disable=C0103
+        """
+        Path of the package file
+        """
+        return self.filename
+
+    def HasTestCaseFlag(self):  # pylint: disable=C0103
+        """
+        Whether the test case flag is set
+        """
+        return self.test_case
+
+    def GetVersion(self):  # pylint: disable=C0103
+        """
+        Version of the package
+        """
+        return self.version
+
+    def GetDescription(self):  # pylint: disable=C0103
+        """
+        Description of the package
+        """
+        return self.description
+
+    def GetVariables(self):  # pylint: disable=C0103
+        """
+        Variables of the package
+        """
+        return list(self.variables)
+
+    def GetUnusedVariables(self):  # pylint: disable=C0103
+        """
+        Variables of the package which are not referenced by any test step, including the
+        disabled ones
+        """
+        return [variable for variable in self.variables if variable.name not in self.references]
+
+    def GetMapping(self):  # pylint: disable=C0103
+        """
+        Local mapping of the package
+        """
+        return Mapping(list(self.mapping_items))
+
+    def GetTestSteps(self, skipDisabledSteps=True, recursive=False,  # pylint: disable=C0103
+                     whiteList=None, blackList=None):  # pylint: disable=C0103
+        """
+        Test steps of the package
+
+        Parameters
+        ----------
+        skipDisabledSteps: bool
+            whether disabled test steps and their children are left out
+        recursive: bool
+            whether the child test steps are included, in depth-first order
+        whiteList: list of str
+            test step types to include, all if not given
+        blackList: list of str
+            test step types to leave out
+
+        Returns
+        -------
+            list of TestStep
+        """
+        return select_test_steps(self.test_steps, skipDisabledSteps, recursive, whiteList,
+                                 blackList)
+
+
+def read_package(filename) -> PackageFile:
+    """
+    Reads a package file with a single streaming pass over its XML.
+
+    Parameters
+    ----------
+    filename: str
+        path of the package file
+
+    Returns
+    -------
+        PackageFile
+
+    Raises
+    ------
+    xml.etree.ElementTree.ParseError
+        if the file is no well-formed XML
+    ValueError
+        if the read elements do not have the structure described by PackageTags, e.g. if the
+        root element is no package or the test steps are missing
+    """
+    tags = PackageTags
+    # values of the package, each given at most once
+    values = {}
+    attributes: Dict[str, str] = {}
+    variables = []
+    mapping_items = []
+    test_steps = None
+    references: Set[str] = set()
+
+    # open elements as (name, element), the number of open skipped elements, the open test
+    # steps with their collected texts, the open variable and the value of the open attribute
+    elements = []
+    skipped = 0
+    steps: List[TestStep] = []
+    step_texts: List[List[str]] = []
+    variable: Optional[Variable] = None
+    attribute_value = None
+    line_no = 0
+
+    for event, element in iterparse(filename, events=('start', 'end')):
+        tag = local_name(element.tag)
+
+        if event == 'start':
+            if not elements:
+                if tag != tags.PACKAGE:
+                    raise ValueError(f'"{filename}" is no package file, root element is {tag!r}')
+            elif skipped or not (steps or is_read(_CHILDREN, elements[-1][0], tag)):
+                # unknown elements outside of test steps are skipped with their content
+                skipped += 1
+                elements.append((tag, element))
+                continue
+
+            if tag == tags.TESTSTEP:
+                line_no += 1
+                test_step = TestStep(get_required(filename, element, tags.TYPE), line_no,
+                                     _is_true(element.get(tags.DISABLED)))
+                (steps[-1].children if steps else test_steps).append(test_step)
+                steps.append(test_step)
+                step_texts.append([test_step.type])
+            elif tag == tags.TESTSTEPS and not steps:
+                if test_steps is not None:
+                    raise ValueError(f'"{filename}": element {tag!r} is given twice')
+                test_steps = []
+            elif tag == tags.VARIABLE and not steps:
+                variable = Variable(get_required(filename, element, tags.NAME),
+                                    element.get(tags.TYPE, ''),
+                                    _is_true(element.get(tags.IS_PARAMETER)),
+                                    _is_true(element.get(tags.IS_RETURN)))
+                variables.append(variable)
+            if steps:
+                step_texts[-1].extend(value for name, value in element.items()
+                                      if name not in (tags.TYPE, tags.DISABLED))
+            elements.append((tag, element))
+            continue
+
+        elements.pop()
+        text = element.text or ''
+        parent = elements[-1][0] if elements else None
+
+        if skipped:
+            skipped -= 1
+        elif steps:
+            if tag == tags.TESTSTEP:
+                texts = step_texts.pop()
+                steps.pop().text = ' '.join(texts)
+                # the test step type is no reference
+                references.update(_IDENTIFIER.findall(' '.join(texts[1:])))
+            elif text.strip():
+                step_texts[-1].append(text.strip())
+        elif tag == tags.VARIABLE:
+            variable = None
+        elif parent == tags.VARIABLE:
+            variable.description = text
+        elif tag == tags.VALUE:
+            attribute_value = text
+        elif tag == tags.ATTRIBUTE:
+            name = get_required(filename, element, tags.NAME)
+            attributes[name] = text.strip() if attribute_value is None else attribute_value
+            attribute_value = None
+        elif tag == tags.MAPPING_ITEM:
+            reference_name = get_required(filename, element, tags.REFERENCE_NAME)
+            mapping_items.append(MappingItem(reference_name, element.get(tags.ACCESS_TYPE, '')))
+        elif tag in (tags.VERSION, tags.DESCRIPTION, tags.TESTCASE):
+            if tag in values:
+                raise ValueError(f'"{filename}": element {tag!r} is given twice')
+            values[tag] = text
+
+        release(elements, element)
+
+    if test_steps is None:
+        raise ValueError(f'"{filename}": element {tags.TESTSTEPS!r} is missing')
+
+    return PackageFile(filename,
+                       version=values.get(tags.VERSION, ''),
+                       description=values.get(tags.DESCRIPTION, ''),
+                       test_case=_is_true(values.get(tags.TESTCASE)),
+                       attributes=attributes,
+                       variables=variables,
+                       test_steps=test_steps,
+                       mapping_items=mapping_items,
+                       references=references)
@@ -0,0 +1,163 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Parallel batch execution of the CustomChecks with a process pool.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterator, List, Tuple
+
+from ..helper.Configuration import set_config_file
+from .BatchRunner import BatchRunner, ItemResult, collect_items, load_loader
+from .ResultCache import ResultCache
+from .WorkspaceIndex import WorkspaceIndex
+
+# the warm BatchRunner of a worker process, created once by _init_worker
+_WORKER_RUNNER = None
+
+
+def _init_worker(config_file, loader_spec, cache_file=None, index_file=None):
+    """
+    Initializes a worker process with its own check instances and the parsed configuration.
+    """
+    global _WORKER_RUNNER  # pylint: disable=W0603
+    if config_file:
+        set_config_file(config_file)
+    loader = load_loader(loader_spec) if loader_spec else None
+    cache = ResultCache(cache_file) if cache_file else None
+    index = WorkspaceIndex(index_file) if index_file else None
+    _WORKER_RUNNER = BatchRunner(loader=loader, cache=cache, index=index)
+
+
+def _run_shard(paths) -> Tuple[int, float, List[ItemResult]]:
+    """
+    Runs the checks on one shard of test items in a worker process.
+
+    Returns
+    -------
+        tuple (process id of the worker, duration in seconds, list of ItemResult)
+    """
+    start = time.perf_counter()
+    item_results = []
+    for path in paths:
+        item_results.extend(_WORKER_RUNNER.run_item(path))
+    return os.getpid(), time.perf_counter() - start, item_results
+
+
+@dataclass
+class WorkerStats:
+    """
+    Timing of one worker process.
+    """
+
+    shards: int = 0
+    items: int = 0
+    seconds: float = 0.0
+
+
+class ParallelRunner:
+    """
+    Shards the test items across a process pool. Every worker keeps one warm instance of each
+    check class and the parsed configuration for its whole lifetime. The results are returned in
+    the order of the test items.
+
+    Attributes
+    ----------
+    workers : int
+        number of worker processes
+    shard_size : int
+        number of test items sent to a worker at once
+    worker_stats : dict
+        process id and WorkerStats of every worker
+    """
+
+    def __init__(self, workers=None, shard_size=64, config_file=None, loader_spec=None,
+                 cache_file=None, index_file=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        workers: int
+            number of worker processes, number of CPUs if not given
+        shard_size: int
+            number of test items sent to a worker at once
+        config_file: str
+            config.yaml used by the workers
+        loader_spec: str
+            object API stand-in of the workers given as "module:factory"
+        cache_file: str
+            result cache database shared by the workers, see ResultCache
+        index_file: str
+            workspace index database shared by the workers, see WorkspaceIndex
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = max(1, shard_size)
+        self.config_file = config_file
+        self.loader_spec = loader_spec
+        self.cache_file = cache_file
+        self.index_file = index_file
+        self.worker_stats: Dict[int, WorkerStats] = {}
+
+    def iter_shards(self, paths) -> Iterator[List[str]]:
+        """
+        Splits the test items of the given files and folders into shards.
+        """
+        items = collect_items(paths)
+        while True:
+            shard = list(islice(items, self.shard_size))
+            if not shard:
+                return
+            yield shard
+
+    def run(self, paths) -> Iterator[ItemResult]:
+        """
+        Runs the checks on all test items of the given files and folders.
+
+        Parameters
+        ----------
+        paths: iterable of str
+            test item files and workspace folders
+
+        Returns
+        -------
+            iterator of ItemResult in the order of the test items
+        """
+        self.worker_stats = {}
+        # bounds the number of shards in flight, so results do not pile up in memory
+        max_pending = self.workers * 2
+
+        with ProcessPoolExecutor(max_workers=self.workers,
+                                 initializer=_init_worker,
+                                 initargs=(self.config_file, self.loader_spec,
+                                           self.cache_file, self.index_file)) as executor:
+            pending = deque()
+            for shard in self.iter_shards(paths):
+                pending.append((len(shard), executor.submit(_run_shard, shard)))
+                if len(pending) >= max_pending:
+                    yield from self._collect(*pending.popleft())
+            while pending:
+                yield from self._collect(*pending.popleft())
+
+    def _collect(self, shard_length, future) -> List[ItemResult]:
+        pid, seconds, item_results = future.result()
+        stats = self.worker_stats.setdefault(pid, WorkerStats())
+        stats.shards += 1
+        stats.items += shard_length
+        stats.seconds += seconds
+        return item_results
+
+    def format_worker_stats(self) -> str:
+        """
+        Returns the timing of all workers as readable text.
+        """
+        return '\n'.join(f'worker {pid}: {stats.items} items in {stats.shards} shards, '
+                         f'{stats.seconds:.2f} s'
+                         for pid, stats in sorted(self.worker_stats.items()))
@@ -0,0 +1,265 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Offline reader of ecu.test project files (.prj) and an index of the packages referenced by the
+projects, so the batch runner can check projects together with their packages without ecu.test.
+"""
+
+import os
+from typing import Dict, Iterable, Iterator, List, Set
+from xml.etree.ElementTree import iterparse
+
+from ..helper.CheckType import CheckType
+from .BatchRunner import get_item_type
+from .PackageFile import Attributes, PackageTags, get_required, is_read, local_name, release
+
+
+class ProjectTags:
+    """
+    Element and attribute names of the project file format read by ProjectFile:
+
+    .. code-block:: xml
+
+        <PROJECT>
+            <ATTRIBUTES>
+                <ATTRIBUTE NAME="Owner"><VALUE>...</VALUE></ATTRIBUTE>
+            </ATTRIBUTES>
+            <PACKAGEREFERENCE PATH="../Packages/Login.pkg"/>
+            <FOLDER NAME="Regression">
+                <PACKAGEREFERENCE PATH="../Packages/Regression/Speed.pkg"/>
+            </FOLDER>
+        </PROJECT>
+
+    The package references may be nested in folders; their paths are relative to the folder of
+    the project file. A project needs at least one child element. Other elements are ignored
+    together with their content.
+    """
+
+    PROJECT = 'PROJECT'
+    ATTRIBUTES = PackageTags.ATTRIBUTES
+    ATTRIBUTE = PackageTags.ATTRIBUTE
+    VALUE = PackageTags.VALUE
+    FOLDER = 'FOLDER'
+    PACKAGE_REFERENCE = 'PACKAGEREFERENCE'
+
+    # XML attributes
+    NAME = PackageTags.NAME
+    PATH = 'PATH'
+
+
+# read child elements of the elements of a project
+_CHILDREN = {
+    ProjectTags.PROJECT: (ProjectTags.ATTRIBUTES, ProjectTags.FOLDER,
+                          ProjectTags.PACKAGE_REFERENCE),
+    ProjectTags.FOLDER: (ProjectTags.FOLDER, ProjectTags.PACKAGE_REFERENCE),
+    ProjectTags.ATTRIBUTES: (ProjectTags.ATTRIBUTE,),
+    ProjectTags.ATTRIBUTE: (ProjectTags.VALUE,),
+}
+
+
+class ProjectFile:
+    """
+    Project read from a project file, provides the object API methods used by the checks.
+
+    Attributes
+    ----------
+    filename : str
+        path of the project file
+    Attributes : Attributes
+        the attributes of the project
+    package_references : list of str
+        normalized absolute paths of the referenced packages, in the order of the project file
+    """
+
+    def __init__(self, filename, attributes=None, package_references=None):
+        """
+        Constructor, see 'read_project'
+        """
+        self.filename = filename
+        self.Attributes = Attributes(attributes or {})  # pylint: disable=C0103
+        self.package_references = package_references or []
+
+    def GetName(self):  # pylint: disable=C0103
+        """
+        Name of the project, i.e. its file name without extension
+        """
+        return os.path.splitext(os.path.basename(self.filename))[0]
+
+    def GetFilename(self):  # pylint: disable=C0103
+        """
+        Path of the project file
+        """
+        return self.filename
+
+
+def read_project(filename) -> ProjectFile:
+    """
+    Reads a project file with a single streaming pass over its XML.
+
+    Parameters
+    ----------
+    filename: str
+        path of the project file
+
+    Returns
+    -------
+        ProjectFile
+
+    Raises
+    ------
+    xml.etree.ElementTree.ParseError
+        if the file is no well-formed XML
+    ValueError
+        if the read elements do not have the structure described by ProjectTags, e.g. if the
+        root element is no project or the project is empty
+    """
+    tags = ProjectTags
+    folder = os.path.dirname(os.path.abspath(filename))
+    attributes: Dict[str, str] = {}
+    references = []
+    seen = set()
+
+    # open elements as (name, element), the number of open skipped elements and the value of
+    # the open attribute
+    elements = []
+    skipped = 0
+    attribute_value = None
+    empty = True
+
+    for event, element in iterparse(filename, events=('start', 'end')):
+        tag = local_name(element.tag)
+
+        if event == 'start':
+            if not elements:
+                if tag != tags.PROJECT:
+                    raise ValueError(f'"{filename}" is no project file, root element is {tag!r}')
+            else:
+                empty = False
+                if skipped or not is_read(_CHILDREN, elements[-1][0], tag):
+                    # unknown elements are skipped with their content
+                    skipped += 1
+            elements.append((tag, element))
+            continue
+
+        elements.pop()
+        text = element.text or ''
+
+        if skipped:
+            skipped -= 1
+        elif tag == tags.VALUE:
+            attribute_value = text
+        elif tag == tags.ATTRIBUTE:
+            name = get_required(filename, element, tags.NAME)
+            attributes[name] = text.strip() if attribute_value is None else attribute_value
+            attribute_value = None
+        elif tag == tags.PACKAGE_REFERENCE:
+            path = os.path.normpath(os.path.join(folder,
+                                                 get_required(filename, element, tags.PATH)))
+            if path not in seen:
+                seen.add(path)
+                references.append(path)
+
+        release(elements, element)
+
+    if empty:
+        raise ValueError(f'"{filename}": project is empty')
+
+    return ProjectFile(filename, attributes=attributes, package_references=references)
+
+
+class PackageIndex:
+    """
+    In-memory index of the packages referenced by the projects, in both directions.
+
+    Attributes
+    ----------
+    packages : dict
+        project path and list of the referenced package paths
+    projects : dict
+        package path and list of the referencing project paths
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.packages: Dict[str, List[str]] = {}
+        self.projects: Dict[str, List[str]] = {}
+
+    def add(self, project):
+        """
+        Adds the package references of a project.
+
+        Parameters
+        ----------
+        project: ProjectFile
+        """
+        path = os.path.normpath(os.path.abspath(project.GetFilename()))
+        self.packages[path] = list(project.package_references)
+        for package in project.package_references:
+            self.projects.setdefault(package, []).append(path)
+
+    @property
+    def shared(self) -> int:
+        """
+        Number of packages referenced by more than one project.
+        """
+        return sum(len(projects) > 1 for projects in self.projects.values())
+
+
+def expand_references(paths: Iterable[str], index=None, missing=None,
+                      parsed=None) -> Iterator[str]:
+    """
+    Yields the given test items, each project followed by the packages it references. Every
+    test item is yielded once, even if several projects reference it or it is given as well.
+
+    Parameters
+    ----------
+    paths: iterable of str
+        test item paths, e.g. from BatchRunner.collect_items
+    index: PackageIndex
+        index the references of the projects are added to
+    missing: list
+        the referenced packages which do not exist are appended to it; they are not yielded
+    parsed: dict
+        the read projects are added to it, keyed by their normalized absolute path, before
+        they are yielded; see OfflineLoader.parsed_projects
+
+    Returns
+    -------
+        iterator of test item paths
+    """
+    index = index if index is not None else PackageIndex()
+    seen: Set[str] = set()
+
+    def first(path):
+        key = os.path.normpath(os.path.abspath(path))
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
+
+    for path in paths:
+        if not first(path):
+            continue
+        if get_item_type(path) != CheckType.PROJECT.value:
+            yield path
+            continue
+        try:
+            project = read_project(path)
+        except Exception:  # pylint: disable=W0703
+            # the error is reported when the project is checked
+            yield path
+            continue
+        index.add(project)
+        if parsed is not None:
+            parsed[os.path.normpath(os.path.abspath(path))] = project
+        yield path
+        for package in project.package_references:
+            if not os.path.isfile(package):
+                if missing is not None:
+                    missing.append(package)
+            elif first(package):
+                yield package
@@ -0,0 +1,242 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Persistent cache of the check results for incremental batch runs.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+from typing import Dict, Optional
+
+from .. import __version__
+from ..api.CheckResult import CheckResult
+from ..helper.Configuration import Configuration
+from ..helper.ecu_test_api import WPrint
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    path TEXT NOT NULL,
+    check_name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version TEXT NOT NULL,
+    results TEXT NOT NULL,
+    PRIMARY KEY (path, check_name)
+)
+'''
+
+# size of the blocks the test item files are hashed in
+_BLOCK_SIZE = 1 << 20
+
+
+def hash_file(path) -> str:
+    """
+    Returns the sha256 hex digest of the content of a file.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as stream:
+        for block in iter(lambda: stream.read(_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def package_source_hash() -> str:
+    """
+    Returns the sha256 hex digest of the source of all modules of the CustomChecks, i.e. the
+    checks, the api and the helpers they use. It is computed once per process.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digest = hashlib.sha256()
+    for folder, folders, files in os.walk(root):
+        folders[:] = sorted(name for name in folders if name != '__pycache__')
+        for name in sorted(files):
+            if name.endswith('.py'):
+                path = os.path.join(folder, name)
+                digest.update(os.path.relpath(path, root).encode('utf-8') + b'\0')
+                digest.update(hash_file(path).encode('ascii'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    SQLite cache of the check results of the test items. A cached result is reused as long as
+    its key is unchanged; the key consists of the content hash of the test item file, the check
+    name, the hash of the check's section in the config.yaml and the CustomChecks version
+    including the source of all its modules, the checks among them. Only results of successful
+    check runs are cached.
+
+    The cache can be used by several threads and processes at once.
+
+    Attributes
+    ----------
+    path : str
+        path of the SQLite database
+    """
+
+    def __init__(self, path, config=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        path: str
+            path of the SQLite database, created if it does not exist
+        config: Configuration
+            the configuration of the checks, the current configuration is used if not given
+        """
+        self.path = path
+        self._config = config
+        self._connection = None
+        self._lock = threading.Lock()
+        self._section_hashes = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        # called with the lock held; connected on first use, so that worker processes each
+        # open their own connection
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(_SCHEMA)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    @property
+    def config(self) -> Configuration:
+        """
+        Configuration of the checks
+        """
+        if self._config is None:
+            self._config = Configuration()
+        return self._config
+
+    def _section_hash(self, check_name) -> str:
+        # called after the configuration was refreshed, see 'item_keys'
+        key = (self.config.version, check_name)
+        section_hash = self._section_hashes.get(key)
+        if section_hash is None:
+            section = self.config.get_all_checks(check_name)
+            try:
+                text = json.dumps(section, sort_keys=True, default=str)
+            except TypeError:
+                # keys of different types cannot be sorted
+                text = repr(section)
+            section_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            self._section_hashes[key] = section_hash
+        return section_hash
+
+    def item_keys(self, path, checks) -> Optional[Dict[str, str]]:
+        """
+        Computes the cache keys of a test item for the given checks.
+
+        Parameters
+        ----------
+        path: str
+            path of the test item
+        checks: list of check instances
+
+        Returns
+        -------
+            dict of check name and key, None if the test item file cannot be read
+        """
+        try:
+            content_hash = hash_file(path)
+        except OSError as error:
+            WPrint(f'Could not hash "{path}", results are not cached: {error}')
+            return None
+
+        # a changed config.yaml is loaded again, so its new sections are hashed
+        self.config.refresh()
+        keys = {}
+        for check in checks:
+            check_name = check.GetName()
+            parts = (content_hash, check_name, self._section_hash(check_name), __version__,
+                     package_source_hash())
+            keys[check_name] = hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+        return keys
+
+    def lookup(self, path, keys) -> Dict[str, list]:
+        """
+        Returns the cached results of a test item whose keys are unchanged.
+
+        Parameters
+        ----------
+        path: str
+            path of the test item
+        keys: dict
+            check name and key, see 'item_keys'
+
+        Returns
+        -------
+            dict of check name and list of CheckResult
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                'SELECT check_name, key, results FROM results WHERE path = ?',
+                (os.path.abspath(path),)).fetchall()
+
+        return {check_name: [CheckResult.from_dict(data) for data in json.loads(results)]
+                for check_name, key, results in rows if keys.get(check_name) == key}
+
+    def store(self, path, keys, check_results):
+        """
+        Stores the results of a test item, replacing the entries with outdated keys.
+
+        Parameters
+        ----------
+        path: str
+            path of the test item
+        keys: dict
+            check name and key, see 'item_keys'
+        check_results: dict
+            check name and list of CheckResult
+        """
+        path = os.path.abspath(path)
+        rows = [(path, check_name, keys[check_name], __version__,
+                 json.dumps([result.to_dict() for result in results]))
+                for check_name, results in check_results.items()]
+        if not rows:
+            return
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                                       rows)
+
+    def evict(self) -> int:
+        """
+        Removes the stale entries: entries of other CustomChecks versions and of test items
+        which no longer exist.
+
+        Returns
+        -------
+            number of removed entries
+        """
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                removed = connection.execute('DELETE FROM results WHERE version != ?',
+                                             (__version__,)).rowcount
+                missing = [(path,) for (path,) in
+                           connection.execute('SELECT DISTINCT path FROM results')
+                           if not os.path.exists(path)]
+                removed += connection.executemany('DELETE FROM results WHERE path = ?',
+                                                  missing).rowcount
+        return removed
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,100 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Batch execution of the CustomChecks with a thread pool, for object APIs served over a remote
+channel where most of the time is spent waiting for the API calls.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
+
+from .BatchRunner import BatchRunner, ItemResult, collect_items
+
+
+class ThreadedRunner:
+    """
+    Overlaps the object API calls of several test items with a thread pool. Every thread uses
+    its own check instances, the loader is shared by all threads. At most 'max_in_flight' test
+    items are processed or waiting to be consumed at once, further items are only read when the
+    consumer takes results. The results are returned in the order of the test items.
+
+    Attributes
+    ----------
+    threads : int
+        number of threads
+    max_in_flight : int
+        maximum number of test items in flight
+    loader : object
+        object API stand-in shared by all threads, see BatchRunner
+    cache : ResultCache
+        result cache shared by all threads, see BatchRunner
+    index : WorkspaceIndex
+        workspace index shared by all threads, see BatchRunner
+    """
+
+    def __init__(self, threads=8, max_in_flight=None, loader=None, checks=None, cache=None,
+                 index=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        threads: int
+            number of threads
+        max_in_flight: int
+            maximum number of test items in flight, twice the number of threads if not given
+        loader: object
+            object API stand-in, the ecu.test Object API is used if not given
+        checks: dict
+            check type and list of check classes, all Check* modules are used if not given
+        cache: ResultCache
+            cache of the results of unchanged test items
+        index: WorkspaceIndex
+            index of the package metadata
+        """
+        self.threads = max(1, threads)
+        self.max_in_flight = max(1, max_in_flight or self.threads * 2)
+        self.loader = loader
+        self.checks = checks
+        self.cache = cache
+        self.index = index
+        self._local = threading.local()
+
+    def _get_runner(self) -> BatchRunner:
+        runner = getattr(self._local, 'runner', None)
+        if runner is None:
+            runner = BatchRunner(loader=self.loader, checks=self.checks, cache=self.cache,
+                                 index=self.index)
+            self._local.runner = runner
+        return runner
+
+    def _run_item(self, path) -> List[ItemResult]:
+        return self._get_runner().run_item(path)
+
+    def run(self, paths) -> Iterator[ItemResult]:
+        """
+        Runs the checks on all test items of the given files and folders.
+
+        Parameters
+        ----------
+        paths: iterable of str
+            test item files and workspace folders
+
+        Returns
+        -------
+            iterator of ItemResult in the order of the test items
+        """
+        with ThreadPoolExecutor(max_workers=self.threads,
+                                thread_name_prefix='CustomChecks') as executor:
+            pending = deque()
+            for path in collect_items(paths):
+                # back-pressure: wait for the oldest item before reading the next one
+                if len(pending) >= self.max_in_flight:
+                    yield from pending.popleft().result()
+                pending.append(executor.submit(self._run_item, path))
+            while pending:
+                yield from pending.popleft().result()
@@ -0,0 +1,300 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Persistent index of the package metadata of a workspace, so checks which only need this
+metadata run without opening the packages.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import List, Optional
+
+from .. import __version__
+from ..helper.ecu_test_api import WPrint
+from .PackageFile import Attributes, Mapping, MappingItem
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS packages (
+    path TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    version TEXT NOT NULL,
+    name TEXT,
+    filename TEXT,
+    folder TEXT,
+    test_case INTEGER,
+    package_version TEXT,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS mapping_items (
+    path TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    reference_name TEXT,
+    access_type TEXT
+);
+CREATE INDEX IF NOT EXISTS attributes_path ON attributes (path);
+CREATE INDEX IF NOT EXISTS mapping_items_path ON mapping_items (path);
+'''
+
+# tables with one row per part of a package
+_PART_TABLES = ('attributes', 'mapping_items')
+
+
+class IndexedPackage:
+    """
+    Package read from the workspace index, provides the object API methods of the indexed
+    values used by the checks declaring 'INDEXED': name, file name, test case flag, version,
+    description, attributes and the local mapping.
+
+    Attributes
+    ----------
+    path : str
+        absolute path of the package file
+    content_hash : str
+        hash of the package file the values were read from
+    Attributes : Attributes
+        the attributes of the package
+    """
+
+    def __init__(self, path, content_hash, name, filename, test_case, version, description,
+                 attributes, mapping_items):
+        """
+        Constructor, see WorkspaceIndex.lookup
+        """
+        self.path = path
+        self.content_hash = content_hash
+        self.name = name
+        self.filename = filename
+        self.test_case = test_case
+        self.version = version
+        self.description = description
+        self.Attributes = Attributes(attributes)  # pylint: disable=C0103
+        self.mapping_items = mapping_items
+
+    def GetName(self):  # pylint: disable=C0103
+        """
+        Name of the package
+        """
+        return self.name
+
+    def GetFilename(self):  # pylint: disable=C0103
+        """
+        File name of the package
+        """
+        return self.filename
+
+    def HasTestCaseFlag(self):  # pylint: disable=C0103
+        """
+        Whether the test case flag is set
+        """
+        return self.test_case
+
+    def GetVersion(self):  # pylint: disable=C0103
+        """
+        Version of the package
+        """
+        return self.version
+
+    def GetDescription(self):  # pylint: disable=C0103
+        """
+        Description of the package
+        """
+        return self.description
+
+    def GetMapping(self):  # pylint: disable=C0103
+        """
+        Local mapping of the package
+        """
+        return Mapping(list(self.mapping_items))
+
+
+class WorkspaceIndex:
+    """
+    SQLite index of the package metadata, keyed by the path and the content hash of the package
+    files. A package is indexed whenever it is opened by the batch runner, and its entry is
+    used as long as the file is unchanged. Checks declaring 'INDEXED' then run on the
+    IndexedPackage instead of the opened package.
+
+    Only the rows of the looked up package are read, through the indexes on the package path,
+    so every worker reads just the packages it checks; aggregates over the whole workspace are
+    computed by SQLite, see 'query'. The index can be used by several threads and processes at
+    once.
+
+    Attributes
+    ----------
+    path : str
+        path of the SQLite database
+    """
+
+    def __init__(self, path):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        path: str
+            path of the SQLite database, created if it does not exist
+        """
+        self.path = path
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # called with the lock held; connected on first use, so that worker processes each
+        # open their own connection
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(_SCHEMA)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def lookup(self, path, content_hash) -> Optional[IndexedPackage]:
+        """
+        Returns the indexed package if the package file is unchanged.
+
+        Parameters
+        ----------
+        path: str
+            path of the package
+        content_hash: str
+            hash of the current content of the package file, see ResultCache.hash_file
+
+        Returns
+        -------
+            IndexedPackage, None if the package is not indexed or changed
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            connection = self._connect()
+            # the rows of the package are read from one snapshot of the database
+            connection.execute('BEGIN')
+            try:
+                row = connection.execute(
+                    'SELECT name, filename, test_case, package_version, description '
+                    'FROM packages WHERE path = ? AND hash = ? AND version = ?',
+                    (path, content_hash, __version__)).fetchone()
+                if row is None:
+                    return None
+                name, filename, test_case, package_version, description = row
+
+                attributes = {key: json.loads(value) for key, value in connection.execute(
+                    'SELECT name, value FROM attributes WHERE path = ? ORDER BY rowid', (path,))}
+                mapping_items = [MappingItem(reference_name, access_type)
+                                 for reference_name, access_type in connection.execute(
+                                     'SELECT reference_name, access_type FROM mapping_items '
+                                     'WHERE path = ? ORDER BY position', (path,))]
+            finally:
+                connection.rollback()
+        return IndexedPackage(path, content_hash, name, filename, bool(test_case),
+                              package_version, description, attributes, mapping_items)
+
+    def store(self, path, content_hash, package) -> bool:
+        """
+        Indexes an opened package, replacing its previous entry.
+
+        Parameters
+        ----------
+        path: str
+            path of the package
+        content_hash: str
+            hash of the content of the package file
+        package: Package object or its ItemSnapshot
+
+        Returns
+        -------
+            True if the package was indexed, False if its values could not be read
+        """
+        path = os.path.abspath(path)
+        try:
+            filename = package.GetFilename()
+            row = (path, content_hash, __version__, package.GetName(), filename,
+                   os.path.dirname(filename) if filename else None,
+                   bool(package.HasTestCaseFlag()), package.GetVersion(),
+                   package.GetDescription())
+            attributes = [(path, name, json.dumps(value, default=str))
+                          for name, value in package.Attributes.GetNamesAndValues().items()]
+            mapping_items = [(path, position, mapping_item.GetReferenceName(),
+                              mapping_item.GetAccessType())
+                             for position, mapping_item
+                             in enumerate(package.GetMapping().GetItems())]
+        except Exception as error:  # pylint: disable=W0703
+            WPrint(f'Could not index "{path}": {error}')
+            return False
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._delete(connection, [(path,)])
+                connection.execute('INSERT INTO packages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', row)
+                connection.executemany('INSERT INTO attributes VALUES (?, ?, ?)', attributes)
+                connection.executemany('INSERT INTO mapping_items VALUES (?, ?, ?, ?)',
+                                       mapping_items)
+        return True
+
+    @staticmethod
+    def _delete(connection, paths):
+        connection.executemany('DELETE FROM packages WHERE path = ?', paths)
+        for table in _PART_TABLES:
+            connection.executemany(f'DELETE FROM {table} WHERE path = ?', paths)
+
+    def query(self, sql, parameters=()) -> List[tuple]:
+        """
+        Runs a read-only query over the whole index, e.g. to count the packages per folder:
+        "SELECT folder, COUNT(*) FROM packages GROUP BY folder".
+
+        Returns
+        -------
+            list of the result rows
+
+        Raises
+        ------
+        sqlite3.OperationalError
+            if the statement would modify the index
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute('PRAGMA query_only=ON')
+            try:
+                return connection.execute(sql, parameters).fetchall()
+            finally:
+                if connection.in_transaction:
+                    connection.rollback()
+                connection.execute('PRAGMA query_only=OFF')
+
+    def evict(self) -> int:
+        """
+        Removes the entries of other CustomChecks versions and of packages which no longer
+        exist.
+
+        Returns
+        -------
+            number of removed packages
+        """
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                stale = [(path,) for path, version in
+                         connection.execute('SELECT path, version FROM packages')
+                         if version != __version__ or not os.path.exists(path)]
+                self._delete(connection, stale)
+        return len(stale)
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,9 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import sys
+
+from .BatchRunner import main
+
+sys.exit(main())
@@ -0,0 +1,272 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import atexit
+import operator
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from .ConfigKeys import ProfilingKeys as prk
+from .ecu_test_api import SPrint
+
+# enables the recording of the object API calls, independent of the config.yaml
+ENV_RECORD_API = 'CUSTOMCHECKS_RECORD_API'
+
+# values returned by the object API which are not wrapped
+_PLAIN_TYPES = (str, bytes, int, float, bool, type(None), dict)
+
+# the active recorder, None if the recording is disabled
+_RECORDER = None
+_RECORDER_LOCK = threading.Lock()
+
+
+class MethodStats:
+    """
+    Calls of one object API method by one check.
+    """
+
+    __slots__ = ('calls', 'duplicates', 'seconds')
+
+    def __init__(self):
+        self.calls = 0
+        self.duplicates = 0
+        self.seconds = 0.0
+
+
+class ApiRecorder:
+    """
+    Records the object API calls of the checks: number of calls, cumulative latency and
+    duplicate calls, i.e. calls of the same method with the same arguments on the same object
+    for the same test item. The calls are attributed to the check which is currently running.
+
+    Attributes
+    ----------
+    stats : dict
+        (check name, method name) and MethodStats
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def wrap(self, item) -> 'RecordingProxy':
+        """
+        Wraps a test item; calls of a new test item are no duplicates of the previous ones.
+        """
+        if getattr(self._local, 'item', None) is not item:
+            self._local.item = item
+            self._local.seen = set()
+            # keeps the called objects alive, so their ids are not reused
+            self._local.targets = []
+        return RecordingProxy(item, self)
+
+    @contextmanager
+    def check(self, check_name):
+        """
+        Attributes the object API calls within the with block to the given check.
+        """
+        previous = getattr(self._local, 'check_name', None)
+        self._local.check_name = check_name
+        try:
+            yield
+        finally:
+            self._local.check_name = previous
+
+    def record(self, target, method_name, args, kwargs, seconds):
+        """
+        Records one call of an object API method.
+        """
+        try:
+            call = (id(target), method_name, args, tuple(sorted(kwargs.items())))
+            hash(call)
+        except TypeError:
+            call = (id(target), method_name, repr(args), repr(sorted(kwargs.items())))
+
+        local = self._local
+        seen = getattr(local, 'seen', None)
+        duplicate = False
+        if seen is not None:
+            duplicate = call in seen
+            if not duplicate:
+                seen.add(call)
+                local.targets.append(target)
+
+        key = (getattr(local, 'check_name', None) or '(no check)', method_name)
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = MethodStats()
+            stats.calls += 1
+            stats.duplicates += duplicate
+            stats.seconds += seconds
+
+    def report(self) -> str:
+        """
+        Returns the recorded calls per check as tables, sorted by cumulative latency.
+        """
+        with self._lock:
+            items = list(self.stats.items())
+
+        per_check = {}
+        for (check_name, method_name), stats in items:
+            per_check.setdefault(check_name, []).append((method_name, stats))
+
+        lines = []
+        for check_name in sorted(per_check):
+            calls = sorted(per_check[check_name], key=lambda item: item[1].seconds, reverse=True)
+            lines.append(f'Object API calls of {check_name}:')
+            lines.append(f'{"calls":>10} {"duplicates":>10} {"total ms":>10}  method')
+            for method_name, stats in calls:
+                lines.append(f'{stats.calls:10d} {stats.duplicates:10d} '
+                             f'{stats.seconds * 1000:10.3f}  {method_name}')
+        return '\n'.join(lines)
+
+
+class RecordingProxy:
+    """
+    Transparent proxy of an object API object which records its method calls. Objects returned
+    by the methods are wrapped as well.
+    """
+
+    __slots__ = ('_target', '_recorder', '_type_name')
+
+    def __init__(self, target, recorder, type_name=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        target: object from the object API
+        recorder: ApiRecorder
+        type_name: str
+            name of the object type used in the method names, the class name if not given
+        """
+        self._target = target
+        self._recorder = recorder
+        self._type_name = type_name or type(target).__name__
+
+    def _wrap_result(self, value):
+        if isinstance(value, _PLAIN_TYPES):
+            return value
+        if isinstance(value, (list, tuple)):
+            return type(value)(self._wrap_result(element) for element in value)
+        return RecordingProxy(value, self._recorder)
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if not callable(value):
+            # e.g. the 'Attributes' of a test item
+            return self._wrap_result(value)
+
+        target = self._target
+        recorder = self._recorder
+        method_name = f'{self._type_name}.{name}'
+
+        def recorded(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return self._wrap_result(value(*args, **kwargs))
+            finally:
+                recorder.record(target, method_name, args, kwargs, time.perf_counter() - start)
+        return recorded
+
+    def _recorded(self, name, function, *args):
+        start = time.perf_counter()
+        try:
+            return function(self._target, *args)
+        finally:
+            self._recorder.record(self._target, f'{self._type_name}.{name}', args, {},
+                                  time.perf_counter() - start)
+
+    def __str__(self):
+        return self._recorded('__str__', str)
+
+    def __iter__(self):
+        # e.g. collections of the object API, their elements are wrapped as well
+        return iter(self._wrap_result(self._recorded('__iter__', list)))
+
+    def __len__(self):
+        return self._recorded('__len__', len)
+
+    def __bool__(self):
+        return self._recorded('__bool__', bool)
+
+    def __eq__(self, other):
+        if isinstance(other, RecordingProxy):
+            other = other._target
+        return self._recorded('__eq__', operator.eq, other)
+
+    def __hash__(self):
+        return hash(self._target)
+
+
+def type_name(value) -> str:
+    """
+    Returns the type name of an object API object, also if it is wrapped by a RecordingProxy.
+    """
+    if isinstance(value, RecordingProxy):
+        return value._type_name  # pylint: disable=W0212
+    return type(value).__name__
+
+
+def get_recorder():
+    """
+    Returns the active recorder, None if the recording is disabled.
+    """
+    return _RECORDER
+
+
+def configure(config):
+    """
+    Enables the recording if the environment variable CUSTOMCHECKS_RECORD_API is set or
+    'RecordApiCalls' is enabled in the 'Profiling' section of the config.yaml. The recording is
+    never disabled again within one process. The report is emitted when the process exits, or
+    by 'emit_report'.
+
+    Parameters
+    ----------
+    config: Configuration object
+
+    Returns
+    -------
+        the active recorder, None if the recording is disabled
+    """
+    global _RECORDER  # pylint: disable=W0603
+    if _RECORDER is not None:
+        return _RECORDER
+
+    section = config.config.get(prk.PROFILING) if isinstance(config.config, dict) else None
+    enabled = os.environ.get(ENV_RECORD_API, '') not in ('', '0') \
+        or (isinstance(section, dict) and section.get(prk.RECORD_API_CALLS))
+    if not enabled:
+        return None
+
+    with _RECORDER_LOCK:
+        if _RECORDER is None:
+            _RECORDER = ApiRecorder()
+            atexit.register(emit_report)
+    return _RECORDER
+
+
+def emit_report(print_function=None):
+    """
+    Emits the report of the active recorder. The recorded calls are reset afterwards.
+
+    Parameters
+    ----------
+    print_function: callable
+        function the report is printed with, SPrint if not given
+    """
+    recorder = _RECORDER
+    if recorder is None or not recorder.stats:
+        return
+
+    (print_function or SPrint)(recorder.report())
+    recorder.stats = {}
@@ -2,12 +2,71 @@
 #
 # SPDX-License-Identifier: MIT
 
-import re
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
 
 from ..api.CheckResult import CheckResult
 from .CheckType import CheckType
 from .ConfigKeys import ParameterKeys as pk
 
+
+@dataclass(frozen=True)
+class AttributeRule:
+    """
+    Parsed parameters of one attribute, see parse_attribute_rules.
+    """
+
+    name: str
+    # the configured value: flag, list of allowed options or dict with the RegexPattern
+    value: Any
+    # allowed options of a list value
+    options: frozenset = frozenset()
+    regex: Optional[str] = None
+    # compiled pattern of a dict value, None if it is missing or invalid (reported once as
+    # config error)
+    pattern: Any = None
+
+
+@dataclass(frozen=True)
+class AttributeRules:
+    """
+    Parsed parameters of CheckPackageAttributes and CheckProjectAttributes.
+    """
+
+    rules: Tuple[AttributeRule, ...]
+
+
+def parse_attribute_rules(parameters, config) -> AttributeRules:
+    """
+    Parses the parameters of an attribute check once, the allowed options are collected in sets
+    and the patterns are looked up in the configuration.
+
+    Parameters
+    ----------
+    parameters - the parameters from the config.yaml for the attribute check
+    config - the current config.yaml object
+
+    Returns
+    -------
+    AttributeRules in the order of the parameters
+
+    """
+    rules = []
+    for name, value in parameters.items():
+        if isinstance(value, bool):
+            rules.append(AttributeRule(name, value))
+        elif isinstance(value, list):
+            rules.append(AttributeRule(name, value, options=frozenset(value)))
+        elif isinstance(value, dict):
+            regex = value.get(pk.REGEX_PATTERN)
+            rules.append(AttributeRule(name, value, regex=regex,
+                                       pattern=config.get_regex(regex)
+                                       if regex is not None else None))
+        else:
+            rules.append(AttributeRule(name, value))
+    return AttributeRules(tuple(rules))
+
+
 def check_attributes(test_item, check_type, config, parameters):
     """
     Generic attribute checker, which proceeds conditionally, depending on different test_item types
@@ -24,92 +83,101 @@ def check_attributes(test_item, check_type, config, parameters):
     check results for unsuccessful checks as a list of CheckResult
 
     """
+    return list(iter_check_attributes(test_item, check_type, config, parameters))
 
-    # get all attibutes (dict of name and value pairs) from object
-    attr_item_dict = test_item.Attributes.GetNamesAndValues()
 
-    param_keys_in_attr = []
-    param_keys_not_in_attr = []
+def iter_check_attributes(test_item, check_type, config, parameters):
+    """
+    Generic attribute checker like check_attributes, yields the results one by one
 
-    for key in parameters.keys():
-        if key in attr_item_dict:
-            param_keys_in_attr.append(key)
-        else:
-            param_keys_not_in_attr.append(key)
+    Parameters
+    ----------
+    test_item - Package or Project(from Object API)
+    check_type - check type corresponding to test_item (value of enum CheckType)
+    config - the current config.yaml object
+    parameters - the parameters from the config.yaml for the attribute check or AttributeRules
+
+    Returns
+    -------
+    iterator of CheckResult for unsuccessful checks
+
+    """
 
-    # init clean check result list
-    checkResults = []
+    if not isinstance(parameters, AttributeRules):
+        parameters = parse_attribute_rules(parameters, config)
+
+    # get all attibutes (dict of name and value pairs) from object
+    attr_item_dict = test_item.Attributes.GetNamesAndValues()
 
     # go through all parameters also found in test_item attributes - check: does it have allowed
     # values?
-    for key in param_keys_in_attr:
-        value = parameters[key]
+    for rule in parameters.rules:
+        key, value = rule.name, rule.value
+        if key not in attr_item_dict:
+            continue
 
         if isinstance(value, bool):
             if len(attr_item_dict[key]) == 0 and value is True:
-                checkResults.append(CheckResult(f'"{key}" must not be empty!'))
+                yield CheckResult(f'"{key}" must not be empty!', rule=key)
             elif len(attr_item_dict[key]) != 0 and value is False:
-                checkResults.append(CheckResult(f'"{key}" must not be set!'))
+                yield CheckResult(f'"{key}" must not be set!', rule=key)
 
         # scheme for validating selection attributes
         elif isinstance(value, list):
-            # Convert the comma separated string into a set
-            # Check if the set of values provided in the project is a subset of the config values
-            if not set(attr_item_dict[key].split(",")).issubset(value):
-                checkResults.append(CheckResult(f'"{key}" no valid option out of: {str(value)}'))
+            # Check if the values provided in the comma separated string are config values
+            if not rule.options.issuperset(attr_item_dict[key].split(",")):
+                yield CheckResult(f'"{key}" no valid option out of: {str(value)}', rule=key)
 
         # Scheme for applying a regex pattern to an attribute value
         elif isinstance(value, dict):
             # Check if the necessary fields exist
             if pk.REGEX_PATTERN not in value:
-                checkResults.append(CheckResult(f'No field: "{pk.REGEX_PATTERN}" was provided!'))
+                yield CheckResult(f'No field: "{pk.REGEX_PATTERN}" was provided!', rule=key)
                 continue
 
-            regex = value[pk.REGEX_PATTERN]
-            # Check if a valid pattern was provided
-            try:
-                re.compile(regex)
-            except re.error:
-                checkResults.append(CheckResult(f'{regex} is not a valid pattern! '
-                                                f'Check "{config.config_rel_path}"!'))
+            regex = rule.regex
+            # invalid patterns are reported once as config error
+            pattern = rule.pattern
+            if pattern is None:
                 continue
-
             ### CheckPackageAttributes
             if check_type == CheckType.PACKAGE.value:
                 # Check if key is set
                 if len(attr_item_dict[key]) == 0:
-                    checkResults.append(CheckResult(f'"{key}" must not be empty!'))
+                    yield CheckResult(f'"{key}" must not be empty!', rule=key)
                 # Check if pattern matches the provided value
-                elif not re.search(regex, str(attr_item_dict.get(key))):
+                elif not pattern.search(str(attr_item_dict.get(key))):
                     # check if message for pattern should be more specific
                     if pk.CUSTOM_MESSAGE in value:
                         msg = f'"{key}" does not match pattern. "{value.get(pk.CUSTOM_MESSAGE)}"'
                     else:
                         msg = f'"{key}" does not match pattern: "{regex}"'
-                    checkResults.append(CheckResult(msg))
+                    yield CheckResult(msg, rule=key)
 
             ### CheckProjectAttributes
             elif check_type == CheckType.PROJECT.value:
                 # Check if pattern matches the provided value
-                if not re.search(regex, str(attr_item_dict.get(key))):
+                if not pattern.search(str(attr_item_dict.get(key))):
                     if pk.CUSTOM_MESSAGE in value:
                         msg = f'"{key}" does not match pattern: {value.get(pk.REGEX_DESCRIPTION)}'
                     else:
                         msg = f'"{key}" does not match conditions: {regex}'
-                    checkResults.append(CheckResult(msg))
+                    yield CheckResult(msg, rule=key)
 
     # go through all parameters not found in test_item attributes
-    for key in param_keys_not_in_attr:
-        value = parameters[key]
+    for rule in parameters.rules:
+        key, value = rule.name, rule.value
+        if key in attr_item_dict:
+            continue
 
         ### CheckPackageAttributes
         if check_type == CheckType.PACKAGE.value:
             if isinstance(value, bool) and value is True:
-                checkResults.append(CheckResult(f'"{key}" must not be empty!'))
+                yield CheckResult(f'"{key}" must not be empty!', rule=key)
 
             elif isinstance(value, list) and value:
-                checkResults.append(CheckResult(f'"{key}" must not be empty! Allowed options: '
-                                                f'{str(value)}'))
+                yield CheckResult(f'"{key}" must not be empty! Allowed options: '
+                                  f'{str(value)}', rule=key)
 
             elif isinstance(value, dict):
                 # check if message for value should be more specific
@@ -118,11 +186,9 @@ def check_attributes(test_item, check_type, config, parameters):
                 else:
                     msg = f'"{key}" must not be empty! Intended pattern: ' \
                               f'"{value.get(pk.REGEX_PATTERN)}"'
-                checkResults.append(CheckResult(msg))
+                yield CheckResult(msg, rule=key)
 
         ### CheckProjectAttributes
         if check_type == CheckType.PROJECT.value:
             if value is not False:
-                checkResults.append(CheckResult(f'"{key}" must not be empty'))
-
-    return checkResults
+                yield CheckResult(f'"{key}" must not be empty', rule=key)
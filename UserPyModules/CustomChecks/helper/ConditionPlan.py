@@ -0,0 +1,146 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import re
+
+from .ConfigKeys import ConditionKeys as ck
+from .ecu_test_api import WPrint
+
+# evaluation costs of the conditions, cheap conditions are evaluated first
+COST_INVALID = 0
+COST_TESTCASEFLAG = 1
+COST_NAME = 2
+COST_FOLDER = 3
+
+
+class ConditionPlan:
+    """
+    The precompiled 'Conditions' section of one check in the config.yaml.
+
+    The conditions are compiled once per configuration version into a list of predicates, which
+    is ordered by evaluation cost. The evaluation stops at the first failing predicate.
+
+    Attributes
+    ----------
+    predicates : tuple of callable
+        predicates taking the check object, ordered by evaluation cost
+    unknown : tuple of str
+        condition keys which are not implemented
+    """
+
+    __slots__ = ('predicates', 'unknown')
+
+    def __init__(self, predicates, unknown):
+        """
+        Constructor
+        """
+        self.predicates = predicates
+        self.unknown = unknown
+
+    def evaluate(self, check_object) -> bool:
+        """
+        Evaluates the conditions for the given check object.
+
+        Parameters
+        ----------
+        check_object: ecu.test Package-Object, Project-Object from Object Api
+
+        Returns
+        -------
+        True if all conditions are fulfilled
+        """
+        for condition in self.unknown:
+            WPrint(f'Condition "{condition}" is not implemented!')
+
+        for predicate in self.predicates:
+            if not predicate(check_object):
+                return False
+
+        return True
+
+
+def _never(check_object):  # pylint: disable=W0613
+    # condition with an invalid pattern, already reported as config error
+    return False
+
+
+def _name_predicate(pattern):
+    if pattern is None:
+        return _never
+
+    def predicate(check_object):
+        return pattern.search(check_object.GetName()) is not None
+    return predicate
+
+
+def _folder_predicate(pattern):
+    if pattern is None:
+        return _never
+
+    def predicate(check_object):
+        return pattern.search(check_object.GetFilename()) is not None
+    return predicate
+
+
+def _test_case_flag_predicate(expected):
+    def predicate(check_object):
+        return expected == check_object.HasTestCaseFlag()
+    return predicate
+
+
+def _invalid_predicate(error):
+    # a broken condition is reported on evaluation, just like an uncompiled one
+    def predicate(check_object):  # pylint: disable=W0613
+        raise error
+    return predicate
+
+
+def _compile(regex, regexes):
+    if regexes is None:
+        return re.compile(regex)
+    return regexes.get(regex)
+
+
+def compile_conditions(conditions, regexes=None) -> ConditionPlan:
+    """
+    Compiles the 'Conditions' section of a check into a ConditionPlan.
+
+    Parameters
+    ----------
+    conditions: dict
+        the Conditions entry from config.yaml
+    regexes: RegexRegistry
+        the compiled patterns of the configuration, patterns are compiled here if not given
+
+    Returns
+    -------
+        ConditionPlan
+    """
+    planned = []
+    unknown = []
+
+    for condition in conditions or ():
+        try:
+            # check package name pattern
+            if condition in (ck.PACKAGE_NAME, ck.PROJECT_NAME):
+                pattern = _compile(conditions[condition][ck.REGEX_PATTERN], regexes)
+                planned.append((COST_NAME, _name_predicate(pattern)))
+            # check package path pattern
+            elif condition in (ck.PACKAGE_FOLDER, ck.PROJECT_FOLDER):
+                pattern = _compile(conditions[condition][ck.REGEX_PATTERN], regexes)
+                planned.append((COST_FOLDER, _folder_predicate(pattern)))
+            # check package properties
+            elif condition == ck.PACKAGE_PROPERTIES:
+                expected = conditions[condition][ck.TESTCASEFLAG]
+                planned.append((COST_TESTCASEFLAG, _test_case_flag_predicate(expected)))
+            # error handling
+            else:
+                unknown.append(condition)
+        except (KeyError, TypeError, re.error) as error:
+            planned.append((COST_INVALID, _invalid_predicate(error)))
+
+    # stable sort keeps the configured order for conditions of equal cost
+    planned.sort(key=lambda item: item[0])
+
+    return ConditionPlan(tuple(predicate for _, predicate in planned), tuple(unknown))
@@ -44,3 +44,13 @@ class ConditionKeys:
     REGEX_PATTERN = 'RegexPattern'
     TESTCASEFLAG = 'TestCaseFlag'
     ENABLED = 'Enabled'
+
+@dataclass(frozen=True)
+class ProfilingKeys:
+    """
+    This class supplies the keys of the optional 'Profiling' section of the config.yaml.
+    """
+    PROFILING = 'Profiling'
+    ENABLED = 'Enabled'
+    PSTATS_FILE = 'PstatsFile'
+    RECORD_API_CALLS = 'RecordApiCalls'
@@ -2,17 +2,22 @@
 #
 # SPDX-License-Identifier: MIT
 
+import hashlib
+import itertools
+import json
+import marshal
 import os
 import shutil
-from io import open
-from yaml import safe_load
+import tempfile
+import threading
+from dataclasses import asdict, dataclass, field
+from io import BytesIO, TextIOWrapper, open
 
-try:
-    from tts.core.logging import WPrint
-    from tts.core.api.internalApi.Api import Api
-    api = Api()
-except:
-    from logging import warning as WPrint
+from .. import __version__
+from .ConditionPlan import compile_conditions
+from .RegexRegistry import RegexRegistry
+from .SchemaValidator import format_error, validate
+from .ecu_test_api import EPrint, WPrint, get_internal_api
 
 
 # folder name for the configuration file
@@ -22,155 +27,535 @@ CONFIGURATION_FOLDER = 'CustomChecks'
 CONFIGURATION_FILE = 'config.yaml'
 CONFIGURATION_TEMPLATE_FILE = 'config_template.yaml'
 
+# binary snapshot of the parsed configuration, written next to the configuration file
+SNAPSHOT_SUFFIX = '.snapshot'
+# format of the snapshot, to be increased whenever its content changes
+SNAPSHOT_FORMAT = 3
+# marshal version of the snapshot, readable by all supported Python versions
+SNAPSHOT_MARSHAL_VERSION = 4
+
+# building blocks of the JSON_SCHEMA
+_STRINGS_SCHEMA = {"type": "array", "items": {"type": "string"}}
+_PATTERN_SCHEMA = {
+    "type": "object",
+    "required": ["RegexPattern"],
+    "properties": {
+        "RegexPattern": {"type": "string"},
+        "CustomMessage": {"type": "string"},
+        "RegexDescription": {"type": "string"}
+    },
+    "additionalProperties": False
+}
+_CONDITIONS_SCHEMA = {
+    "type": ["object", "null"],
+    "properties": {
+        "ProjectName": _PATTERN_SCHEMA,
+        "PackageName": _PATTERN_SCHEMA,
+        "ProjectFolder": _PATTERN_SCHEMA,
+        "PackageFolder": _PATTERN_SCHEMA,
+        "PackageProperties": {
+            "type": "object",
+            "required": ["TestCaseFlag"],
+            "properties": {
+                "TestCaseFlag": {"type": "boolean"}
+            },
+            "additionalProperties": False
+        }
+    }
+    # unknown conditions are no error, they are reported as not implemented when evaluated
+}
+_ATTRIBUTES_SCHEMA = {
+    "type": "object",
+    "additionalProperties": {
+        "type": ["boolean", "array", "object"],
+        "items": {"type": "string"},
+        "required": ["RegexPattern"],
+        "properties": _PATTERN_SCHEMA["properties"],
+        "additionalProperties": False
+    }
+}
+_VARIABLE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "Name": _PATTERN_SCHEMA,
+        "Description": _PATTERN_SCHEMA
+    },
+    "additionalProperties": False
+}
+
+
+def _check_schema(parameters_schema):
+    # section of a CustomCheck: the 'Enabled' flag and its checks, e.g. 'CheckTestCases'
+    return {
+        "type": "object",
+        "properties": {
+            "Enabled": {"type": "boolean"}
+        },
+        "additionalProperties": {
+            "type": "object",
+            "required": ["Parameters"],
+            "properties": {
+                "Conditions": _CONDITIONS_SCHEMA,
+                "Parameters": parameters_schema
+            },
+            "additionalProperties": False
+        }
+    }
+
+
 JSON_SCHEMA = {
     "$schema": "http://json-schema.org/draft-07/schema",
-    "required": [
-        "CheckPackageGeneralInformation",
-        "CheckPackageContentNotEmpty",
-        "CheckPackageForbiddenContent",
-        "CheckPackageStructure"
-    ],
     "type": "object",
     "properties": {
-        "CheckPackageGeneralInformation": {
-            "required": [
-                "Execution",
-                "Parameters"
-            ],
+        "CheckProjectAttributes": _check_schema(_ATTRIBUTES_SCHEMA),
+        "CheckPackageAttributes": _check_schema(_ATTRIBUTES_SCHEMA),
+        "CheckPackageGeneralInformation": _check_schema({
             "type": "object",
             "properties": {
-                "Execution": {
-                    "type": "boolean"
+                "TestCaseFlag": {"type": "boolean"},
+                "Version": {
+                    "type": ["boolean", "object"],
+                    "required": ["RegexPattern"],
+                    "properties": _PATTERN_SCHEMA["properties"],
+                    "additionalProperties": False
                 },
-                "Parameters": {
-                    "required": [
-                        "Version",
-                        "Description",
-                        "TestCaseFlag"
-                    ],
+                "Description": {
                     "type": "object",
                     "properties": {
-                        "Version": {
-                            "required": [
-                                "RegexPattern",
-                                "RegexDescription"
-                            ],
-                            "type": "object",
-                            "properties": {
-                                "RegexPattern": {
-                                    "type": "string"
-                                },
-                                "RegexDescription": {
-                                    "type": "string"
-                                }
-                            },
-                            "additionalProperties": False
-                        },
-                        "Description": {
-                            "type": "boolean"
-                        },
-                        "TestCaseFlag": {
-                            "type": "boolean"
-                        }
+                        "Check": {"type": "boolean"},
+                        "MinLength": {"type": "integer", "minimum": 0},
+                        "RegexPattern": {"type": "string"},
+                        "CustomMessage": {"type": "string"}
                     },
                     "additionalProperties": False
                 }
             },
             "additionalProperties": False
-        },
-        "CheckPackageContentNotEmpty": {
-            "required": [
-                "Execution",
-                "Parameters"
-            ],
+        }),
+        "CheckPackageNamespace": _check_schema(_PATTERN_SCHEMA),
+        "CheckPackageVariables": _check_schema({
             "type": "object",
+            "required": ["Order"],
             "properties": {
-                "Execution": {
-                    "type": "boolean"
+                "AllowUndefinedVariables": {"type": "boolean"},
+                "Order": {
+                    "type": "object",
+                    "required": ["SortMethod", "NumberOfRelevantCharacters"],
+                    "properties": {
+                        "SortMethod": {"enum": ["ascending", "descending", "None"]},
+                        "NumberOfRelevantCharacters": {
+                            "anyOf": [{"type": ["integer", "null"], "minimum": 0},
+                                      {"enum": ["None"]}]
+                        }
+                    },
+                    "additionalProperties": False
                 },
-                "Parameters": {
-                    "type": "string"
-                }
+                "Parameter": _VARIABLE_SCHEMA,
+                "ReturnValue": _VARIABLE_SCHEMA,
+                "LocalVar": _VARIABLE_SCHEMA,
+                "Function": _VARIABLE_SCHEMA
             },
             "additionalProperties": False
-        },
-        "CheckPackageForbiddenContent": {
-            "required": [
-                "Execution",
-                "Parameters"
-            ],
+        }),
+        "CheckPackageContentForbidden": _check_schema({
             "type": "object",
+            "required": ["Denylist"],
             "properties": {
-                "Execution": {
-                    "type": "boolean"
-                },
-                "Parameters": {
-                    "type": "string"
-                }
+                "Denylist": _STRINGS_SCHEMA
             },
             "additionalProperties": False
-        },
-        "CheckPackageStructure": {
-            "required": [
-                "Execution",
-                "Parameters"
-            ],
+        }),
+        "CheckPackageContentAllowed": _check_schema({
             "type": "object",
+            "required": ["Allowlist"],
             "properties": {
-                "Execution": {
-                    "type": "boolean"
-                },
-                "parameters": {
-                    "required": [
-                        "TestStepLimit",
-                        "StartStop"
-                    ],
-                    "type": "object",
-                    "properties": {
-                        "TestStepLimit": {
-                            "type": "integer"
-                        },
-                        "StartStop": {
-                            "required": [
-                                "Trace",
-                                "Stimulus",
-                                "Simulation"
-                            ],
-                            "type": "object",
-                            "properties": {
-                                "Trace": {
-                                    "type": "boolean"
-                                },
-                                "Stimulus": {
-                                    "type": "boolean"
-                                },
-                                "Simulation": {
-                                    "type": "boolean"
-                                }
-                            },
-                            "additionalProperties": False
-                        }
-                    },
-                    "additionalProperties": False
-                }
+                "Allowlist": dict(_STRINGS_SCHEMA, minItems=1),
+                "SearchDepth": {"type": ["integer", "null"], "minimum": 0}
+            },
+            "additionalProperties": False
+        }),
+        "CheckPackageLocalMapping": _check_schema({
+            "type": "object",
+            "required": ["Denylist"],
+            "properties": {
+                "Denylist": dict(_STRINGS_SCHEMA, minItems=1)
+            },
+            "additionalProperties": False
+        }),
+        "Profiling": {
+            "type": "object",
+            "properties": {
+                "Enabled": {"type": "boolean"},
+                "PstatsFile": {"type": ["string", "null"]},
+                "RecordApiCalls": {"type": "boolean"}
             },
             "additionalProperties": False
         }
     },
-    "additionalProperties": False
+    # custom checks are only validated for the common structure
+    "additionalProperties": _check_schema({})
 }
 
+# a snapshot is only valid for the schema and the CustomChecks version it was written with
+_SCHEMA_HASH = hashlib.sha256(json.dumps(JSON_SCHEMA, sort_keys=True).encode()).hexdigest()
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict used for the shared, parsed configuration. It is still a dict, so existing
+    isinstance checks in the CustomChecks keep working.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('The CustomChecks configuration is read-only!')
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    """
+    Read-only list used for the shared, parsed configuration.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('The CustomChecks configuration is read-only!')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def thaw(value):
+    """
+    Recursively converts a read-only configuration back into plain dicts and lists.
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+def freeze(value):
+    """
+    Recursively converts a parsed yaml object into its read-only counterpart.
+
+    Parameters
+    ----------
+    value: any
+        parsed yaml object
+
+    Returns
+    -------
+        the same structure built from FrozenDict and FrozenList
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class ConfigEntry:
+    """
+    One parsed version of a configuration file, shared by all Configuration objects.
+    """
+
+    config: FrozenDict
+    config_rel_path: str
+    mtime_ns: int
+    size: int
+    version: int
+    regexes: RegexRegistry
+    # errors of the configuration, each reported once: schema violations, invalid patterns and
+    # invalid parameters found by the checks, see Configuration.report_error
+    errors: list = field(default_factory=list, compare=False, repr=False)
+    # locations (CustomCheck, check) of the schema violations
+    invalid_checks: frozenset = frozenset()
+    # condition plans compiled on first use: (check name, sub check) -> ConditionPlan
+    plans: dict = field(default_factory=dict, compare=False, repr=False)
+
+
+@dataclass
+class ConfigCacheStats:
+    """
+    Counters of the process-wide configuration cache.
+    """
+
+    hits: int = 0
+    reloads: int = 0
+    snapshots: int = 0
+
+
+# process-wide cache: (parameter path, config file path) -> ConfigEntry
+_CONFIG_CACHE = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+_CONFIG_CACHE_STATS = ConfigCacheStats()
+# versions are unique across all configuration files of the process
+_CONFIG_VERSIONS = itertools.count(1)
+
+
+# configuration file used instead of the one in the ecu.test parameter path, see set_config_file
+_CONFIG_FILE_OVERRIDE = None
+
+
+def set_config_file(config_path):
+    """
+    Uses the given configuration file instead of the config.yaml in the parameter path of the
+    ecu.test workspace, e.g. when running the CustomChecks without ecu.test.
+
+    Parameters
+    ----------
+    config_path: str
+        path of the configuration file, None to use the ecu.test workspace again
+    """
+    global _CONFIG_FILE_OVERRIDE  # pylint: disable=W0603
+    _CONFIG_FILE_OVERRIDE = os.path.abspath(config_path) if config_path else None
+
+
+def get_cache_stats():
+    """
+    Returns the hit and reload counts of the configuration cache.
+
+    Returns
+    -------
+        dict with the keys 'hits', 'reloads' and 'snapshots' (reloads served by the snapshot)
+    """
+    with _CONFIG_CACHE_LOCK:
+        return asdict(_CONFIG_CACHE_STATS)
+
+
+def clear_cache():
+    """
+    Drops all cached configurations and resets the cache statistics.
+    """
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE_STATS.hits = 0
+        _CONFIG_CACHE_STATS.reloads = 0
+        _CONFIG_CACHE_STATS.snapshots = 0
+
+
+def parse_config(data):
+    """
+    Parses the content of a configuration file, with the C loader of PyYAML if it is available.
+
+    Parameters
+    ----------
+    data: bytes
+        content of the configuration file
+
+    Returns
+    -------
+        the read-only configuration, see freeze
+    """
+    # imported on first parse, so importing the CustomChecks does not pay for yaml
+    import yaml  # pylint: disable=C0415
+
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    # decoded like the configuration file opened in text mode
+    with TextIOWrapper(BytesIO(data)) as stream:
+        return freeze(yaml.load(stream, Loader=loader))
+
+
+# types of the values read from a snapshot, besides dict, list and tuple
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def _check_plain(value):
+    # raises a TypeError if the value is not built from plain data only
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _check_plain(key)
+            _check_plain(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _check_plain(item)
+    elif type(value) not in _PLAIN_TYPES:
+        raise TypeError(f'unexpected value of type {type(value).__name__}')
+
+
+def snapshot_key(digest) -> str:
+    """
+    Returns the key of a snapshot: the snapshot format, the CustomChecks version, the hash of
+    JSON_SCHEMA and the sha256 digest of the content of the configuration file.
+    """
+    return f'{SNAPSHOT_FORMAT}:{__version__}:{_SCHEMA_HASH}:{digest}'
+
+
+def read_snapshot(snapshot_path, digest):
+    """
+    Reads the snapshot of a configuration file. The snapshot is marshalled plain data, so
+    reading it does not execute any code.
+
+    Parameters
+    ----------
+    snapshot_path: str
+        path of the snapshot
+    digest: str
+        sha256 digest of the current content of the configuration file
+
+    Returns
+    -------
+        the snapshot as dict with the keys 'config' and 'errors', None if it is missing, stale
+        or corrupt
+    """
+    try:
+        with open(snapshot_path, 'rb') as stream:
+            snapshot = marshal.load(stream)
+        if snapshot['key'] == snapshot_key(digest):
+            config, errors = snapshot['config'], snapshot['errors']
+            _check_plain(config)
+            if not isinstance(errors, list) or not all(
+                    isinstance(path, tuple) and all(isinstance(part, str) for part in path)
+                    and isinstance(message, str) for path, message in errors):
+                raise TypeError('unexpected errors')
+            return {'config': freeze(config), 'errors': errors}
+    except Exception:  # pylint: disable=W0703
+        # missing, truncated or written by an incompatible version: the yaml file is parsed
+        pass
+    return None
+
+
+def write_snapshot(snapshot_path, digest, config, errors):
+    """
+    Writes the snapshot of a configuration file atomically, so concurrent readers never see a
+    partial file. Failures are ignored, e.g. for a read-only parameter folder or values which
+    are no plain data, like dates.
+
+    Parameters
+    ----------
+    snapshot_path: str
+        path of the snapshot
+    digest: str
+        sha256 digest of the content of the configuration file
+    config: FrozenDict
+        the parsed configuration
+    errors: list
+        the schema violations of the configuration, see SchemaValidator.validate
+    """
+    try:
+        config = thaw(config)
+        _check_plain(config)
+        data = marshal.dumps({'key': snapshot_key(digest), 'config': config,
+                              'errors': list(errors)}, SNAPSHOT_MARSHAL_VERSION)
+    except (TypeError, ValueError):
+        return
+    try:
+        handle, temp_path = tempfile.mkstemp(prefix=os.path.basename(snapshot_path),
+                                             dir=os.path.dirname(snapshot_path))
+    except OSError:
+        return
+    try:
+        with os.fdopen(handle, 'wb') as stream:
+            stream.write(data)
+        os.replace(temp_path, snapshot_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def load_config(config_path):
+    """
+    Returns the parsed and validated configuration file. A snapshot of the result is kept next
+    to the file and used instead of parsing the file again, as long as the content is unchanged.
+
+    Parameters
+    ----------
+    config_path: str
+        path of the configuration file
+
+    Returns
+    -------
+        tuple (the read-only configuration, list of schema violations as returned by
+        SchemaValidator.validate, whether it was read from the snapshot)
+    """
+    with open(config_path, 'rb') as stream:
+        data = stream.read()
+
+    digest = hashlib.sha256(data).hexdigest()
+    snapshot_path = config_path + SNAPSHOT_SUFFIX
+    snapshot = read_snapshot(snapshot_path, digest)
+    if snapshot is not None:
+        return snapshot['config'], snapshot['errors'], True
+
+    config = parse_config(data)
+    errors = validate(config, JSON_SCHEMA)
+    write_snapshot(snapshot_path, digest, config, errors)
+    return config, errors, False
+
+
+def load_config_entry(parameter_path, config_path, config_rel_path):
+    """
+    Returns the parsed configuration for the given file. The yaml file is only loaded again if
+    its modification time or size changed since the last load, see load_config.
+
+    Parameters
+    ----------
+    parameter_path: str
+        parameter path of the ecu.test workspace
+    config_path: str
+        path of the configuration file
+    config_rel_path: str
+        path of the configuration file used in messages
+
+    Returns
+    -------
+        ConfigEntry
+    """
+    key = (parameter_path, config_path)
+    stat = os.stat(config_path)
+
+    with _CONFIG_CACHE_LOCK:
+        entry = _CONFIG_CACHE.get(key)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns \
+                and entry.size == stat.st_size:
+            _CONFIG_CACHE_STATS.hits += 1
+            return entry
+
+        config, schema_errors, from_snapshot = load_config(config_path)
+
+        errors = [f'Invalid configuration at {format_error(error)}. Check "{config_rel_path}"!'
+                  for error in schema_errors]
+        for error in errors:
+            EPrint(error)
+        entry = ConfigEntry(config=config,
+                            config_rel_path=config_rel_path,
+                            mtime_ns=stat.st_mtime_ns,
+                            size=stat.st_size,
+                            version=next(_CONFIG_VERSIONS),
+                            regexes=RegexRegistry(config, config_rel_path, errors),
+                            errors=errors,
+                            invalid_checks=frozenset(path[:2] for path, _ in schema_errors))
+        _CONFIG_CACHE[key] = entry
+        _CONFIG_CACHE_STATS.reloads += 1
+        _CONFIG_CACHE_STATS.snapshots += from_snapshot
+        return entry
+
 
 class Configuration:
     """
     A class to represent the CustomChecks configuration (config.yaml).
+    The parsed configuration is shared process-wide and must not be modified.
 
     Attributes
     ----------
     config_rel_path : str
         name of the check
-    config : list of dict
+    config : FrozenDict
         input from yaml file
+    version : int
+        version of the parsed configuration, unique within the process and increased with every
+        reload of the file
 
     Methods
     -------
@@ -180,14 +565,93 @@ class Configuration:
         Return parameters
     get_check_conditions(custom_check_name, check):
         Get all conditions for the given check
+    get_condition_plan(custom_check_name, check):
+        Get the precompiled conditions for the given check
+    get_regex(regex):
+        Get the compiled pattern of a regular expression from the configuration
+    refresh():
+        Reload the configuration if the file changed
     """
 
     def __init__(self):
         """
         Constructor
         """
+        self._entry = None
+        self.refresh()
+
+    @property
+    def config(self):
+        """
+        The parsed, read-only configuration.
+        """
+        return self._entry.config
+
+    @property
+    def config_rel_path(self):
+        """
+        The path of the configuration file used in messages.
+        """
+        return self._entry.config_rel_path
+
+    @property
+    def config_errors(self):
+        """
+        The errors found in the configuration, e.g. schema violations or invalid patterns. The
+        list grows if the checks find invalid parameters later on.
+        """
+        return self._entry.errors
+
+    def is_valid_check(self, custom_check_name, check):
+        """
+        Whether the schema validation found no errors in the given check.
+
+        Parameters
+        ----------
+        custom_check_name : str
+            Name of the CustomCheck.
+
+        check : str
+            Name of the check, e.g. 'CheckTestCases'
+        """
+        return (custom_check_name, check) not in self._entry.invalid_checks
 
-        self.config, self.config_rel_path = self.initialize_config()
+    def report_error(self, message):
+        """
+        Adds an error of the configuration, e.g. invalid parameters of a check, and logs it. An
+        error is reported only once per version of the configuration.
+
+        Parameters
+        ----------
+        message: str
+            the error message
+        """
+        errors = self._entry.errors
+        with _CONFIG_CACHE_LOCK:
+            if message in errors:
+                return
+            errors.append(message)
+        EPrint(message)
+
+    @property
+    def version(self):
+        """
+        The version of the parsed configuration.
+        """
+        return self._entry.version
+
+    def refresh(self):
+        """
+        Checks the configuration file for changes and reloads it if necessary.
+
+        Returns
+        -------
+            True if a different version of the configuration is used from now on
+        """
+        entry = load_config_entry(*self.resolve_config_paths())
+        changed = entry is not self._entry
+        self._entry = entry
+        return changed
 
     def get_all_checks(self, custom_check_name):
         """
@@ -200,14 +664,9 @@ class Configuration:
 
         Returns
         -------
-            dictionary with check details
+            read-only dictionary with check details
         """
-        checks = {}
-
-        for check in self.config[custom_check_name]:
-            checks[check] = self.config[custom_check_name][check]
-
-        return checks
+        return self.config[custom_check_name]
 
     def get_check_conditions(self, custom_check_name, check):
         """
@@ -230,6 +689,48 @@ class Configuration:
         except:
             return []
 
+    def get_condition_plan(self, custom_check_name, check):
+        """
+        Get the precompiled conditions for the given check. The conditions are compiled once per
+        configuration version.
+
+        Parameters
+        ----------
+        custom_check_name : str
+            Name of the check.
+
+        check : dict
+            Dictionary with all items of the check
+
+        Returns
+        -------
+            ConditionPlan of the check
+        """
+        plans = self._entry.plans
+        key = (custom_check_name, check)
+        plan = plans.get(key)
+        if plan is None:
+            plan = compile_conditions(self.get_check_conditions(custom_check_name, check),
+                                      self._entry.regexes)
+            plans[key] = plan
+        return plan
+
+    def get_regex(self, regex):
+        """
+        Get the compiled pattern of a regular expression from the configuration. All patterns
+        are compiled once when the configuration is loaded.
+
+        Parameters
+        ----------
+        regex : str
+            the regular expression
+
+        Returns
+        -------
+            compiled pattern, None if the pattern is invalid (reported once as config error)
+        """
+        return self._entry.regexes.get(regex)
+
     def get_check_parameters(self, custom_check_name, check):
         """
         Get all parameters for the given check.
@@ -274,7 +775,37 @@ class Configuration:
         tuple (object of used configuration, relative path of the used configuration)
 
         """
+        entry = load_config_entry(*self.resolve_config_paths(ref_config_folder,
+                                                             ref_config_path,
+                                                             ref_config_template_path))
+        return entry.config, entry.config_rel_path
+
+    def resolve_config_paths(self, ref_config_folder=CONFIGURATION_FOLDER,
+                             ref_config_path=CONFIGURATION_FILE,
+                             ref_config_template_path=CONFIGURATION_TEMPLATE_FILE):
+        """
+        Determines the configuration file of the current workspace and creates it from the
+        template if it does not exist yet.
 
+        Parameters
+        ----------
+        ref_config_folder: str
+            path to the folder of the reference configuration
+        ref_config_path: str
+            path to the reference configuration file
+        ref_config_template_path: str
+            path to the reference template configuration file
+
+        Returns
+        -------
+        tuple (parameter path, path of the configuration, relative path of the configuration)
+
+        """
+        if _CONFIG_FILE_OVERRIDE is not None:
+            return (os.path.dirname(_CONFIG_FILE_OVERRIDE), _CONFIG_FILE_OVERRIDE,
+                    _CONFIG_FILE_OVERRIDE)
+
+        api = get_internal_api()
         parameter_path = api.GetSetting('parameterPath')
         config_template_path = os.path.join(os.path.dirname(os.path.dirname(__file__)),
                                             ref_config_template_path)
@@ -296,9 +827,4 @@ class Configuration:
                    f'CustomCheck configuration file '
                    f'{ref_config_path} in "{config_rel_path}"!')
 
-
-        # get configuration from yaml
-        with open(config_path, 'r') as stream:
-            config = safe_load(stream)
-
-        return config, config_rel_path
+        return parameter_path, config_path, config_rel_path
@@ -0,0 +1,447 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+from types import MappingProxyType
+
+from .ConfigKeys import ParameterKeys as pk
+
+# marks a value which was not read from the object API yet
+_UNSET = object()
+
+# per thread: the last test item handed to ItemSnapshot.shared, its snapshot and the ids of the
+# checks it was handed to
+_SHARED = threading.local()
+
+
+def get_variable_kind(variable_type, is_parameter, is_return):
+    """
+    Determines the kind of a variable (Local Var, Function, Parameter, Return value)
+
+    Parameters
+    ----------
+    variable_type: str
+        type of the variable from the object API
+    is_parameter: bool
+        whether the variable is a parameter
+    is_return: bool
+        whether the variable is a return value
+
+    Returns
+    -------
+    The kind of the variable as ParameterKeys value, or None if no matching kind was found.
+    """
+    if variable_type != pk.FUNCTION:
+        if is_parameter and not is_return:
+            return pk.PARAMETER
+        if is_return and not is_parameter:
+            return pk.RETURNVALUE
+        if not (is_parameter or is_return):
+            return pk.LOCALVAR
+        return None
+
+    if not (is_parameter or is_return):
+        return pk.FUNCTION
+
+    return None
+
+
+class VariableSnapshot:
+    """
+    Snapshot of a package variable, provides the object API methods used by the checks.
+    """
+
+    __slots__ = ('variable', 'name', 'type', 'is_parameter', 'is_return', 'kind', '_description')
+
+    def __init__(self, variable):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        variable: Variable object from the object API
+        """
+        self.variable = variable
+        self.name = variable.GetName()
+        self.type = variable.GetType()
+        self.is_parameter = variable.IsParameter()
+        self.is_return = variable.IsReturn()
+        self.kind = get_variable_kind(self.type, self.is_parameter, self.is_return)
+        self._description = _UNSET
+
+    def GetName(self):  # pylint: disable=C0103
+        """
+        Name of the variable
+        """
+        return self.name
+
+    def GetType(self):  # pylint: disable=C0103
+        """
+        Type of the variable
+        """
+        return self.type
+
+    def IsParameter(self):  # pylint: disable=C0103
+        """
+        Whether the variable is a parameter
+        """
+        return self.is_parameter
+
+    def IsReturn(self):  # pylint: disable=C0103
+        """
+        Whether the variable is a return value
+        """
+        return self.is_return
+
+    def GetDescription(self):  # pylint: disable=C0103
+        """
+        Description of the variable, read on first access
+        """
+        if self._description is _UNSET:
+            self._description = self.variable.GetDescription()
+        return self._description
+
+
+class MappingItemSnapshot:
+    """
+    Snapshot of a mapping item, provides the object API methods used by the checks.
+    """
+
+    __slots__ = ('mapping_item', 'access_type', '_reference_name')
+
+    def __init__(self, mapping_item):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        mapping_item: MappingItem object from the object API
+        """
+        self.mapping_item = mapping_item
+        self.access_type = mapping_item.GetAccessType()
+        self._reference_name = _UNSET
+
+    def GetAccessType(self):  # pylint: disable=C0103
+        """
+        Access type of the mapping item
+        """
+        return self.access_type
+
+    def GetReferenceName(self):  # pylint: disable=C0103
+        """
+        Reference name of the mapping item, read on first access
+        """
+        if self._reference_name is _UNSET:
+            self._reference_name = self.mapping_item.GetReferenceName()
+        return self._reference_name
+
+
+class _AttributesSnapshot:
+    """
+    Stand-in for the 'Attributes' of a test item.
+    """
+
+    __slots__ = ('_snapshot',)
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    def GetNamesAndValues(self):  # pylint: disable=C0103
+        """
+        Read-only dict of attribute names and values
+        """
+        return self._snapshot.attributes
+
+
+class _MappingSnapshot:
+    """
+    Stand-in for the local mapping of a package.
+    """
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items):
+        self._items = items
+
+    def GetItems(self):  # pylint: disable=C0103
+        """
+        Mapping items of the local mapping
+        """
+        return self._items
+
+
+class ItemSnapshot:
+    """
+    Lazily built snapshot of a test item (Package, Project or AnalysisPackage), shared by all
+    checks of one run. Every value is read from the object API on first access only. The
+    snapshot provides the object API methods used by the checks, all other attributes are taken
+    from the wrapped test item.
+
+    Attributes
+    ----------
+    item : object
+        the wrapped test item
+    Attributes : object
+        stand-in for the attributes of the test item
+    """
+
+    __slots__ = ('item', 'Attributes', '_name', '_filename', '_test_case_flag', '_version',
+                 '_description', '_attributes', '_variables', '_unused_variables',
+                 '_mapping_items', '_test_steps', '_test_step_tree')
+
+    def __init__(self, item):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        item: Package, Project or AnalysisPackage object from the object API
+        """
+        self.item = item
+        self.Attributes = _AttributesSnapshot(self)  # pylint: disable=C0103
+        self._name = _UNSET
+        self._filename = _UNSET
+        self._test_case_flag = _UNSET
+        self._version = _UNSET
+        self._description = _UNSET
+        self._attributes = _UNSET
+        self._variables = _UNSET
+        self._unused_variables = _UNSET
+        self._mapping_items = _UNSET
+        self._test_steps = {}
+        self._test_step_tree = _UNSET
+
+    @classmethod
+    def of(cls, item):
+        """
+        Returns the snapshot of the given test item; snapshots are returned as they are.
+        """
+        return item if isinstance(item, cls) else cls(item)
+
+    @classmethod
+    def shared(cls, item, check):
+        """
+        Returns the snapshot of the given test item shared by all checks of one Run pass.
+        ecu.test hands the same test item to the Run method of every check one after another,
+        so the snapshot of the last test item is kept. A new snapshot is built for another test
+        item, or when a check receives the same test item again, i.e. in the next pass, when the
+        package may have been changed meanwhile. The last test item is kept until another test
+        item is checked in the same thread. Snapshots are returned as they are.
+
+        Parameters
+        ----------
+        item: Package, Project or AnalysisPackage object from the object API, or its snapshot
+        check: AbstractCheck
+            the check the snapshot is handed to
+
+        Returns
+        -------
+            ItemSnapshot
+        """
+        if isinstance(item, cls):
+            return item
+
+        last = getattr(_SHARED, 'last', None)
+        if last is not None and last[0] is item and id(check) not in last[2]:
+            last[2].add(id(check))
+            return last[1]
+
+        snapshot = cls(item)
+        _SHARED.last = (item, snapshot, {id(check)})
+        return snapshot
+
+    def __getattr__(self, name):
+        # only called for attributes the snapshot does not provide
+        if name == 'item':
+            raise AttributeError(name)
+        return getattr(self.item, name)
+
+    def GetName(self):  # pylint: disable=C0103
+        """
+        Name of the test item
+        """
+        if self._name is _UNSET:
+            self._name = self.item.GetName()
+        return self._name
+
+    def GetFilename(self):  # pylint: disable=C0103
+        """
+        File name of the test item
+        """
+        if self._filename is _UNSET:
+            self._filename = self.item.GetFilename()
+        return self._filename
+
+    def HasTestCaseFlag(self):  # pylint: disable=C0103
+        """
+        Whether the test case flag is set
+        """
+        if self._test_case_flag is _UNSET:
+            self._test_case_flag = self.item.HasTestCaseFlag()
+        return self._test_case_flag
+
+    def GetVersion(self):  # pylint: disable=C0103
+        """
+        Version of the test item
+        """
+        if self._version is _UNSET:
+            self._version = self.item.GetVersion()
+        return self._version
+
+    def GetDescription(self):  # pylint: disable=C0103
+        """
+        Description of the test item
+        """
+        if self._description is _UNSET:
+            self._description = self.item.GetDescription()
+        return self._description
+
+    @property
+    def attributes(self):
+        """
+        Read-only dict of attribute names and values
+        """
+        if self._attributes is _UNSET:
+            self._attributes = MappingProxyType(self.item.Attributes.GetNamesAndValues())
+        return self._attributes
+
+    def GetVariables(self):  # pylint: disable=C0103
+        """
+        Variables of the package as tuple of VariableSnapshot
+        """
+        if self._variables is _UNSET:
+            self._variables = tuple(VariableSnapshot(variable)
+                                    for variable in self.item.GetVariables())
+        return self._variables
+
+    def GetUnusedVariables(self):  # pylint: disable=C0103
+        """
+        Unused variables of the package
+        """
+        if self._unused_variables is _UNSET:
+            self._unused_variables = self.item.GetUnusedVariables()
+        return self._unused_variables
+
+    def GetMapping(self):  # pylint: disable=C0103
+        """
+        Local mapping of the package with MappingItemSnapshot items
+        """
+        if self._mapping_items is _UNSET:
+            self._mapping_items = tuple(MappingItemSnapshot(mapping_item)
+                                        for mapping_item in self.item.GetMapping().GetItems())
+        return _MappingSnapshot(self._mapping_items)
+
+    def GetTestSteps(self, *args, **kwargs):  # pylint: disable=C0103
+        """
+        Test steps of the package, cached per combination of arguments
+        """
+        try:
+            key = (args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            # e.g. lists given as white or black list
+            return self.item.GetTestSteps(*args, **kwargs)
+
+        test_steps = self._test_steps.get(key)
+        if test_steps is None:
+            test_steps = tuple(self.item.GetTestSteps(*args, **kwargs))
+            self._test_steps[key] = test_steps
+        return test_steps
+
+    def get_cached_test_step_tree(self):
+        """
+        Returns the flattened test step tree if it was already built, otherwise None.
+        """
+        return None if self._test_step_tree is _UNSET else self._test_step_tree
+
+    @property
+    def test_step_tree(self):
+        """
+        All test steps of the package in depth-first order, flattened to a tuple of
+        (layer, test step) pairs; the top-level test steps are in layer 0.
+        """
+        if self._test_step_tree is _UNSET:
+            tree = []
+            stack = [(0, step) for step in reversed(get_child_test_steps(self))]
+            while stack:
+                layer, test_step = stack.pop()
+                tree.append((layer, test_step))
+                stack.extend((layer + 1, child)
+                             for child in reversed(get_child_test_steps(test_step)))
+            self._test_step_tree = tuple(tree)
+        return self._test_step_tree
+
+
+def iter_test_step_tree(item, search_depth=float('inf')):
+    """
+    Yields the test steps of a package in depth-first order as (layer, test step) pairs, up to
+    the given search depth. Children beyond the search depth are not requested from the object
+    API. The flattened tree of a snapshot is reused if it is already built or needed completely.
+
+    Parameters
+    ----------
+    item: Package object or its ItemSnapshot
+    search_depth: int
+        number of visited layers, infinite for all layers
+
+    Returns
+    -------
+    iterator of (layer, TestStep object)
+    """
+    if isinstance(item, ItemSnapshot):
+        tree = item.get_cached_test_step_tree()
+        if tree is None and search_depth == float('inf'):
+            tree = item.test_step_tree
+        if tree is not None:
+            yield from ((layer, test_step) for layer, test_step in tree if layer < search_depth)
+            return
+
+    if search_depth <= 0:
+        return
+
+    stack = [(0, test_step) for test_step in reversed(get_child_test_steps(item))]
+    while stack:
+        layer, test_step = stack.pop()
+        yield layer, test_step
+        if layer + 1 < search_depth:
+            stack.extend((layer + 1, child)
+                         for child in reversed(get_child_test_steps(test_step)))
+
+
+def get_child_test_steps(item):
+    """
+    Gets the direct child test steps of a package or test step, including disabled ones.
+
+    Parameters
+    ----------
+    item: Package object or TestStep object
+
+    Returns
+    -------
+    test step items
+    """
+    try:
+        return item.GetTestSteps(skipDisabledSteps=False,
+                                 recursive=False,
+                                 whiteList=None,
+                                 blackList=None)
+    except AttributeError:
+        # test step does not have test step children
+        return []
+
+
+def is_test_step_enabled(test_step):
+    """
+    Whether a test step is enabled. GetTestSteps leaves out the disabled test steps together with
+    their children, unless 'skipDisabledSteps' is False.
+
+    Parameters
+    ----------
+    test_step: TestStep object
+
+    Returns
+    -------
+    bool
+    """
+    return test_step.IsEnabled()
@@ -0,0 +1,234 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Fused traversal of a package: the checks register visitors, the package is walked once and
+every test step, variable, mapping item and attribute is handed to all visitors interested in
+it, instead of every check walking the package on its own.
+"""
+
+from typing import Dict, Iterator, List
+
+from .ItemSnapshot import is_test_step_enabled, iter_test_step_tree
+
+
+class PackageVisitor:
+    """
+    Receives the parts of one package for one configured check, e.g. 'CheckTestCases'. The
+    callbacks do nothing by default; only the parts of the package whose callback is
+    overwritten are read from the object API. The results are requested after the traversal.
+
+    Attributes
+    ----------
+    search_depth : int
+        number of test step layers handed to 'on_step', infinite for all layers; disabled test
+        steps are included
+    """
+
+    search_depth = float('inf')
+
+    def on_step(self, layer, test_step):
+        """
+        Called for every test step up to the search depth, in depth-first order.
+
+        Parameters
+        ----------
+        layer: int
+            layer of the test step, 0 for the top-level test steps
+        test_step: TestStep object
+        """
+
+    def on_recursive_step(self, test_step):
+        """
+        Called for every test step of GetTestSteps(recursive=True), i.e. the enabled test steps
+        of all layers in depth-first order, the same test steps a check reads on its own. They
+        are taken from the same walk as the test steps of 'on_step'.
+        """
+
+    def on_variable(self, variable):
+        """
+        Called for every variable of the package, in the order of GetVariables.
+        """
+
+    def on_mapping_item(self, mapping_item):
+        """
+        Called for every item of the local mapping of the package.
+        """
+
+    def on_attribute(self, name, value):
+        """
+        Called for every attribute of the package.
+        """
+
+    def results(self) -> Iterator:
+        """
+        Returns the results of the check after the traversal.
+
+        Returns
+        -------
+        iterator of CheckResult
+        """
+        return iter(())
+
+
+def _callbacks(visitors, name):
+    # bound callbacks of the visitors which overwrite the given callback
+    default = getattr(PackageVisitor, name)
+    return [(visitor, getattr(visitor, name)) for visitor in visitors
+            if getattr(type(visitor), name, default) is not default]
+
+
+def _dispatch(callbacks, errors, *args):
+    for visitor, callback in callbacks:
+        if id(visitor) in errors:
+            continue
+        try:
+            callback(*args)
+        except Exception as error:  # pylint: disable=W0703
+            # the error is raised when the results of the visitor are requested
+            errors[id(visitor)] = error
+
+
+def _fail(callbacks, errors, error):
+    # reading a part of the package failed, e.g. its variables
+    for visitor, _ in callbacks:
+        errors.setdefault(id(visitor), error)
+
+
+def _walk_test_steps(package, step_callbacks, recursive_callbacks, errors):
+    # one walk over the test step tree for both step callbacks; the test steps of
+    # GetTestSteps(recursive=True) are the enabled test steps without a disabled ancestor
+    search_depth = max((visitor.search_depth for visitor, _ in step_callbacks), default=0)
+    if recursive_callbacks:
+        search_depth = float('inf')
+    limited = any(visitor.search_depth < search_depth for visitor, _ in step_callbacks)
+
+    # layer of the disabled test step whose descendants are left out, None if there is none
+    disabled_layer = None
+    for layer, test_step in iter_test_step_tree(package, search_depth):
+        if limited:
+            _dispatch([(visitor, callback) for visitor, callback in step_callbacks
+                       if layer < visitor.search_depth], errors, layer, test_step)
+        else:
+            _dispatch(step_callbacks, errors, layer, test_step)
+
+        if not recursive_callbacks:
+            continue
+        if disabled_layer is not None:
+            if layer > disabled_layer:
+                continue
+            disabled_layer = None
+        if is_test_step_enabled(test_step):
+            _dispatch(recursive_callbacks, errors, test_step)
+        else:
+            disabled_layer = layer
+
+
+def traverse(package, visitors) -> Dict[int, Exception]:
+    """
+    Walks the package once and hands its parts to the visitors. A visitor whose callback raises
+    an error receives no further callbacks, the other visitors are not affected. If reading a
+    part of the package fails, all visitors of this part fail.
+
+    Parameters
+    ----------
+    package: Package object or its ItemSnapshot
+    visitors: list of PackageVisitor
+
+    Returns
+    -------
+        dict of the ids of the failed visitors and their errors
+    """
+    errors = {}
+
+    step_callbacks = _callbacks(visitors, 'on_step')
+    recursive_callbacks = _callbacks(visitors, 'on_recursive_step')
+    if step_callbacks or recursive_callbacks:
+        try:
+            _walk_test_steps(package, step_callbacks, recursive_callbacks, errors)
+        except Exception as error:  # pylint: disable=W0703
+            _fail(step_callbacks + recursive_callbacks, errors, error)
+
+    callbacks = _callbacks(visitors, 'on_variable')
+    if callbacks:
+        try:
+            for variable in package.GetVariables():
+                _dispatch(callbacks, errors, variable)
+        except Exception as error:  # pylint: disable=W0703
+            _fail(callbacks, errors, error)
+
+    callbacks = _callbacks(visitors, 'on_mapping_item')
+    if callbacks:
+        try:
+            for mapping_item in package.GetMapping().GetItems():
+                _dispatch(callbacks, errors, mapping_item)
+        except Exception as error:  # pylint: disable=W0703
+            _fail(callbacks, errors, error)
+
+    callbacks = _callbacks(visitors, 'on_attribute')
+    if callbacks:
+        try:
+            for name, value in package.Attributes.GetNamesAndValues().items():
+                _dispatch(callbacks, errors, name, value)
+        except Exception as error:  # pylint: disable=W0703
+            _fail(callbacks, errors, error)
+
+    return errors
+
+
+class CheckVisit:
+    """
+    The configured checks of one CustomCheck whose conditions are fulfilled for a test item,
+    prepared for a fused traversal, see AbstractCheck.visit.
+
+    Attributes
+    ----------
+    check : AbstractCheck
+        the CustomCheck
+    test_item : ItemSnapshot
+        the visited test item
+    parts : list
+        tuples (name of the configured check, PackageVisitor or None, parameters); checks
+        without visitor are run on their own when the results are requested
+    """
+
+    def __init__(self, check, test_item, parts):
+        """
+        Constructor
+        """
+        self.check = check
+        self.test_item = test_item
+        self.parts = parts
+
+    @property
+    def visitors(self) -> List[PackageVisitor]:
+        """
+        The visitors taking part in the traversal.
+        """
+        return [visitor for _, visitor, _ in self.parts if visitor is not None]
+
+    def results(self, errors=None) -> Iterator:
+        """
+        Yields the results of the CustomCheck after the traversal, in the same order as
+        AbstractCheck.iter_results.
+
+        Parameters
+        ----------
+        errors: dict
+            the failed visitors returned by 'traverse'; their errors are raised here
+
+        Returns
+        -------
+            iterator of CheckResult
+        """
+        check_name = self.check.GetName()
+        for name, visitor, parameters in self.parts:
+            if visitor is None:
+                results = self.check.iter_check(self.test_item, parameters)
+            elif errors and id(visitor) in errors:
+                raise errors[id(visitor)]
+            else:
+                results = visitor.results()
+            for result in results:
+                yield result.bind(check_name, name, self.test_item.GetFilename())
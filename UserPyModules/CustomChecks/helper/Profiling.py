@@ -0,0 +1,265 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import atexit
+import operator
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from . import ApiRecorder
+from .ConfigKeys import ProfilingKeys as prk
+from .ecu_test_api import SPrint
+
+# enables the profiling, independent of the config.yaml
+ENV_PROFILE = 'CUSTOMCHECKS_PROFILE'
+# file the cProfile statistics are written to
+ENV_PSTATS_FILE = 'CUSTOMCHECKS_PSTATS_FILE'
+
+# categories of the recorded timings
+CHECK = 'check'
+SUB_CHECK = 'sub-check'
+CONDITION = 'condition'
+OBJECT_API = 'object API'
+
+# the active profiler, None if profiling is disabled
+_PROFILER = None
+_PROFILER_LOCK = threading.Lock()
+
+# return values of the object API which are not wrapped by TimedItem
+_PLAIN_TYPES = (str, bytes, int, float, bool, type(None), dict)
+
+
+class Profiler:
+    """
+    Records wall time and call counts of the checks, sub-checks, condition evaluations and
+    object API methods, and optionally runs cProfile for the whole run.
+
+    Attributes
+    ----------
+    pstats_file : str
+        file the cProfile statistics are written to, None to not run cProfile
+    timings : dict
+        (category, name) and [number of calls, total seconds]
+    """
+
+    def __init__(self, pstats_file=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        pstats_file: str
+            file the cProfile statistics are written to, None to not run cProfile
+        """
+        self.pstats_file = pstats_file
+        self.timings = {}
+        self._lock = threading.Lock()
+        self._profile = None
+        if pstats_file:
+            import cProfile  # pylint: disable=C0415
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def record(self, category, name, seconds):
+        """
+        Adds one call with the given duration.
+        """
+        with self._lock:
+            timing = self.timings.get((category, name))
+            if timing is None:
+                self.timings[(category, name)] = [1, seconds]
+            else:
+                timing[0] += 1
+                timing[1] += seconds
+
+    @contextmanager
+    def timer(self, category, name):
+        """
+        Records the duration of the with block as one call.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, time.perf_counter() - start)
+
+    def summary(self) -> str:
+        """
+        Returns the recorded timings as table, sorted by total time.
+        """
+        lines = [f'{"total s":>10} {"calls":>8} {"mean ms":>10}  {"category":<11} name']
+        with self._lock:
+            timings = sorted(self.timings.items(), key=lambda item: item[1][1], reverse=True)
+        for (category, name), (calls, seconds) in timings:
+            lines.append(f'{seconds:10.4f} {calls:8d} {seconds / calls * 1000:10.4f}  '
+                         f'{category:<11} {name}')
+        return '\n'.join(lines)
+
+    def dump(self):
+        """
+        Stops cProfile and writes its statistics to the pstats file.
+        """
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.dump_stats(self.pstats_file)
+            self._profile = None
+
+
+class TimedItem:
+    """
+    Proxy of a test item which records the duration of every object API method call. Objects
+    returned by the methods are wrapped as well, so e.g. the calls on the test steps of a package
+    are recorded too; their method names are prefixed with the type name of the object.
+    """
+
+    __slots__ = ('_item', '_profiler', '_prefix')
+
+    def __init__(self, item, profiler, prefix=''):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        item: Package, Project or AnalysisPackage object from the object API, or an object
+            returned by its methods
+        profiler: Profiler
+        prefix: str
+            prefix of the recorded method names, e.g. 'Attributes.'
+        """
+        self._item = item
+        self._profiler = profiler
+        self._prefix = prefix
+
+    def _wrap_result(self, value, prefix=None):
+        if isinstance(value, _PLAIN_TYPES):
+            return value
+        if isinstance(value, (list, tuple)):
+            return type(value)(self._wrap_result(element) for element in value)
+        return TimedItem(value, self._profiler,
+                         prefix or f'{ApiRecorder.type_name(value)}.')
+
+    def __getattr__(self, name):
+        value = getattr(self._item, name)
+        if not callable(value):
+            # e.g. the 'Attributes' of a test item
+            return self._wrap_result(value, f'{self._prefix}{name}.')
+
+        profiler = self._profiler
+        method_name = self._prefix + name
+
+        def timed(*args, **kwargs):
+            with profiler.timer(OBJECT_API, method_name):
+                return self._wrap_result(value(*args, **kwargs))
+        return timed
+
+    def _timed(self, name, function, *args):
+        with self._profiler.timer(OBJECT_API, f'{self._prefix}{name}'):
+            return function(self._item, *args)
+
+    def __str__(self):
+        return self._timed('__str__', str)
+
+    def __iter__(self):
+        # e.g. collections of the object API, their elements are wrapped as well
+        return iter(self._wrap_result(self._timed('__iter__', list)))
+
+    def __len__(self):
+        return self._timed('__len__', len)
+
+    def __bool__(self):
+        return self._timed('__bool__', bool)
+
+    def __eq__(self, other):
+        if isinstance(other, TimedItem):
+            other = other._item
+        return self._timed('__eq__', operator.eq, other)
+
+    def __hash__(self):
+        return hash(self._item)
+
+
+def get_profiler():
+    """
+    Returns the active profiler, None if profiling is disabled.
+    """
+    return _PROFILER
+
+
+def instrument(item):
+    """
+    Wraps a test item for the active profiler and object API recorder.
+
+    Parameters
+    ----------
+    item: Package, Project or AnalysisPackage object from the object API
+
+    Returns
+    -------
+        the wrapped test item, the test item itself if both are disabled
+    """
+    recorder = ApiRecorder.get_recorder()
+    if recorder is not None:
+        item = recorder.wrap(item)
+    if _PROFILER is not None:
+        item = TimedItem(item, _PROFILER)
+    return item
+
+
+def configure(config):
+    """
+    Enables the profiling if the environment variable CUSTOMCHECKS_PROFILE is set or the
+    'Profiling' section of the config.yaml is enabled. Profiling is never disabled again within
+    one process. The summary is emitted when the process exits, or by 'emit_summary'. The object
+    API recorder is configured as well, see ApiRecorder.configure.
+
+    Parameters
+    ----------
+    config: Configuration object
+
+    Returns
+    -------
+        the active profiler, None if profiling is disabled
+    """
+    global _PROFILER  # pylint: disable=W0603
+    ApiRecorder.configure(config)
+    if _PROFILER is not None:
+        return _PROFILER
+
+    section = config.config.get(prk.PROFILING) if isinstance(config.config, dict) else None
+    if not isinstance(section, dict):
+        section = {}
+    enabled = os.environ.get(ENV_PROFILE, '') not in ('', '0') or section.get(prk.ENABLED)
+    if not enabled:
+        return None
+
+    with _PROFILER_LOCK:
+        if _PROFILER is None:
+            pstats_file = os.environ.get(ENV_PSTATS_FILE) or section.get(prk.PSTATS_FILE)
+            _PROFILER = Profiler(pstats_file)
+            atexit.register(emit_summary)
+    return _PROFILER
+
+
+def emit_summary(print_function=None):
+    """
+    Emits the summary of the active profiler and writes the cProfile statistics, followed by the
+    report of the object API recorder. The recorded timings are reset afterwards.
+
+    Parameters
+    ----------
+    print_function: callable
+        function the summary is printed with, SPrint if not given
+    """
+    ApiRecorder.emit_report(print_function)
+    profiler = _PROFILER
+    if profiler is None or not profiler.timings:
+        return
+
+    (print_function or SPrint)('CustomChecks profile:\n' + profiler.summary())
+    profiler.dump()
+    if profiler.pstats_file:
+        (print_function or SPrint)(f'cProfile statistics written to "{profiler.pstats_file}"')
+    profiler.timings = {}
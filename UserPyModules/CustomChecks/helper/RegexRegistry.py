@@ -0,0 +1,95 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import re
+import threading
+
+from .ConfigKeys import ParameterKeys as pk
+from .ecu_test_api import EPrint
+
+
+class RegexRegistry:
+    """
+    All 'RegexPattern' entries of a configuration, compiled once when the configuration is
+    loaded. Invalid patterns are collected as configuration errors instead of being reported by
+    the checks for every test item; each invalid pattern is logged once.
+
+    Attributes
+    ----------
+    errors : list of str
+        error messages of the invalid patterns
+    """
+
+    def __init__(self, config, config_rel_path, errors=None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        config: dict
+            the parsed configuration
+        config_rel_path: str
+            path of the configuration file used in messages
+        errors: list of str
+            list the error messages are appended to, a new list if not given
+        """
+        self.config_rel_path = config_rel_path
+        self.errors = [] if errors is None else errors
+        # pattern string -> compiled pattern, None for invalid patterns
+        self._patterns = {}
+        self._lock = threading.Lock()
+        self._collect(config, ())
+
+    def _collect(self, node, location):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == pk.REGEX_PATTERN and isinstance(value, str):
+                    self._compile(value, location + (key,))
+                else:
+                    self._collect(value, location + (str(key),))
+        elif isinstance(node, list):
+            for value in node:
+                self._collect(value, location)
+
+    def _compile(self, regex, location):
+        if regex in self._patterns:
+            return self._patterns[regex]
+
+        try:
+            pattern = re.compile(regex)
+        except re.error as error:
+            pattern = None
+            where = ' > '.join(location) if location else 'unknown location'
+            message = (f'"{regex}" is not a valid pattern ({error}) at {where}. '
+                       f'Check "{self.config_rel_path}"!')
+            self.errors.append(message)
+            EPrint(message)
+        self._patterns[regex] = pattern
+        return pattern
+
+    def get(self, regex):
+        """
+        Returns the compiled pattern for the given regular expression.
+
+        Parameters
+        ----------
+        regex: str
+            the regular expression from the configuration
+
+        Returns
+        -------
+            compiled pattern, None if the regular expression is invalid
+        """
+        try:
+            return self._patterns[regex]
+        except KeyError:
+            pass
+
+        if not isinstance(regex, str):
+            # raises the same TypeError as an uncompiled pattern would
+            re.compile(regex)
+
+        # not a 'RegexPattern' entry of the configuration
+        with self._lock:
+            return self._compile(regex, ())
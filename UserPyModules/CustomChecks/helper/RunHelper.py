@@ -2,17 +2,14 @@
 #
 # SPDX-License-Identifier: MIT
 
-import re
-from . import ecu_test_api
+from dataclasses import dataclass
+from typing import Any, Tuple
+
 from . import Configuration
+from . import Profiling
+from .ConditionPlan import ConditionPlan
 from .ConfigKeys import ConditionKeys as ck
-
-try:
-    from tts.core.logging import SPrint, WPrint, EPrint, DPrint  # pylint: disable=E0401
-    api = ecu_test_api.get_api()
-    pkgApi = api.ObjectApi.PackageApi
-except:
-    from logging import info as SPrint, warning as WPrint, error as EPrint, debug as DPrint
+from .ecu_test_api import SPrint, WPrint, EPrint, DPrint
 
 # keys declared in "conditions" in config.yaml:
 # ConditionKeys.PROJECT_NAME
@@ -25,7 +22,7 @@ except:
 # ConditionKeys.ENABLED
 
 
-def check_conditions(check_name, check_object, check) -> bool:
+def check_conditions(check_name, check_object, check, plan=None) -> bool:
     """
     Checks whether the conditions of the check_object to execute a specific check are fulfilled.
     These conditions are specified under the respective 'Conditions' section in the config.yaml.
@@ -35,42 +32,16 @@ def check_conditions(check_name, check_object, check) -> bool:
     check_name: Current CustomCheck name
     check_object: ecu.test Package-Object, Project-Object from Object Api
     check: Current type of package that gets checked for conditions
+    plan: precompiled ConditionPlan of the check, taken from the configuration if not given
 
     Returns
     -------
     True if all conditions are fulfilled for this package
     """
-    # check conditions in detail for the given package
-    result_list = [True]  # init with True if no conditions are defined in config.yaml
-    conditions = Configuration.Configuration().get_check_conditions(check_name, check)
-
-    for condition in conditions:
-        # check package name pattern
-        if condition in (ck.PACKAGE_NAME, ck.PROJECT_NAME):
-            regex = conditions[condition][ck.REGEX_PATTERN]
-            if re.search(regex, check_object.GetName()):
-                result_list.append(True)
-            else:
-                result_list.append(False)
-        # check package path pattern
-        elif condition in (ck.PACKAGE_FOLDER, ck.PROJECT_FOLDER):
-            regex = conditions[condition][ck.REGEX_PATTERN]
-            if re.search(regex, check_object.GetFilename()):
-                result_list.append(True)
-            else:
-                result_list.append(False)
-        # check package properties
-        elif condition == ck.PACKAGE_PROPERTIES:
-            testCaseFlag = check_object.HasTestCaseFlag()
-            if conditions[condition][ck.TESTCASEFLAG] == testCaseFlag:
-                result_list.append(True)
-            else:
-                result_list.append(False)
-        # error handling
-        else:
-            WPrint(f'Condition "{condition}" is not implemented!')
-
-    return all(result_list)
+    if plan is None:
+        plan = Configuration.Configuration().get_condition_plan(check_name, check)
+
+    return plan.evaluate(check_object)
 
 
 def get_check_activity(check):
@@ -82,23 +53,107 @@ def get_check_activity(check):
     Returns
     -------
     True if check is set active in config or flag is missing
-    Check configurations with the 'Enabled' flag removed
+    Check configurations without the 'Enabled' flag (the given configuration is not modified)
     """
     try:
-        is_active = check.pop(ck.ENABLED)
-        return is_active, check
-
+        is_active = check[ck.ENABLED]
     except:
         return True, check
 
+    return is_active, {name: value for name, value in check.items() if name != ck.ENABLED}
+
+
+@dataclass(frozen=True)
+class ActiveCheck:
+    """
+    A precomputed, enabled check of a CustomCheck (e.g. 'CheckTestCases').
+
+    Attributes
+    ----------
+    name : str
+        name of the check in the config.yaml
+    conditions : ConditionPlan
+        the precompiled conditions of the check
+    parameters : any
+        the Parameters entry from config.yaml, parsed by the CustomCheck
+    error : Exception
+        error raised when the check is executed without configured parameters
+    """
+
+    name: str
+    conditions: ConditionPlan
+    parameters: Any = None
+    error: Exception = None
+
+    def get_parameters(self):
+        """
+        Returns the parameters of the check, raises the stored error if there are none.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.parameters
+
 
-def package_type(check_name, check_object, check) -> bool:
+# errors of AbstractCheck.parse_parameters reported as configuration error: invalid values, and
+# parameters of the wrong structure, e.g. a list instead of a dict
+PARAMETER_ERRORS = (ValueError, TypeError, AttributeError, KeyError)
+
+
+def get_active_checks(config, check_name, parse_parameters=None) -> Tuple[ActiveCheck, ...]:
+    """
+    Computes the enabled checks of a CustomCheck from the configuration. Checks with invalid
+    parameters are reported once as configuration error and left out.
+
+    Parameters
+    ----------
+    config: Configuration object
+    check_name: Current CustomCheck name
+    parse_parameters: callable
+        converts the parameters of a check into its model, raises one of PARAMETER_ERRORS for
+        invalid parameters, see AbstractCheck.parse_parameters
+
+    Returns
+    -------
+    tuple of ActiveCheck, empty if the CustomCheck is disabled
+    """
+    is_active, checks = get_check_activity(config.get_all_checks(check_name))
+
+    if not is_active:
+        return ()
+
+    active_checks = []
+    for check in checks:
+        try:
+            parameters, error = config.get_check_parameters(check_name, check), None
+        except KeyError as exc:
+            # only raised if the check is executed, as before
+            parameters, error = None, exc
+        if error is None and parse_parameters is not None:
+            try:
+                parameters = parse_parameters(parameters)
+            except PARAMETER_ERRORS as exc:
+                # errors already found by the schema validation are not reported again
+                if config.is_valid_check(check_name, check):
+                    reason = exc if isinstance(exc, ValueError) else f'{type(exc).__name__}: {exc}'
+                    config.report_error(f'Invalid parameters of {check_name} > {check}: '
+                                        f'{reason}. Check "{config.config_rel_path}"!')
+                continue
+        active_checks.append(ActiveCheck(name=check,
+                                         conditions=config.get_condition_plan(check_name, check),
+                                         parameters=parameters,
+                                         error=error))
+
+    return tuple(active_checks)
+
+
+def package_type(check_name, check_object, check, plan=None) -> bool:
     """
     Parameters
     ----------
     check_name: Current CustomCheck name
     check_object: ecu.test-Package-Object from Object Api
     check: Current type of package that gets checked for conditions
+    plan: precompiled ConditionPlan of the check, taken from the configuration if not given
 
     Returns
     -------
@@ -107,7 +162,14 @@ def package_type(check_name, check_object, check) -> bool:
 
     DPrint(3, f'Internal check "{check}"')
     # check if the conditions are True
-    if check_conditions(check_name, check_object, check):
+    profiler = Profiling.get_profiler()
+    if profiler is None:
+        fulfilled = check_conditions(check_name, check_object, check, plan)
+    else:
+        with profiler.timer(Profiling.CONDITION, f'{check_name}/{check}'):
+            fulfilled = check_conditions(check_name, check_object, check, plan)
+
+    if fulfilled:
         DPrint(3, f'"{check_object.GetName()}", conditions are {True}. Check is running.')
     else:
         DPrint(3, f'"{check_object.GetName()}", conditions are {False}. Check will not be '
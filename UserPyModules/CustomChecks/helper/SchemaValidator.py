@@ -0,0 +1,111 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Minimal validator for the subset of JSON Schema (draft-07) used by Configuration.JSON_SCHEMA, so
+the config.yaml is validated without depending on the jsonschema package.
+
+Supported keywords: type, enum, minimum, minItems, required, properties, additionalProperties,
+items and anyOf. Other keywords are ignored.
+"""
+
+from typing import List, Tuple
+
+# JSON Schema types and the matching Python types of a parsed yaml file
+_TYPES = {
+    'object': dict,
+    'array': list,
+    'string': str,
+    'integer': int,
+    'number': (int, float),
+    'boolean': bool,
+    'null': type(None),
+}
+
+
+def is_type(instance, type_name) -> bool:
+    """
+    Whether the parsed yaml value is of the given JSON Schema type.
+    """
+    if isinstance(instance, bool) and type_name in ('integer', 'number'):
+        return False
+    return isinstance(instance, _TYPES[type_name])
+
+
+def validate(instance, schema, path=()) -> List[Tuple[tuple, str]]:
+    """
+    Validates a parsed yaml value against a schema.
+
+    Parameters
+    ----------
+    instance: any
+        the parsed yaml value
+    schema: dict
+        the JSON Schema
+    path: tuple of str
+        location of the value
+
+    Returns
+    -------
+        list of errors as tuples (location, message), empty if the value is valid
+    """
+    errors = []
+    _validate(instance, schema, path, errors)
+    return errors
+
+
+def format_error(error) -> str:
+    """
+    Returns an error of 'validate' as text, e.g. "CheckPackageVariables > Order: 'Order' is
+    required".
+    """
+    path, message = error
+    return f'{" > ".join(path) if path else "top level"}: {message}'
+
+
+def _error(errors, path, message):
+    errors.append((path, message))
+
+
+def _validate(instance, schema, path, errors):  # pylint: disable=R0912
+    types = schema.get('type')
+    if types is not None:
+        types = [types] if isinstance(types, str) else types
+        if not any(is_type(instance, type_name) for type_name in types):
+            _error(errors, path, f'{instance!r} is not of type {" or ".join(types)}')
+            return
+
+    if 'enum' in schema and instance not in schema['enum']:
+        _error(errors, path, f'{instance!r} is not one of {schema["enum"]}')
+
+    if 'anyOf' in schema:
+        if all(validate(instance, option, path) for option in schema['anyOf']):
+            _error(errors, path, f'{instance!r} is not valid here')
+
+    if 'minimum' in schema and is_type(instance, 'number') and instance < schema['minimum']:
+        _error(errors, path, f'{instance!r} is less than {schema["minimum"]}')
+
+    if isinstance(instance, list):
+        if len(instance) < schema.get('minItems', 0):
+            _error(errors, path, 'must not be empty' if schema['minItems'] == 1
+                   else f'needs at least {schema["minItems"]} entries')
+        items = schema.get('items')
+        if items is not None:
+            for index, item in enumerate(instance):
+                _validate(item, items, path + (f'[{index}]',), errors)
+
+    if isinstance(instance, dict):
+        for key in schema.get('required', ()):
+            if key not in instance:
+                _error(errors, path, f'{key!r} is required')
+
+        properties = schema.get('properties', {})
+        additional = schema.get('additionalProperties', True)
+        for key, value in instance.items():
+            if key in properties:
+                _validate(value, properties[key], path + (str(key),), errors)
+            elif additional is False:
+                _error(errors, path, f'unknown entry {key!r}')
+            elif isinstance(additional, dict):
+                _validate(value, additional, path + (str(key),), errors)
@@ -5,30 +5,72 @@
 # encoding: ISO-8859-1 # pylint: disable=C2503
 """
 Wrapper for importing ecu.test ApiClient of currently running ecu.test version.
+
+Single access point of the CustomChecks to the ecu.test API and logging: the logging functions
+are resolved once when this module is imported, the API handles are only created on first use.
+Outside of ecu.test, the logging functions fall back to the standard logging module.
 """
 
+import importlib.util
+import threading
+
 try:
-    from log import SPrint, WPrint, EPrint
+    from tts.core.logging import SPrint, WPrint, EPrint, DPrint  # pylint: disable=E0401
 except:
-    from logging import info as SPrint, warning as WPrint, error as EPrint
+    try:
+        from log import SPrint, WPrint, EPrint  # pylint: disable=E0401
+        from logging import debug as DPrint
+    except:
+        from logging import info as SPrint, warning as WPrint, error as EPrint, debug as DPrint
 
 API_HANDLER = None
+INTERNAL_API_HANDLER = None
+_API_LOCK = threading.Lock()
 
 ECU_TEST_ENV = {"ECU-TEST.exe", "ecu.test.exe", "ecu-test_daemon"}
 
 
+def is_available():
+    """
+    Whether the ecu.test API can be imported, i.e. the CustomChecks run within ecu.test or
+    with its Python environment
+    """
+    try:
+        return importlib.util.find_spec('tts.core.api.internalApi.Api') is not None
+    except ImportError:
+        # a parent package is missing
+        return False
+
+
 def get_api():
     """
     Returns an instance of the ecu.test api
     """
     global API_HANDLER  # pylint: disable=W0603
     if API_HANDLER is None:
-        from application.api.Api import Api  # pylint: disable=E0401
-        API_HANDLER = Api()
+        with _API_LOCK:
+            if API_HANDLER is None:
+                from application.api.Api import Api  # pylint: disable=E0401,C0415
+                API_HANDLER = Api()
 
     return API_HANDLER
 
 
+def get_internal_api():
+    """
+    Returns an instance of the internal ecu.test api, e.g. for reading the settings of the
+    workspace
+    """
+    global INTERNAL_API_HANDLER  # pylint: disable=W0603
+    if INTERNAL_API_HANDLER is None:
+        with _API_LOCK:
+            if INTERNAL_API_HANDLER is None:
+                from tts.core.api.internalApi.Api import Api  # pylint: disable=E0401,C0415
+                INTERNAL_API_HANDLER = Api()
+
+    return INTERNAL_API_HANDLER
+
+
 def get_object_api():
     """
     Gets the Object API of ecu.test.
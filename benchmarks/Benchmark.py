@@ -0,0 +1,242 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Throughput benchmarks of the CustomChecks on synthetic test items, without ecu.test, and the
+import time of the CustomChecks package in a fresh interpreter.
+
+Usage: python -m benchmarks [--packages N] [--steps N] ... [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from typing import Callable, Dict, List
+
+from UserPyModules.CustomChecks.batch.BatchRunner import discover_checks
+from UserPyModules.CustomChecks.helper import Configuration as config_module
+from UserPyModules.CustomChecks.helper.CheckType import CheckType
+from UserPyModules.CustomChecks.helper.Configuration import Configuration, set_config_file
+from UserPyModules.CustomChecks.helper.RunHelper import check_conditions, get_check_activity
+
+from .Fakes import Scale, generate_packages, generate_projects
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE = os.path.join(ROOT, 'UserPyModules', 'CustomChecks', 'config_template.yaml')
+
+# imports all check modules like ecu.test does and prints the duration in seconds
+IMPORT_SCRIPT = '''
+import pkgutil, time
+start = time.perf_counter()
+import UserPyModules.CustomChecks as package
+for module in pkgutil.iter_modules(package.__path__):
+    if module.name.startswith('Check'):
+        __import__(package.__name__ + '.' + module.name)
+print(time.perf_counter() - start)
+'''
+
+
+def measure(name, func: Callable[[], object], items, repeat) -> Dict:
+    """
+    Times a function and returns the benchmark record.
+
+    Parameters
+    ----------
+    name: str
+        name of the benchmark
+    func: callable
+        processes all items once
+    items: int
+        number of items processed by one call, used for the time per item
+    repeat: int
+        number of timed calls, the best and the mean duration are reported
+
+    Returns
+    -------
+        dict with name, items, repeat, best_s, mean_s and per_item_us
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    best = min(durations)
+    return {'name': name,
+            'items': items,
+            'repeat': repeat,
+            'best_s': best,
+            'mean_s': sum(durations) / len(durations),
+            'per_item_us': best / max(items, 1) * 1e6}
+
+
+def enable_all_checks(config_path, target_folder) -> str:
+    """
+    Writes a copy of the configuration with all checks enabled and returns its path.
+    """
+    with open(config_path, 'r', encoding='utf-8') as stream:
+        text = stream.read()
+    target = os.path.join(target_folder, 'config.yaml')
+    with open(target, 'w', encoding='utf-8') as stream:
+        stream.write(text.replace('Enabled: false', 'Enabled: true'))
+    return target
+
+
+def bench_import(repeat) -> List[Dict]:
+    """
+    Times importing the CustomChecks package and all check modules, each in a fresh interpreter,
+    so the import cost is reported separately from the interpreter startup and the check runs.
+    """
+    durations = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', IMPORT_SCRIPT], check=True, cwd=ROOT,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout
+        durations.append(float(output))
+    best = min(durations)
+    return [{'name': 'Import/CustomChecks',
+             'items': 1,
+             'repeat': repeat,
+             'best_s': best,
+             'mean_s': sum(durations) / len(durations),
+             'per_item_us': best * 1e6}]
+
+
+def bench_configuration(repeat) -> List[Dict]:
+    """
+    Times parsing the configuration and the check for changes on every check run.
+    """
+    def load():
+        config_module.clear_cache()
+        Configuration()
+
+    config = Configuration()
+    refreshes = 1000
+
+    def refresh():
+        for _ in range(refreshes):
+            config.refresh()
+
+    return [measure('Configuration/load', load, 1, repeat),
+            measure('Configuration/refresh', refresh, refreshes, repeat)]
+
+
+def bench_conditions(checks, items_by_type, repeat) -> List[Dict]:
+    """
+    Times RunHelper.check_conditions for all configured checks of every CustomCheck.
+    """
+    config = Configuration()
+    records = []
+    for check_type, check_classes in checks.items():
+        items = items_by_type.get(check_type, [])
+        for check_class in check_classes:
+            check_name = check_class.__name__
+            is_active, sub_checks = get_check_activity(config.get_all_checks(check_name))
+            if not items or not is_active or not sub_checks:
+                continue
+
+            def run(check_name=check_name, sub_checks=sub_checks, items=items):
+                for item in items:
+                    for sub_check in sub_checks:
+                        check_conditions(check_name, item, sub_check)
+
+            records.append(measure(f'check_conditions/{check_name}', run,
+                                   len(items) * len(sub_checks), repeat))
+    return records
+
+
+def bench_checks(checks, items_by_type, repeat) -> List[Dict]:
+    """
+    Times the Run method of every CustomCheck on all test items of its type.
+    """
+    records = []
+    for check_type, check_classes in checks.items():
+        items = items_by_type.get(check_type, [])
+        if not items:
+            continue
+        for check_class in check_classes:
+            check = check_class(None)
+
+            def run(check=check, items=items):
+                for item in items:
+                    check.Run(item)
+
+            records.append(measure(f'Run/{check_class.__name__}', run, len(items), repeat))
+    return records
+
+
+def git_commit() -> str:
+    """
+    Returns the current commit of the repository, None outside of a git repository.
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], check=True, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, cwd=os.path.dirname(TEMPLATE),
+                              universal_newlines=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args(argv):
+    """
+    Parses the command line arguments of the benchmarks.
+    """
+    defaults = Scale()
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.strip())
+    parser.add_argument('--packages', type=int, default=defaults.packages)
+    parser.add_argument('--steps', type=int, default=defaults.steps,
+                        help='test steps per package')
+    parser.add_argument('--variables', type=int, default=defaults.variables,
+                        help='variables per package')
+    parser.add_argument('--attributes', type=int, default=defaults.attributes,
+                        help='attributes per package and project')
+    parser.add_argument('--projects', type=int, default=defaults.projects)
+    parser.add_argument('--seed', type=int, default=defaults.seed)
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per benchmark')
+    parser.add_argument('--config', help='config.yaml to use, default: config_template.yaml '
+                                         'with all checks enabled')
+    parser.add_argument('--output', help='file for the JSON results, default: stdout')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """
+    Runs all benchmarks and writes the results as JSON.
+    """
+    args = parse_args(argv)
+    scale = Scale(packages=args.packages, steps=args.steps, variables=args.variables,
+                  attributes=args.attributes, projects=args.projects, seed=args.seed)
+    repeat = max(1, args.repeat)
+
+    with tempfile.TemporaryDirectory() as folder:
+        set_config_file(args.config or enable_all_checks(TEMPLATE, folder))
+
+        items_by_type = {CheckType.PACKAGE.value: generate_packages(scale),
+                         CheckType.PROJECT.value: generate_projects(scale)}
+        checks = discover_checks()
+
+        results = bench_import(repeat)
+        results += bench_configuration(repeat)
+        results += bench_conditions(checks, items_by_type, repeat)
+        results += bench_checks(checks, items_by_type, repeat)
+
+    report = {'meta': {'commit': git_commit(),
+                       'python': platform.python_version(),
+                       'platform': platform.platform(),
+                       'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+                       'scale': asdict(scale),
+                       'repeat': repeat},
+              'results': results}
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as stream:
+            stream.write(text + '\n')
+    else:
+        sys.stdout.write(text + '\n')
+    return 0
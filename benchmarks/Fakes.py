@@ -0,0 +1,279 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Synthetic in-memory stand-ins for the ecu.test Object API, generated at configurable scale.
+"""
+
+import random
+from dataclasses import dataclass
+
+# test step types, the first ones are allowed by the config_template.yaml
+STEP_TYPES = ('TsBlock', 'TsWait', 'TsKeyword', 'TsPost', 'TsPrecon', 'TsTodo', 'TsCalculation')
+MAPPING_TYPES = ('SIGNAL', 'MODEL', 'MEASUREMENT', 'CALIBRATION', 'BUS')
+VARIABLE_TYPES = ('Integer', 'Float', 'String', 'Function', 'Undefined')
+ATTRIBUTE_NAMES = ('Owner', 'Designer', 'Status', 'Testlevel', 'Reviewer', 'Requirement')
+TEST_LEVELS = ('component', 'module', 'system', 'unknown')
+
+
+@dataclass
+class Scale:
+    """
+    Size of the generated workspace.
+    """
+
+    packages: int = 100
+    steps: int = 50
+    variables: int = 20
+    attributes: int = 4
+    projects: int = 10
+    seed: int = 0
+
+
+class FakeAttributes:
+    """
+    Stand-in for the 'Attributes' of a package or project.
+    """
+
+    def __init__(self, values):
+        self.values = values
+
+    def GetNamesAndValues(self):  # pylint: disable=C0103
+        return dict(self.values)
+
+
+class FakeVariable:
+    """
+    Stand-in for a package variable.
+    """
+
+    def __init__(self, name, var_type, is_parameter, is_return, description):
+        self.name = name
+        self.var_type = var_type
+        self.is_parameter = is_parameter
+        self.is_return = is_return
+        self.description = description
+
+    def GetName(self):  # pylint: disable=C0103
+        return self.name
+
+    def GetType(self):  # pylint: disable=C0103
+        return self.var_type
+
+    def IsParameter(self):  # pylint: disable=C0103
+        return self.is_parameter
+
+    def IsReturn(self):  # pylint: disable=C0103
+        return self.is_return
+
+    def GetDescription(self):  # pylint: disable=C0103
+        return self.description
+
+
+class FakeTestStep:
+    """
+    Stand-in for a test step with child test steps.
+    """
+
+    def __init__(self, step_type, line_no, enabled=True):
+        self.step_type = step_type
+        self.line_no = line_no
+        self.enabled = enabled
+        self.children = []
+
+    def __str__(self):
+        return f'{self.step_type}: line {self.line_no}'
+
+    def GetType(self):  # pylint: disable=C0103
+        return self.step_type
+
+    def GetLineNo(self):  # pylint: disable=C0103
+        return self.line_no
+
+    def IsEnabled(self):  # pylint: disable=C0103
+        return self.enabled
+
+    def GetTestSteps(self, skipDisabledSteps=True, recursive=True,  # pylint: disable=C0103,W0613
+                     whiteList=None, blackList=None):
+        return _get_test_steps(self.children, recursive, skipDisabledSteps)
+
+
+class FakeMappingItem:
+    """
+    Stand-in for an item of the local mapping.
+    """
+
+    def __init__(self, reference_name, access_type):
+        self.reference_name = reference_name
+        self.access_type = access_type
+
+    def GetReferenceName(self):  # pylint: disable=C0103
+        return self.reference_name
+
+    def GetAccessType(self):  # pylint: disable=C0103
+        return self.access_type
+
+
+class FakeMapping:
+    """
+    Stand-in for the local mapping of a package.
+    """
+
+    def __init__(self, items):
+        self.items = items
+
+    def GetItems(self):  # pylint: disable=C0103
+        return list(self.items)
+
+
+class FakePackage:
+    """
+    Stand-in for a package.
+    """
+
+    def __init__(self, name, filename, test_case, version, description, attributes, variables,
+                 test_steps, mapping_items):
+        self.name = name
+        self.filename = filename
+        self.test_case = test_case
+        self.version = version
+        self.description = description
+        self.Attributes = FakeAttributes(attributes)  # pylint: disable=C0103
+        self.variables = variables
+        self.test_steps = test_steps
+        self.mapping_items = mapping_items
+
+    def GetName(self):  # pylint: disable=C0103
+        return self.name
+
+    def GetFilename(self):  # pylint: disable=C0103
+        return self.filename
+
+    def HasTestCaseFlag(self):  # pylint: disable=C0103
+        return self.test_case
+
+    def GetVersion(self):  # pylint: disable=C0103
+        return self.version
+
+    def GetDescription(self):  # pylint: disable=C0103
+        return self.description
+
+    def GetVariables(self):  # pylint: disable=C0103
+        return list(self.variables)
+
+    def GetUnusedVariables(self):  # pylint: disable=C0103
+        return [variable for variable in self.variables if variable.name.endswith('9')]
+
+    def GetMapping(self):  # pylint: disable=C0103
+        return FakeMapping(self.mapping_items)
+
+    def GetTestSteps(self, skipDisabledSteps=True, recursive=True,  # pylint: disable=C0103,W0613
+                     whiteList=None, blackList=None):
+        return _get_test_steps(self.test_steps, recursive, skipDisabledSteps)
+
+
+class FakeProject:
+    """
+    Stand-in for a project.
+    """
+
+    def __init__(self, name, filename, attributes):
+        self.name = name
+        self.filename = filename
+        self.Attributes = FakeAttributes(attributes)  # pylint: disable=C0103
+
+    def GetName(self):  # pylint: disable=C0103
+        return self.name
+
+    def GetFilename(self):  # pylint: disable=C0103
+        return self.filename
+
+    def HasTestCaseFlag(self):  # pylint: disable=C0103
+        return False
+
+
+def _get_test_steps(test_steps, recursive, skip_disabled):
+    # like the object API, disabled test steps are left out together with their children
+    result = []
+    stack = list(reversed(test_steps))
+    while stack:
+        test_step = stack.pop()
+        if skip_disabled and not test_step.enabled:
+            continue
+        result.append(test_step)
+        if recursive:
+            stack.extend(reversed(test_step.children))
+    return result
+
+
+def _attributes(rng, count):
+    values = {}
+    for index in range(count):
+        name = ATTRIBUTE_NAMES[index] if index < len(ATTRIBUTE_NAMES) else f'Attribute{index}'
+        if name == 'Testlevel':
+            values[name] = ','.join(rng.sample(TEST_LEVELS, rng.randint(1, 2)))
+        else:
+            values[name] = rng.choice(('', 'value', 'Jane Doe'))
+    return values
+
+
+def _variables(rng, count):
+    variables = []
+    for index in range(count):
+        var_type = rng.choice(VARIABLE_TYPES)
+        is_parameter = var_type != 'Function' and rng.random() < 0.2
+        is_return = var_type != 'Function' and not is_parameter and rng.random() < 0.1
+        prefix = 'F_' if var_type == 'Function' else 'P_' if is_parameter \
+            else 'R_' if is_return else rng.choice(('V_', 'Var_', 'x'))
+        variables.append(FakeVariable(f'{prefix}{rng.choice("abcdefgh")}{index}', var_type,
+                                      is_parameter, is_return,
+                                      rng.choice(('', 'a description'))))
+    return variables
+
+
+def _test_steps(rng, count):
+    # random tree: every test step is appended to a random open block
+    top_level = []
+    blocks = [top_level]
+    for line_no in range(1, count + 1):
+        test_step = FakeTestStep(rng.choice(STEP_TYPES), line_no)
+        rng.choice(blocks).append(test_step)
+        if test_step.step_type == 'TsBlock':
+            blocks.append(test_step.children)
+    return top_level
+
+
+def generate_packages(scale: Scale):
+    """
+    Generates the packages of the given scale, the same seed gives the same packages.
+    """
+    rng = random.Random(scale.seed)
+    packages = []
+    for index in range(scale.packages):
+        test_case = rng.random() < 0.5
+        folder = 'testcases' if test_case else 'lib'
+        name = f'Package{index}'
+        packages.append(FakePackage(
+            name=name,
+            filename=f'/workspace/Packages/{folder}/{name}.pkg',
+            test_case=test_case,
+            version=rng.choice(('', '1.0.0', '1.2')),
+            description=rng.choice(('', 'short', 'a description which is long enough ' * 3)),
+            attributes=_attributes(rng, scale.attributes),
+            variables=_variables(rng, scale.variables),
+            test_steps=_test_steps(rng, scale.steps),
+            mapping_items=[FakeMappingItem(f'Mapping{i}', rng.choice(MAPPING_TYPES))
+                           for i in range(max(1, scale.variables // 4))]))
+    return packages
+
+
+def generate_projects(scale: Scale):
+    """
+    Generates the projects of the given scale, the same seed gives the same projects.
+    """
+    rng = random.Random(scale.seed + 1)
+    return [FakeProject(name=f'Project{index}',
+                        filename=f'/workspace/Projects/Project{index}.prj',
+                        attributes=_attributes(rng, scale.attributes))
+            for index in range(scale.projects)]
@@ -0,0 +1,69 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Shared fixtures of the tests, which run without ecu.test: the CustomChecks read a copy of the
+config_template.yaml with all checks enabled instead of the config.yaml of an ecu.test
+workspace.
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=C0413
+from UserPyModules.CustomChecks.helper import Configuration
+
+TEMPLATE = os.path.join(ROOT, 'UserPyModules', 'CustomChecks',
+                        Configuration.CONFIGURATION_TEMPLATE_FILE)
+# sample test item files
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+@pytest.fixture(scope='session')
+def config_file(tmp_path_factory):
+    """
+    Path of the configuration used by the tests, the template with all checks enabled.
+    """
+    with open(TEMPLATE, encoding='utf-8') as file:
+        content = file.read().replace('Enabled: false', 'Enabled: true')
+    path = tmp_path_factory.mktemp('config') / Configuration.CONFIGURATION_FILE
+    path.write_text(content, encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def configuration(config_file):
+    """
+    Uses the test configuration and starts every test with an empty configuration cache.
+    """
+    Configuration.set_config_file(config_file)
+    Configuration.clear_cache()
+    yield
+    Configuration.set_config_file(None)
+    Configuration.clear_cache()
+
+
+
+@pytest.fixture
+def offline_workspace(tmp_path):
+    """
+    Workspace with two packages and a project made of the sample files, and files which are no
+    test items, for batch runs with the offline loader.
+    """
+    root = tmp_path / 'workspace'
+    for source, target in (('Sample.pkg', 'Packages/TC_Sample.pkg'),
+                           ('Sample.pkg', 'Packages/lib/Library.pkg'),
+                           ('Sample.prj', 'Projects/Sample.prj'),
+                           ('Sample.pkg', '.hidden/Hidden.pkg')):
+        path = root / target
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(os.path.join(FIXTURES, source), str(path))
+    (root / 'Packages' / 'notes.txt').write_text('no test item')
+    return str(root)
@@ -0,0 +1,93 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+from benchmarks.Fakes import FakeMappingItem, FakePackage, FakeTestStep
+
+from UserPyModules.CustomChecks.helper.ApiRecorder import ApiRecorder, type_name
+
+
+class Collection:
+    """
+    Collection object of the object API, e.g. the test steps of a package.
+    """
+
+    def __init__(self, elements):
+        self.elements = elements
+
+    def __iter__(self):
+        return iter(self.elements)
+
+    def __len__(self):
+        return len(self.elements)
+
+
+class CollectionPackage(FakePackage):
+    """
+    Package returning its test steps as collection object.
+    """
+
+    def GetTestSteps(self, *args, **kwargs):  # pylint: disable=C0103
+        return Collection(super().GetTestSteps(*args, **kwargs))
+
+
+def make_package():
+    return CollectionPackage('TC', '/ws/TC.pkg', True, '1', 'description', {'Owner': 'me'}, [],
+                             [FakeTestStep('TsTodo', 3), FakeTestStep('TsBlock', 4)],
+                             [FakeMappingItem('Speed', 'READ')])
+
+
+def recorded_calls(recorder):
+    return {(check_name, method_name): (stats.calls, stats.duplicates)
+            for (check_name, method_name), stats in recorder.stats.items()}
+
+
+def test_calls_are_recorded_per_check():
+    recorder = ApiRecorder()
+    package = recorder.wrap(make_package())
+
+    with recorder.check('CheckPackageNamespace'):
+        assert package.GetName() == 'TC'
+        assert package.GetName() == 'TC'
+    with recorder.check('CheckPackageAttributes'):
+        assert package.Attributes.GetNamesAndValues() == {'Owner': 'me'}
+    assert package.GetMapping().GetItems()[0].GetReferenceName() == 'Speed'
+
+    assert recorded_calls(recorder) == {
+        ('CheckPackageNamespace', 'CollectionPackage.GetName'): (2, 1),
+        ('CheckPackageAttributes', 'FakeAttributes.GetNamesAndValues'): (1, 0),
+        ('(no check)', 'CollectionPackage.GetMapping'): (1, 0),
+        ('(no check)', 'FakeMapping.GetItems'): (1, 0),
+        ('(no check)', 'FakeMappingItem.GetReferenceName'): (1, 0),
+    }
+    assert 'Object API calls of CheckPackageNamespace:' in recorder.report()
+
+
+def test_calls_on_a_new_item_are_no_duplicates():
+    recorder = ApiRecorder()
+    recorder.wrap(make_package()).GetName()
+    recorder.wrap(make_package()).GetName()
+    assert recorded_calls(recorder) == {('(no check)', 'CollectionPackage.GetName'): (2, 0)}
+
+
+def test_special_methods_are_forwarded():
+    recorder = ApiRecorder()
+    item = make_package()
+    package = recorder.wrap(item)
+
+    test_steps = package.GetTestSteps(recursive=False)
+    assert type_name(test_steps) == 'Collection'
+    assert len(test_steps) == 2 and test_steps
+    assert [str(test_step) for test_step in test_steps] == ['TsTodo: line 3', 'TsBlock: line 4']
+    assert [type_name(test_step) for test_step in test_steps] == ['FakeTestStep'] * 2
+    assert not package.GetVariables()
+    assert package == recorder.wrap(item) == item
+    assert package != recorder.wrap(make_package())
+    assert len({package, recorder.wrap(item)}) == 1
+
+    calls = recorded_calls(recorder)
+    assert calls[('(no check)', 'Collection.__len__')] == (1, 0)
+    assert calls[('(no check)', 'Collection.__bool__')] == (1, 0)
+    assert calls[('(no check)', 'Collection.__iter__')] == (2, 1)
+    assert calls[('(no check)', 'FakeTestStep.__str__')] == (2, 0)
+    assert calls[('(no check)', 'CollectionPackage.__eq__')][0] == 4
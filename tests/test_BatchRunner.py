@@ -0,0 +1,165 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import json
+import os
+
+import pytest
+
+from UserPyModules.CustomChecks.api.CheckResult import CheckResult
+from UserPyModules.CustomChecks.batch import BatchRunner as batch_runner
+from UserPyModules.CustomChecks.batch.BatchRunner import (BatchRunner, ItemResult, JsonLinesSink,
+                                                          collect_items, discover_checks, main,
+                                                          parse_args)
+from UserPyModules.CustomChecks.batch.OfflineLoader import OfflineLoader
+from UserPyModules.CustomChecks.batch.WorkspaceIndex import WorkspaceIndex
+from UserPyModules.CustomChecks.CheckPackageNamespace import CheckPackageNamespace
+from UserPyModules.CustomChecks.CheckProjectAttributes import CheckProjectAttributes
+from UserPyModules.CustomChecks.helper.CheckType import CheckType
+
+
+def as_records(item_results):
+    return [(item_result.path, item_result.check_name,
+             [result.to_dict() for result in item_result.results], item_result.error)
+            for item_result in item_results]
+
+
+def test_json_lines_sink_writes_the_result_fields():
+    stream = io.StringIO()
+    sink = JsonLinesSink(stream)
+    result = CheckResult('"Test case" flag must be set!',
+                         check_name='CheckPackageGeneralInformation', sub_check='CheckTestCases',
+                         rule='TestCaseFlag', item_path='/ws/TC_Login.pkg', line=3)
+
+    sink.write(ItemResult('/ws/TC_Login.pkg', 'CheckPackageGeneralInformation', [result]))
+    sink.write(ItemResult('/ws/TC_Login.pkg', 'CheckPackageNamespace'))
+    sink.write(ItemResult('/ws/TC_Speed.pkg', 'CheckPackageNamespace', error='failed'))
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert records == [
+        {'path': '/ws/TC_Login.pkg', 'check': 'CheckPackageGeneralInformation',
+         'results': [{'message': '"Test case" flag must be set!',
+                      'check_name': 'CheckPackageGeneralInformation',
+                      'sub_check': 'CheckTestCases', 'rule': 'TestCaseFlag',
+                      'item_path': '/ws/TC_Login.pkg', 'line': 3, 'severity': 'error'}]},
+        {'path': '/ws/TC_Speed.pkg', 'check': 'CheckPackageNamespace', 'results': [],
+         'error': 'failed'}]
+    assert CheckResult.from_dict(records[0]['results'][0]) == result
+    assert (sink.checked, sink.violations, sink.errors) == (3, 1, 1)
+
+
+def test_discover_checks():
+    checks = discover_checks()
+    assert set(checks) == {CheckType.PACKAGE.value, CheckType.PROJECT.value,
+                           CheckType.ANALYSIS.value}
+    assert CheckPackageNamespace in checks[CheckType.PACKAGE.value]
+    assert CheckProjectAttributes in checks[CheckType.PROJECT.value]
+    for check_type, check_classes in checks.items():
+        for check_class in check_classes:
+            module = __import__(check_class.__module__, fromlist=['MODULE_TYPE'])
+            assert module.MODULE_TYPE == check_type
+
+
+def test_collect_items(offline_workspace, caplog):
+    notes = os.path.join(offline_workspace, 'Packages', 'notes.txt')
+    assert list(collect_items([offline_workspace, notes])) == [
+        os.path.join(offline_workspace, 'Packages', 'TC_Sample.pkg'),
+        os.path.join(offline_workspace, 'Packages', 'lib', 'Library.pkg'),
+        os.path.join(offline_workspace, 'Projects', 'Sample.prj')]
+    assert 'notes.txt" is no package' in caplog.text
+
+
+def test_run_item(offline_workspace):
+    runner = BatchRunner(loader=OfflineLoader())
+    path = os.path.join(offline_workspace, 'Packages', 'TC_Sample.pkg')
+    item_results = runner.run_item(path)
+
+    assert [item_result.check_name for item_result in item_results] == [
+        check.GetName() for check in runner.checks[CheckType.PACKAGE.value]]
+    assert all(item_result.path == path and item_result.error is None
+               for item_result in item_results)
+    assert any(item_result.results for item_result in item_results)
+    assert runner.run_item(os.path.join(offline_workspace, 'Packages', 'notes.txt')) == []
+
+
+def test_run_fused_equals_run_check(offline_workspace):
+    runner = BatchRunner(loader=OfflineLoader())
+    checks = runner.checks[CheckType.PACKAGE.value]
+    path = os.path.join(offline_workspace, 'Packages', 'TC_Sample.pkg')
+
+    item = runner.loader.open_item(path, CheckType.PACKAGE.value)
+    fused = runner.run_fused(checks, path, item)
+    assert as_records(fused[check.GetName()] for check in checks) == as_records(
+        runner.run_check(check, path, item) for check in checks)
+
+
+def test_run_indexed(offline_workspace, tmp_path):
+    index = WorkspaceIndex(str(tmp_path / 'index.db'))
+    runner = BatchRunner(loader=OfflineLoader(), index=index)
+    checks = runner.checks[CheckType.PACKAGE.value]
+    path = os.path.join(offline_workspace, 'Packages', 'TC_Sample.pkg')
+
+    # the package is not indexed yet, all checks need the opened package
+    content_hash, pending = runner.run_indexed(checks, path, {})
+    assert content_hash is not None and pending == checks
+    expected = as_records(runner.run_item(path))
+
+    item_results = {}
+    content_hash, pending = runner.run_indexed(checks, path, item_results)
+    assert content_hash is None
+    assert pending == [check for check in checks if not check.INDEXED]
+    assert sorted(item_results) == sorted(check.GetName() for check in checks if check.INDEXED)
+    assert as_records(runner.run_item(path)) == expected
+    index.close()
+
+
+def test_parse_args(monkeypatch):
+    monkeypatch.setattr(batch_runner, 'is_available', lambda: False)
+    assert parse_args(['--config', 'config.yaml', '--jobs', '4', 'ws']).jobs == 4
+    assert parse_args(['--config', 'config.yaml', '--jobs', 'auto', 'ws']).jobs is None
+    assert parse_args(['--config', 'config.yaml', 'ws']).jobs == 1
+
+
+@pytest.mark.parametrize('argv', [['--config', 'config.yaml', '--jobs', '0'],
+                                  ['--config', 'config.yaml', '--jobs', '-1'],
+                                  ['--config', 'config.yaml', '--shard-size', '0'],
+                                  ['--offline']])
+def test_invalid_arguments(argv, monkeypatch, capsys):
+    monkeypatch.setattr(batch_runner, 'is_available', lambda: False)
+    with pytest.raises(SystemExit) as exit_info:
+        parse_args(argv + ['ws'])
+    assert exit_info.value.code == 2
+    assert 'error:' in capsys.readouterr().err
+
+
+def test_config_of_the_offline_workspace_within_ecu_test(monkeypatch):
+    monkeypatch.setattr(batch_runner, 'is_available', lambda: True)
+    assert parse_args(['ws']).config is None
+
+
+def run_main(config_file, offline_workspace, output, *options):
+    code = main(['--offline', '--config', config_file, '--output', str(output), *options,
+                 offline_workspace])
+    with open(output, encoding='utf-8') as stream:
+        return code, stream.read()
+
+
+def test_main_modes_write_the_same_results(config_file, offline_workspace, tmp_path, capsys):
+    code, expected = run_main(config_file, offline_workspace, tmp_path / 'sequential.jsonl')
+    assert code == 1
+    records = [json.loads(line) for line in expected.splitlines()]
+    assert {record['path'] for record in records} == {
+        os.path.join(offline_workspace, 'Packages', 'TC_Sample.pkg'),
+        os.path.join(offline_workspace, 'Packages', 'lib', 'Library.pkg'),
+        os.path.join(offline_workspace, 'Projects', 'Sample.prj')}
+
+    cache, index = str(tmp_path / 'cache.db'), str(tmp_path / 'index.db')
+    for run, options in enumerate((['--cache', cache], ['--cache', cache],
+                                   ['--index', index], ['--index', index])):
+        assert run_main(config_file, offline_workspace, tmp_path / f'{run}.jsonl', *options) == (
+            code, expected), options
+        if run == 1:
+            # the second run takes all results from the cache
+            assert ' 0 misses' in capsys.readouterr().err
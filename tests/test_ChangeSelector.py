@@ -0,0 +1,84 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from UserPyModules.CustomChecks.batch.ChangeSelector import ChangeSelector
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git is not installed')
+
+
+def git(repository, *args):
+    subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com']
+                   + list(args), cwd=repository, check=True, stdout=subprocess.PIPE,
+                   stderr=subprocess.PIPE)
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    files = {
+        'Packages/Login.pkg': '<PACKAGE/>',
+        'Packages/Speed.pkg': '<PACKAGE/>',
+        'Packages/Unused.pkg': '<PACKAGE/>',
+        'Projects/LoginTests.prj': '<PROJECT><PACKAGEREFERENCE PATH="../Packages/Login.pkg"/>'
+                                   '</PROJECT>',
+        'Projects/SpeedTests.prj': '<PROJECT><PACKAGEREFERENCE PATH="../Packages/Speed.pkg"/>'
+                                   '</PROJECT>',
+    }
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'add', '.')
+    git(tmp_path, 'commit', '-q', '-m', 'workspace')
+    return os.path.realpath(str(tmp_path))
+
+
+def test_changed_package_selects_its_projects(workspace):
+    with open(os.path.join(workspace, 'Packages', 'Speed.pkg'), 'a', encoding='utf-8') as stream:
+        stream.write('\n')
+
+    selector = ChangeSelector('HEAD')
+    assert selector.select([workspace]) == [
+        os.path.join(workspace, 'Packages', 'Speed.pkg'),
+        os.path.join(workspace, 'Projects', 'SpeedTests.prj')]
+    assert (selector.changed, selector.projects) == (1, 1)
+
+
+def test_deleted_package_selects_its_projects(workspace):
+    os.remove(os.path.join(workspace, 'Packages', 'Login.pkg'))
+
+    selector = ChangeSelector('HEAD')
+    # the deleted package itself is not run
+    assert selector.select([workspace]) == [
+        os.path.join(workspace, 'Projects', 'LoginTests.prj')]
+    assert (selector.changed, selector.projects) == (0, 1)
+
+
+def test_changed_packages_outside_of_the_scope(workspace):
+    git(workspace, 'rm', '-q', os.path.join('Packages', 'Login.pkg'))
+    with open(os.path.join(workspace, 'Packages', 'Speed.pkg'), 'a', encoding='utf-8') as stream:
+        stream.write('\n')
+
+    projects = os.path.join(workspace, 'Projects')
+    assert ChangeSelector('HEAD').select([projects]) == [
+        os.path.join(projects, 'LoginTests.prj'), os.path.join(projects, 'SpeedTests.prj')]
+
+
+def test_renamed_package_selects_the_projects_of_its_old_name(workspace):
+    git(workspace, 'mv', os.path.join('Packages', 'Login.pkg'),
+        os.path.join('Packages', 'Logon.pkg'))
+    git(workspace, 'commit', '-q', '-m', 'rename')
+
+    selector = ChangeSelector('HEAD~1')
+    # git reports the rename as deletion of the old and addition of the new package
+    assert selector.select([workspace]) == [
+        os.path.join(workspace, 'Packages', 'Logon.pkg'),
+        os.path.join(workspace, 'Projects', 'LoginTests.prj')]
+    assert (selector.changed, selector.projects) == (1, 1)
@@ -0,0 +1,86 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from UserPyModules.CustomChecks.CheckPackageAttributes import CheckPackageAttributes
+from UserPyModules.CustomChecks.CheckProjectAttributes import CheckProjectAttributes
+from UserPyModules.CustomChecks.helper.CheckAttributes import AttributeRules
+from UserPyModules.CustomChecks.helper.Configuration import set_config_file
+
+from benchmarks.Fakes import FakePackage, FakeProject
+
+CONFIG = '''
+{check}:
+    Enabled: true
+    CheckName:
+        Parameters:
+            Owner: false
+            Status: true
+            Testlevel: ["component", "module"]
+            Designer:
+                RegexPattern: '^[A-Z]'
+                CustomMessage: 'capitalized'
+                RegexDescription: 'a capitalized name'
+'''
+
+PARAMETERS = {
+    'Owner': False,
+    'Status': True,
+    'Testlevel': ['component', 'module'],
+    'Designer': {'RegexPattern': '^[A-Z]', 'CustomMessage': 'capitalized'},
+}
+
+
+@pytest.fixture
+def use_config(tmp_path):
+    def write(check):
+        path = tmp_path / 'config.yaml'
+        path.write_text(CONFIG.format(check=check))
+        set_config_file(str(path))
+    return write
+
+
+def package(attributes):
+    return FakePackage('TC_Login', '/ws/TC_Login.pkg', True, '1', 'description', attributes,
+                       [], [], [])
+
+
+def messages(results):
+    return [result.message for result in results]
+
+
+def test_parse_parameters(use_config):
+    use_config('CheckPackageAttributes')
+    parameters = CheckPackageAttributes(None).parse_parameters(PARAMETERS)
+
+    assert isinstance(parameters, AttributeRules)
+    assert [rule.name for rule in parameters.rules] == list(PARAMETERS)
+    assert parameters.rules[2].options == {'component', 'module'}
+    assert parameters.rules[3].regex == '^[A-Z]'
+    assert parameters.rules[3].pattern.match('Me')
+
+
+def test_package_attributes(use_config):
+    use_config('CheckPackageAttributes')
+    check = CheckPackageAttributes(None)
+    assert messages(check.Run(package({'Owner': '', 'Status': 'done', 'Testlevel': 'module',
+                                       'Designer': 'Me'}))) == []
+    # the attributes which are set are checked first
+    assert messages(check.Run(package({'Owner': 'me', 'Testlevel': 'component,system',
+                                       'Designer': 'me'}))) == [
+        '"Owner" must not be set!',
+        '"Testlevel" no valid option out of: [\'component\', \'module\']',
+        '"Designer" does not match pattern. "capitalized"',
+        '"Status" must not be empty!']
+
+
+def test_project_attributes(use_config):
+    use_config('CheckProjectAttributes')
+    check = CheckProjectAttributes(None)
+    assert messages(check.Run(FakeProject('Project', '/ws/Project.prj',
+                                          {'Designer': 'me'}))) == [
+        '"Designer" does not match pattern: a capitalized name',
+        '"Status" must not be empty',
+        '"Testlevel" must not be empty']
@@ -0,0 +1,139 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import json
+import sys
+
+import pytest
+
+from UserPyModules.CustomChecks.batch.BatchRunner import BatchRunner
+from UserPyModules.CustomChecks.CheckPackageContentAllowed import CheckPackageContentAllowed
+from UserPyModules.CustomChecks.helper.Configuration import set_config_file
+from UserPyModules.CustomChecks.helper.ItemSnapshot import ItemSnapshot
+
+from benchmarks.Fakes import FakePackage, FakeTestStep, Scale, generate_packages
+
+CONFIG = '''
+CheckPackageContentAllowed:
+    Enabled: true
+    CheckName:
+        Parameters:
+            Allowlist: {allow_list}
+            SearchDepth: {search_depth}
+'''
+
+ALLOW_LIST = ['TsBlock', 'TsWait', 'TsCalculation']
+
+
+def baseline_messages(package, allow_list, search_depth):
+    """
+    Messages of CheckPackageContentAllowed before the test steps were walked iteratively, which
+    recursed into the children of every test step, disabled ones included.
+    """
+    messages = []
+    search_depth = search_depth or float('inf')
+
+    def children(item):
+        try:
+            return item.GetTestSteps(skipDisabledSteps=False, recursive=False, whiteList=None,
+                                     blackList=None)
+        except AttributeError:
+            return []
+
+    def check_test_step(test_step, layer):
+        if layer >= search_depth:
+            return
+        if test_step.GetType() not in allow_list:
+            messages.append(f'Not allowed content of type {test_step.GetType()} in line '
+                            f'{test_step.GetLineNo()}!')
+        for child in children(test_step):
+            check_test_step(child, layer + 1)
+
+    for test_step in children(package):
+        check_test_step(test_step, 0)
+    return messages
+
+
+def packages():
+    generated = generate_packages(Scale(packages=8, steps=150, seed=3))
+    # disabled test steps and their children are checked as well
+    disabled = FakeTestStep('TsBlock', 151, enabled=False)
+    disabled.children.append(FakeTestStep('TsTodo', 152))
+    generated[0].test_steps.append(disabled)
+    return generated
+
+
+def deep_package(depth):
+    top_level = test_step = FakeTestStep('TsBlock', 1)
+    for line_no in range(2, depth + 1):
+        child = FakeTestStep('TsBlock' if line_no % 3 else 'TsTodo', line_no)
+        test_step.children.append(child)
+        test_step = child
+    return FakePackage('Deep', '/ws/Deep.pkg', True, '', '', {}, [], [top_level], [])
+
+
+@pytest.fixture
+def use_config(tmp_path):
+    def write(search_depth):
+        path = tmp_path / 'config.yaml'
+        path.write_text(CONFIG.format(allow_list=json.dumps(ALLOW_LIST),
+                                      search_depth=json.dumps(search_depth)))
+        set_config_file(str(path))
+    return write
+
+
+def messages(results):
+    return [result.message for result in results]
+
+
+@pytest.mark.parametrize('search_depth', [None, 1, 2, 3, 100])
+def test_results_equal_the_baseline(search_depth, use_config):
+    use_config(search_depth)
+    check = CheckPackageContentAllowed(None)
+    parameters = check.parse_parameters({'Allowlist': ALLOW_LIST, 'SearchDepth': search_depth})
+
+    for package in packages():
+        expected = baseline_messages(package, ALLOW_LIST, search_depth)
+        assert messages(check.Run(package)) == expected
+        assert messages(check.check(package, parameters)) == expected
+
+        # fused traversal shared with other checks
+        item_result = BatchRunner.run_fused([check], package.GetFilename(),
+                                            ItemSnapshot(package))[check.GetName()]
+        assert item_result.error is None
+        assert messages(item_result.results) == expected
+
+
+def test_check_test_step_equals_the_baseline():
+    check = CheckPackageContentAllowed(None)
+    for package in packages():
+        for test_step in package.test_steps:
+            for search_depth in (1, 2, float('inf')):
+                expected = baseline_messages(FakePackage('', '', True, '', '', {}, [],
+                                                         [test_step], []),
+                                             ALLOW_LIST, search_depth)
+                assert messages(check.check_test_step(test_step, 0, ALLOW_LIST,
+                                                      search_depth)) == expected
+
+
+@pytest.mark.parametrize('search_depth', [None, 50])
+def test_deep_trees_equal_the_baseline(search_depth, use_config):
+    use_config(search_depth)
+    package = deep_package(300)
+    assert messages(CheckPackageContentAllowed(None).Run(package)) == baseline_messages(
+        package, ALLOW_LIST, search_depth)
+
+
+def test_trees_deeper_than_the_recursion_limit(use_config):
+    use_config(None)
+    depth = sys.getrecursionlimit() * 3
+    package = deep_package(depth)
+
+    # the baseline recursion fails here, the iterative walk reports every third test step
+    assert messages(CheckPackageContentAllowed(None).Run(package)) == [
+        f'Not allowed content of type TsTodo in line {line_no}!'
+        for line_no in range(3, depth + 1, 3)]
+    item_result = BatchRunner.run_fused([CheckPackageContentAllowed(None)], '/ws/Deep.pkg',
+                                        ItemSnapshot(package))['CheckPackageContentAllowed']
+    assert item_result.error is None and len(item_result.results) == depth // 3
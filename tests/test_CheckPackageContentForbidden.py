@@ -0,0 +1,95 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+
+from UserPyModules.CustomChecks.batch.BatchRunner import BatchRunner
+from UserPyModules.CustomChecks.CheckPackageContentForbidden import CheckPackageContentForbidden
+from UserPyModules.CustomChecks.helper.Configuration import set_config_file
+from UserPyModules.CustomChecks.helper.ItemSnapshot import ItemSnapshot
+
+from benchmarks.Fakes import FakeTestStep, Scale, generate_packages
+
+CONFIG = '''
+CheckPackageContentForbidden:
+    Enabled: true
+    CheckName:
+        Parameters:
+            Denylist: {denylist}
+'''
+
+DENYLISTS = [
+    [],
+    ['TsTodo'],
+    # overlapping entries: substrings of each other and of several test step types
+    ['Todo', 'TsTodo', 'do', 'Ts'],
+    ['TsPrecon', 'TsPost', 'Ts'],
+    ['line 1', 'line 12', 'line 123'],
+    ['Todo', 'Todo'],
+    ['k: line', 'TsBlock: line 2'],
+    # regular expression characters are plain text
+    ['.*', '[Ts]', 'Ts|Block'],
+    [''],
+]
+
+
+def baseline_messages(package, denylist):
+    """
+    Messages of CheckPackageContentForbidden before the test steps were scanned once, which
+    searched all test steps for every denylist entry.
+    """
+    messages = []
+    ts_list = package.GetTestSteps(recursive=True)
+    for forbidden in denylist:
+        for test_step in ts_list:
+            if forbidden in str(test_step):
+                messages.append(f'Forbidden content of type {test_step.GetType()} in line '
+                                f'{test_step.GetLineNo()}!')
+    return messages
+
+
+def packages():
+    generated = generate_packages(Scale(packages=8, steps=150, seed=9))
+    # a disabled block hides its test steps
+    disabled = FakeTestStep('TsBlock', 151, enabled=False)
+    disabled.children.append(FakeTestStep('TsTodo', 152))
+    generated[0].test_steps.append(disabled)
+    return generated
+
+
+@pytest.fixture
+def use_config(tmp_path):
+    def write(denylist):
+        path = tmp_path / 'config.yaml'
+        path.write_text(CONFIG.format(denylist=json.dumps(denylist)))
+        set_config_file(str(path))
+    return write
+
+
+@pytest.mark.parametrize('denylist', DENYLISTS)
+def test_results_equal_the_baseline(denylist, use_config):
+    use_config(denylist)
+    check = CheckPackageContentForbidden(None)
+    parameters = check.parse_parameters({'Denylist': denylist})
+
+    for package in packages():
+        expected = baseline_messages(package, denylist)
+        assert [result.message for result in check.Run(package)] == expected
+        assert [result.message for result in check.check(package, parameters)] == expected
+
+        # fused traversal shared with other checks
+        item_result = BatchRunner.run_fused([check], package.GetFilename(),
+                                            ItemSnapshot(package))[check.GetName()]
+        assert item_result.error is None
+        assert [result.message for result in item_result.results] == expected
+
+
+def test_overlapping_entries_report_a_test_step_per_entry(use_config):
+    use_config(['Todo', 'TsTodo'])
+    package = generate_packages(Scale(packages=1, steps=0))[0]
+    package.test_steps.append(FakeTestStep('TsTodo', 1))
+    assert [result.message for result in CheckPackageContentForbidden(None).Run(package)] == [
+        'Forbidden content of type TsTodo in line 1!'] * 2
@@ -0,0 +1,85 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from UserPyModules.CustomChecks.CheckPackageGeneralInformation import (
+    CheckPackageGeneralInformation, GeneralInformation, TextPattern)
+from UserPyModules.CustomChecks.helper.Configuration import set_config_file
+
+from benchmarks.Fakes import FakePackage
+
+CONFIG = '''
+CheckPackageGeneralInformation:
+    Enabled: true
+    CheckName:
+        Parameters:
+            {parameters}
+'''
+
+PARAMETERS = '''TestCaseFlag: true
+            Version:
+                RegexPattern: '^\\d+\\.\\d+$'
+            Description:
+                Check: true
+                MinLength: 10
+                RegexPattern: '^((?!error).)*$'
+                CustomMessage: 'no errors'
+'''
+
+
+@pytest.fixture
+def use_config(tmp_path):
+    def write(parameters):
+        path = tmp_path / 'config.yaml'
+        path.write_text(CONFIG.format(parameters=parameters))
+        set_config_file(str(path))
+    return write
+
+
+def package(tc_flag, version, description):
+    return FakePackage('TC_Login', '/ws/TC_Login.pkg', tc_flag, version, description, {}, [],
+                       [], [])
+
+
+def messages(results):
+    return [result.message for result in results]
+
+
+def test_parse_parameters(use_config):
+    use_config(PARAMETERS)
+    check = CheckPackageGeneralInformation(None)
+    parameters = check.parse_parameters({
+        'TestCaseFlag': True,
+        'Version': {'RegexPattern': '^\\d+\\.\\d+$'},
+        'Description': {'Check': True, 'MinLength': 10, 'RegexPattern': '^((?!error).)*$',
+                        'CustomMessage': 'no errors'}})
+
+    assert isinstance(parameters, GeneralInformation)
+    assert parameters.check_description and parameters.min_description_length == 10
+    assert parameters.description_pattern.has_custom_message
+    assert parameters.description_pattern.pattern.search('fine')
+    assert parameters.test_case_flag is True
+    assert isinstance(parameters.version, TextPattern)
+    assert parameters.version.custom_message is None
+
+
+def test_unchecked_description_is_ignored(use_config):
+    use_config(PARAMETERS)
+    parameters = CheckPackageGeneralInformation(None).parse_parameters(
+        {'Description': {'Check': False, 'MinLength': 10}, 'Version': False})
+    assert parameters == GeneralInformation(version=False)
+
+
+def test_results(use_config):
+    use_config(PARAMETERS)
+    check = CheckPackageGeneralInformation(None)
+    assert messages(check.Run(package(True, '1.0', 'a long description'))) == []
+    assert messages(check.Run(package(False, 'v1', 'an error'))) == [
+        'Description insufficient. Should contain at least 10 characters!',
+        'Description should contain pattern. no errors',
+        '"Test case" flag must be set!',
+        'Version "v1" does not match pattern: "^\\d+\\.\\d+$"']
+    assert messages(check.Run(package(True, '', ''))) == [
+        'Description must not be empty!', 'Version must be set!']
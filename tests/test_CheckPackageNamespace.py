@@ -0,0 +1,74 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from UserPyModules.CustomChecks.CheckPackageNamespace import CheckPackageNamespace
+from UserPyModules.CustomChecks.helper.Configuration import Configuration, set_config_file
+
+from benchmarks.Fakes import FakePackage
+
+CONFIG = '''
+CheckPackageNamespace:
+    Enabled: true
+    CheckName:
+        Parameters:
+            {parameters}
+'''
+
+
+@pytest.fixture
+def use_config(tmp_path):
+    def write(parameters):
+        path = tmp_path / 'config.yaml'
+        path.write_text(CONFIG.format(parameters=parameters))
+        set_config_file(str(path))
+    return write
+
+
+def package(name, filename):
+    return FakePackage(name, filename, True, '', '', {}, [], [], [])
+
+
+def messages(results):
+    return [result.message for result in results]
+
+
+def test_name_pattern(use_config):
+    use_config("RegexPattern: '^TC_'")
+    check = CheckPackageNamespace(None)
+    assert messages(check.Run(package('TC_Login', '/ws/TC_Login.pkg'))) == []
+    assert messages(check.Run(package('Login', '/ws/Login.pkg'))) == [
+        'Login does not follow name pattern: "^TC_"']
+
+
+def test_unsaved_package(use_config):
+    use_config("RegexPattern: '^TC_'")
+    assert messages(CheckPackageNamespace(None).Run(package('TC_Login', None))) == [
+        'Please save the package "TC_Login". Could not find folder location!']
+
+
+def test_custom_message(use_config):
+    use_config("RegexPattern: '^TC_'\n            CustomMessage: 'use the TC_ prefix'")
+    assert messages(CheckPackageNamespace(None).Run(package('Login', '/ws/Login.pkg'))) == [
+        'Login does not follow name pattern. use the TC_ prefix']
+
+
+def test_empty_custom_message_is_used(use_config):
+    # like before the parameters were parsed once, a configured message is used even if empty
+    use_config("RegexPattern: '^TC_'\n            CustomMessage:")
+    assert messages(CheckPackageNamespace(None).Run(package('Login', '/ws/Login.pkg'))) == [
+        'Login does not follow name pattern. None']
+
+
+def test_unsaved_package_without_pattern(use_config):
+    use_config("CustomMessage: 'no pattern'")
+    check = CheckPackageNamespace(None)
+    assert messages(check.Run(package('Login', '/ws/Login.pkg'))) == []
+    assert messages(check.Run(package('Login', None))) == [
+        'Please save the package "Login". Could not find folder location!']
+    # the missing pattern is reported once, by the schema validation
+    assert Configuration().config_errors == [
+        "Invalid configuration at CheckPackageNamespace > CheckName > Parameters: "
+        "'RegexPattern' is required. Check \"{}\"!".format(Configuration().config_rel_path)]
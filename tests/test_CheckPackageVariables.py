@@ -0,0 +1,158 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import random
+
+import pytest
+
+from UserPyModules.CustomChecks.CheckPackageVariables import (CheckPackageVariables,
+                                                              VariableRules)
+from UserPyModules.CustomChecks.helper.Configuration import set_config_file
+
+from benchmarks.Fakes import FakePackage, FakeVariable
+
+CONFIG = '''
+CheckPackageVariables:
+    Enabled: true
+    CheckName:
+        Parameters:
+            AllowUndefinedVariables: false
+            Order:
+                SortMethod: {sort_method}
+                NumberOfRelevantCharacters: {relevant_chars}
+            Parameter:
+                Name:
+                    RegexPattern: '^P_'
+                    CustomMessage: 'P_<Name>'
+                Description:
+                    RegexPattern: '.+'
+            LocalVar:
+                Name:
+                    RegexPattern: '^V_'
+'''
+
+
+@pytest.fixture
+def use_config(tmp_path):
+    def write(sort_method='ascending', relevant_chars=2):
+        path = tmp_path / 'config.yaml'
+        path.write_text(CONFIG.format(sort_method=sort_method, relevant_chars=relevant_chars))
+        set_config_file(str(path))
+    return write
+
+
+def package(*variables):
+    return FakePackage('TC_Login', '/ws/TC_Login.pkg', True, '1', 'description', {},
+                       list(variables), [], [])
+
+
+def messages(results):
+    return [result.message for result in results]
+
+
+def test_parse_parameters(use_config):
+    use_config()
+    check = CheckPackageVariables(None)
+    parameters = check.parse_parameters({
+        'AllowUndefinedVariables': False,
+        'Order': {'SortMethod': 'ascending', 'NumberOfRelevantCharacters': 'None'},
+        'Parameter': {'Name': {'RegexPattern': '^P_', 'CustomMessage': 'P_<Name>'}},
+        'LocalVar': {'Description': {'RegexPattern': '.+'}}})
+
+    assert isinstance(parameters, VariableRules)
+    assert sorted(parameters.kinds) == ['LocalVar', 'Parameter']
+    assert parameters.kinds['Parameter'].name.custom_message == 'P_<Name>'
+    assert parameters.kinds['Parameter'].description is None
+    assert parameters.kinds['LocalVar'].name is None
+    assert parameters.kinds['LocalVar'].description.pattern.match('text')
+    assert parameters.relevant_chars is None
+
+
+def test_results(use_config):
+    use_config()
+    results = CheckPackageVariables(None).Run(package(
+        FakeVariable('V_b', 'Float', False, False, ''),
+        FakeVariable('speed', 'Float', True, False, ''),
+        FakeVariable('V_a', 'Float', False, False, '')))
+    assert messages(results) == [
+        'Variable "speed" does not match pattern. P_<Name>',
+        'Description for Parameter "speed" should not be empty',
+        'Variables are not sorted in ascending order, considering the first 2 characters! '
+        '"speed" should come before "V_b".']
+
+
+def test_full_names_are_compared(use_config):
+    use_config(sort_method='descending', relevant_chars="'None'")
+    results = CheckPackageVariables(None).Run(package(
+        FakeVariable('V_a', 'Float', False, False, ''),
+        FakeVariable('V_b', 'Float', False, False, '')))
+    assert messages(results) == [
+        'Variables are not sorted in descending order! "V_b" should come before "V_a".']
+
+
+def baseline_order_messages(names, sort_method, relevant_chars):
+    """
+    Messages of check_variable_order before the order was checked in one pass, which compared
+    the variable names with their sorted copy.
+    """
+    suffix = ''
+    if relevant_chars and relevant_chars != 'None':
+        names = [name[:relevant_chars] for name in names]
+        suffix = f', considering the first {relevant_chars} characters'
+    if sort_method == 'None':
+        return []
+    if sort_method not in ('ascending', 'descending'):
+        return [f'Sort method "{sort_method}" is not supported!']
+    if sorted(names, key=str.casefold, reverse=sort_method == 'descending') != names:
+        return [f'Variables are not sorted in {sort_method} order{suffix}!']
+    return []
+
+
+def order_parameters(sort_method, relevant_chars):
+    return {'Order': {'SortMethod': sort_method, 'NumberOfRelevantCharacters': relevant_chars}}
+
+
+def random_names(rng, count):
+    alphabet = ['a', 'A', 'b', 'B', '_', '1', 'ß', 'ss', 'SS', 'İ', 'i']
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize('sort_method', ['ascending', 'descending'])
+@pytest.mark.parametrize('relevant_chars', [None, 'None', 0, 1, 2])
+def test_order_equals_the_baseline(sort_method, relevant_chars):
+    rng = random.Random(25)
+    check = CheckPackageVariables(None)
+    parameters = order_parameters(sort_method, relevant_chars)
+    descending = sort_method == 'descending'
+    length = relevant_chars if relevant_chars != 'None' else None
+
+    cases = [random_names(rng, rng.randint(0, 6)) for _ in range(500)]
+    # sorted lists, also with equal keys of different names
+    cases += [sorted(names, key=str.casefold, reverse=descending) for names in cases[:100]]
+    cases += [['a', 'A', 'b'], ['B', 'b', 'a'], ['ss', 'ß', 'SS'], ['b', 'a'], ['a', 'b']]
+
+    for names in cases:
+        variables = [FakeVariable(name, 'Float', False, False, '') for name in names]
+        results = messages(check.check_variable_order(package(*variables), parameters))
+        expected = baseline_order_messages(names, sort_method, relevant_chars)
+        assert len(results) == len(expected), names
+        if expected:
+            # the first adjacent pair out of order is named
+            assert results[0].startswith(expected[0][:-1] + '! "')
+            keys = [name[:length or None].casefold() for name in names]
+            index = next(index for index in range(1, len(keys))
+                         if (keys[index] > keys[index - 1] if descending
+                             else keys[index] < keys[index - 1]))
+            assert results[0].endswith(f'"{names[index]}" should come before '
+                                       f'"{names[index - 1]}".')
+
+
+@pytest.mark.parametrize('sort_method', ['None', 'random'])
+def test_order_without_sorting_equals_the_baseline(sort_method):
+    parameters = order_parameters(sort_method, 2)
+    variables = [FakeVariable(name, 'Float', False, False, '') for name in ('V_b', 'V_a')]
+    assert messages(CheckPackageVariables(None).check_variable_order(
+        package(*variables), parameters)) == baseline_order_messages(['V_b', 'V_a'],
+                                                                     sort_method, 2)
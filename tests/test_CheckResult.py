@@ -0,0 +1,52 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from UserPyModules.CustomChecks.api.CheckResult import CheckResult, Severity
+
+
+def test_bind_returns_a_new_result():
+    result = CheckResult('Forbidden content of type {} in line {}!', 'TsTodo', 4, line=4)
+    hash_before = hash(result)
+    results = {result}
+
+    bound = result.bind('CheckPackageContentForbidden', 'CheckTestCases', '/ws/TC.pkg')
+
+    assert bound is not result
+    assert (bound.check_name, bound.sub_check, bound.item_path, bound.line) == (
+        'CheckPackageContentForbidden', 'CheckTestCases', '/ws/TC.pkg', 4)
+    assert bound.message == 'Forbidden content of type TsTodo in line 4!'
+    # the unbound result is unchanged, e.g. still found in sets
+    assert (result.check_name, result.sub_check, result.item_path) == (None, None, None)
+    assert hash(result) == hash_before and result in results
+
+
+def test_bind_keeps_the_fields_set_by_the_check():
+    result = CheckResult('message', sub_check='CheckOwn')
+    bound = result.bind('CheckPackageVariables', 'CheckTestCases', '/ws/TC.pkg')
+    assert bound.sub_check == 'CheckOwn'
+
+    assert bound.bind('Other', 'Other', '/other.pkg') is bound
+
+
+def test_results_are_frozen():
+    result = CheckResult('message')
+    with pytest.raises(FrozenInstanceError):
+        result.line = 1
+    with pytest.raises(FrozenInstanceError):
+        del result.line
+
+
+def test_serialization():
+    result = CheckResult('{} is not set', 'Owner', check_name='CheckPackageAttributes',
+                         rule='Owner', severity=Severity.WARNING)
+    assert result.to_dict() == {'message': 'Owner is not set',
+                                'check_name': 'CheckPackageAttributes', 'rule': 'Owner',
+                                'severity': 'warning'}
+    assert CheckResult.from_dict(result.to_dict()) == result
+    assert pickle.loads(pickle.dumps(result)) == result
@@ -0,0 +1,66 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import re
+
+import pytest
+
+from UserPyModules.CustomChecks.helper.ConditionPlan import compile_conditions
+
+from benchmarks.Fakes import FakePackage
+
+
+def package(name='TC_Login', filename='/ws/Packages/testcases/TC_Login.pkg', test_case=True):
+    return FakePackage(name, filename, test_case, '1.0', '', {}, [], [], [])
+
+
+def test_no_conditions():
+    plan = compile_conditions(None)
+    assert plan.predicates == ()
+    assert plan.evaluate(package())
+
+
+def test_all_conditions_must_hold():
+    plan = compile_conditions({
+        'PackageFolder': {'RegexPattern': 'testcases'},
+        'PackageName': {'RegexPattern': '^TC_'},
+        'PackageProperties': {'TestCaseFlag': True},
+    })
+    assert plan.evaluate(package())
+    assert not plan.evaluate(package(name='Lib'))
+    assert not plan.evaluate(package(filename='/ws/Packages/lib/TC_Login.pkg'))
+    assert not plan.evaluate(package(test_case=False))
+
+
+def test_cheap_conditions_first():
+    calls = []
+
+    class Recording(FakePackage):
+        def GetFilename(self):  # pylint: disable=C0103
+            calls.append('folder')
+            return super().GetFilename()
+
+        def HasTestCaseFlag(self):  # pylint: disable=C0103
+            calls.append('flag')
+            return super().HasTestCaseFlag()
+
+    plan = compile_conditions({
+        'PackageFolder': {'RegexPattern': 'testcases'},
+        'PackageProperties': {'TestCaseFlag': True},
+    })
+    assert not plan.evaluate(Recording('Lib', '/ws/lib/Lib.pkg', False, '', '', {}, [], [], []))
+    assert calls == ['flag']
+
+
+def test_unknown_conditions_are_warnings(caplog):
+    plan = compile_conditions({'PackageSize': {'RegexPattern': '.'}})
+    assert plan.unknown == ('PackageSize',)
+    assert plan.evaluate(package())
+    assert 'Condition "PackageSize" is not implemented!' in caplog.text
+
+
+def test_broken_condition_raises_on_evaluation():
+    plan = compile_conditions({'PackageName': {'RegexPattern': '('}})
+    with pytest.raises(re.error):
+        plan.evaluate(package())
@@ -0,0 +1,98 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import marshal
+import os
+import pickle
+
+import pytest
+
+from UserPyModules.CustomChecks.helper import Configuration
+from UserPyModules.CustomChecks.helper.Configuration import (SNAPSHOT_SUFFIX, FrozenDict,
+                                                             load_config, read_snapshot,
+                                                             snapshot_key)
+
+CONFIG = b'''
+CheckPackageVariables:
+    Enabled: true
+    CheckVariables:
+        Parameters:
+            Order: 1
+'''
+
+
+def digest_of(path):
+    with open(path, 'rb') as stream:
+        return hashlib.sha256(stream.read()).hexdigest()
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / 'config.yaml'
+    path.write_bytes(CONFIG)
+    return str(path)
+
+
+def test_snapshot_is_reused(config_path):
+    config, errors, from_snapshot = load_config(config_path)
+    assert not from_snapshot
+    assert os.path.isfile(config_path + SNAPSHOT_SUFFIX)
+
+    snapshot_config, snapshot_errors, from_snapshot = load_config(config_path)
+    assert from_snapshot
+    assert snapshot_config == config and isinstance(snapshot_config, FrozenDict)
+    assert snapshot_errors == errors == [
+        (('CheckPackageVariables', 'CheckVariables', 'Parameters', 'Order'),
+         '1 is not of type object')]
+
+
+def test_snapshot_is_plain_data(config_path):
+    load_config(config_path)
+    with open(config_path + SNAPSHOT_SUFFIX, 'rb') as stream:
+        snapshot = marshal.load(stream)
+    assert type(snapshot['config']) is dict  # pylint: disable=C0123
+    assert snapshot['key'] == snapshot_key(digest_of(config_path))
+
+
+class Payload:
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return os.mkdir, (self.path,)
+
+
+def test_pickled_snapshot_is_not_executed(config_path, tmp_path):
+    marker = str(tmp_path / 'executed')
+    with open(config_path + SNAPSHOT_SUFFIX, 'wb') as stream:
+        pickle.dump({'key': None, 'config': Payload(marker)}, stream)
+
+    assert read_snapshot(config_path + SNAPSHOT_SUFFIX, '') is None
+    assert not load_config(config_path)[2]
+    assert not os.path.exists(marker)
+
+
+@pytest.mark.parametrize('name, value', [('__version__', '0.0'), ('_SCHEMA_HASH', 'other')])
+def test_snapshot_key(config_path, monkeypatch, name, value):
+    load_config(config_path)
+    monkeypatch.setattr(Configuration, name, value)
+    assert not load_config(config_path)[2]
+    assert load_config(config_path)[2]
+
+
+def test_snapshot_with_unexpected_values(config_path):
+    digest = digest_of(config_path)
+    with open(config_path + SNAPSHOT_SUFFIX, 'wb') as stream:
+        marshal.dump({'key': snapshot_key(digest), 'config': {'a': b'bytes'}, 'errors': []},
+                     stream)
+    assert read_snapshot(config_path + SNAPSHOT_SUFFIX, digest) is None
+
+
+def test_no_snapshot_of_other_values(tmp_path):
+    path = tmp_path / 'config.yaml'
+    path.write_text('Profiling:\n    Enabled: true\nCreated: 2023-01-01\n')
+    config, _, _ = load_config(str(path))
+    assert str(config['Created']) == '2023-01-01'
+    assert not os.path.exists(str(path) + SNAPSHOT_SUFFIX)
@@ -0,0 +1,45 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+from UserPyModules.CustomChecks.CheckPackageVariables import CheckPackageVariables
+from UserPyModules.CustomChecks.helper.ItemSnapshot import ItemSnapshot
+
+from benchmarks.Fakes import FakePackage, FakeVariable
+
+
+class CountingPackage(FakePackage):
+    """
+    Package which counts the calls of GetVariables.
+    """
+
+    def __init__(self):
+        super().__init__('TC_Speed', '/ws/TC_Speed.pkg', True, '1', 'description', {},
+                         [FakeVariable('P_Speed', 'Float', True, False, 'speed'),
+                          FakeVariable('wrong', 'Float', False, False, '')], [], [])
+        self.variables_calls = 0
+
+    def GetVariables(self):  # pylint: disable=C0103
+        self.variables_calls += 1
+        return super().GetVariables()
+
+
+def test_checks_of_one_pass_share_the_snapshot():
+    package = CountingPackage()
+    first, second = CheckPackageVariables(None), CheckPackageVariables(None)
+
+    assert first.Run(package) == second.Run(package) != []
+    assert package.variables_calls == 1
+
+    # the next pass reads the package again
+    first.Run(package)
+    assert package.variables_calls == 2
+
+
+def test_snapshot_of_another_item_is_not_shared():
+    check = CheckPackageVariables(None)
+    first, second = CountingPackage(), CountingPackage()
+    assert ItemSnapshot.shared(first, check) is not ItemSnapshot.shared(second, check)
+
+    snapshot = ItemSnapshot(first)
+    assert ItemSnapshot.shared(snapshot, check) is snapshot
@@ -0,0 +1,141 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import os
+
+import pytest
+
+from UserPyModules.CustomChecks.CheckPackageVariables import CheckPackageVariables
+from UserPyModules.CustomChecks.batch.PackageFile import read_package
+
+from conftest import FIXTURES
+
+SAMPLE = os.path.join(FIXTURES, 'Sample.pkg')
+
+
+@pytest.fixture(scope='module')
+def sample():
+    return read_package(SAMPLE)
+
+
+def test_values(sample):
+    assert sample.GetName() == 'Sample'
+    assert sample.GetFilename() == SAMPLE
+    assert sample.GetVersion() == '1.2.0'
+    assert sample.GetDescription() == 'Checks the login of a user'
+    assert sample.HasTestCaseFlag() is True
+
+
+def test_attributes(sample):
+    assert sample.Attributes.GetNamesAndValues() == {
+        'Designer': 'Jane Doe', 'Testlevel': 'component, module', 'Status': ''}
+
+
+def test_variables(sample):
+    assert [(variable.GetName(), variable.GetType(), variable.IsParameter(), variable.IsReturn(),
+             variable.GetDescription()) for variable in sample.GetVariables()] == [
+        ('P_user', 'String', True, False, 'name of the user'),
+        ('R_result', 'Integer', False, True, ''),
+        ('V_count', 'Integer', False, False, '')]
+
+
+def test_mapping(sample):
+    assert [(item.GetReferenceName(), item.GetAccessType())
+            for item in sample.GetMapping().GetItems()] == [('Ignition', 'SIGNAL'),
+                                                            ('Speed', 'MODEL')]
+
+
+def test_test_steps(sample):
+    steps = sample.GetTestSteps(skipDisabledSteps=False, recursive=True)
+    assert [(step.GetType(), step.GetLineNo(), step.IsEnabled()) for step in steps] == [
+        ('TsPrecon', 1, True), ('TsCalculation', 2, True), ('TsBlock', 3, False),
+        ('TsTodo', 4, True), ('TsBlock', 5, True), ('TsWait', 6, True)]
+    assert [str(step) for step in steps] == [
+        'TsPrecon Prepare', 'TsCalculation V_count = 0', 'TsBlock Old login', 'TsTodo remove',
+        'TsBlock Login', 'TsWait 10']
+
+
+def test_test_step_selection(sample):
+    # like the object API, disabled test steps and their children are left out by default
+    assert [step.GetLineNo() for step in sample.GetTestSteps()] == [1, 5]
+    assert [step.GetLineNo() for step in sample.GetTestSteps(recursive=True)] == [1, 2, 5, 6]
+    assert [step.GetLineNo() for step in sample.GetTestSteps(
+        recursive=True, whiteList=['TsBlock', 'TsWait'])] == [5, 6]
+    assert [step.GetLineNo() for step in sample.GetTestSteps(
+        skipDisabledSteps=False, recursive=True, blackList=['TsBlock'])] == [1, 2, 4, 6]
+    login = sample.GetTestSteps()[1]
+    assert [step.GetType() for step in login.GetTestSteps()] == ['TsWait']
+
+
+def test_unused_variables(sample):
+    # V_count is used by the expression of a calculation
+    assert [variable.GetName() for variable in sample.GetUnusedVariables()] == [
+        'P_user', 'R_result']
+    assert [result.message for result in CheckPackageVariables(None).check_unused_variable(
+        sample)] == ["Unused variables detected: ['P_user', 'R_result']"]
+
+
+def test_variables_are_referenced_by_identifiers(tmp_path):
+    path = tmp_path / 'References.pkg'
+    path.write_text('<PACKAGE><VARIABLES><VARIABLE NAME="V_a"/><VARIABLE NAME="V_ab"/>'
+                    '<VARIABLE NAME="TsWait"/><VARIABLE NAME="V_b"/><VARIABLE NAME="V_c"/>'
+                    '</VARIABLES><TESTSTEPS>'
+                    '<TESTSTEP TYPE="TsWait" DISABLED="true"><TIME>V_b*2</TIME></TESTSTEP>'
+                    '<TESTSTEP TYPE="TsCalculation" EXPRESSION="V_ab + 1"/>'
+                    '</TESTSTEPS><MAPPING><MAPPINGITEM REFERENCE-NAME="V_c"/></MAPPING>'
+                    '</PACKAGE>')
+    package = read_package(str(path))
+    assert [variable.GetName() for variable in package.GetUnusedVariables()] == [
+        'V_a', 'TsWait', 'V_c']
+
+
+def test_namespaces_are_ignored(tmp_path):
+    path = tmp_path / 'Namespaced.pkg'
+    path.write_text('<p:PACKAGE xmlns:p="urn:package"><p:TESTSTEPS>'
+                    '<p:TESTSTEP TYPE="TsWait"/></p:TESTSTEPS></p:PACKAGE>')
+    package = read_package(str(path))
+    assert [step.GetType() for step in package.GetTestSteps()] == ['TsWait']
+    assert package.GetVersion() == '' and package.GetVariables() == []
+
+
+def test_unknown_elements_are_ignored(tmp_path):
+    path = tmp_path / 'Extended.pkg'
+    path.write_text('<PACKAGE><HISTORY><VERSION>0.9</VERSION><TESTSTEPS/></HISTORY>'
+                    '<VERSION>1.0</VERSION>'
+                    '<VARIABLES><VARIABLE NAME="V_x"><UNIT>s</UNIT><DESCRIPTION>x</DESCRIPTION>'
+                    '</VARIABLE><CONSTANT/></VARIABLES>'
+                    '<TESTSTEPS><COMMENT><TESTSTEP/></COMMENT><TESTSTEP TYPE="TsWait"/>'
+                    '</TESTSTEPS>'
+                    '<MAPPING><MAPPINGITEM REFERENCE-NAME="Speed"><ALIAS/></MAPPINGITEM>'
+                    '<GROUP><MAPPINGITEM/></GROUP></MAPPING></PACKAGE>')
+    package = read_package(str(path))
+    assert package.GetVersion() == '1.0'
+    assert [(variable.GetName(), variable.GetDescription())
+            for variable in package.GetVariables()] == [('V_x', 'x')]
+    assert [(step.GetType(), step.GetLineNo()) for step in package.GetTestSteps()] == [
+        ('TsWait', 1)]
+    assert [item.GetReferenceName() for item in package.GetMapping().GetItems()] == ['Speed']
+
+
+@pytest.mark.parametrize('content, message', [
+    ('<PROJECT/>', "no package file, root element is 'PROJECT'"),
+    ('<PACKAGE/>', "element 'TESTSTEPS' is missing"),
+    ('<PACKAGE><VERSION>1</VERSION></PACKAGE>', "element 'TESTSTEPS' is missing"),
+    ('<PACKAGE><TESTSTEPS/><TESTSTEPS/></PACKAGE>', "element 'TESTSTEPS' is given twice"),
+    ('<PACKAGE><VERSION>1</VERSION><VERSION>2</VERSION><TESTSTEPS/></PACKAGE>',
+     "element 'VERSION' is given twice"),
+    ('<PACKAGE><TESTSTEPS><TESTSTEP/></TESTSTEPS></PACKAGE>',
+     "element 'TESTSTEP' has no 'TYPE'"),
+    ('<PACKAGE><TESTSTEPS/><ATTRIBUTES><ATTRIBUTE>x</ATTRIBUTE></ATTRIBUTES></PACKAGE>',
+     "element 'ATTRIBUTE' has no 'NAME'"),
+    ('<PACKAGE><TESTSTEPS/><VARIABLES><VARIABLE TYPE="Integer"/></VARIABLES></PACKAGE>',
+     "element 'VARIABLE' has no 'NAME'"),
+    ('<PACKAGE><TESTSTEPS/><MAPPING><MAPPINGITEM/></MAPPING></PACKAGE>',
+     "element 'MAPPINGITEM' has no 'REFERENCE-NAME'"),
+])
+def test_unexpected_structure(tmp_path, content, message):
+    path = tmp_path / 'Broken.pkg'
+    path.write_text(content)
+    with pytest.raises(ValueError, match=message):
+        read_package(str(path))
@@ -0,0 +1,112 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from UserPyModules.CustomChecks.batch.BatchRunner import BatchRunner, discover_checks
+from UserPyModules.CustomChecks.helper.CheckType import CheckType
+from UserPyModules.CustomChecks.helper.ItemSnapshot import ItemSnapshot
+from UserPyModules.CustomChecks.helper.PackageVisitor import PackageVisitor, traverse
+
+from benchmarks.Fakes import FakePackage, FakeTestStep, Scale, generate_packages
+
+
+class WalkedPackage(FakePackage):
+    """
+    Package which records the 'recursive' argument of its GetTestSteps calls.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.recursive_calls = []
+
+    def GetTestSteps(self, skipDisabledSteps=True, recursive=True,  # pylint: disable=C0103
+                     whiteList=None, blackList=None):
+        self.recursive_calls.append(recursive)
+        return super().GetTestSteps(skipDisabledSteps, recursive, whiteList, blackList)
+
+
+def step(step_type, line_no, enabled=True, children=()):
+    test_step = FakeTestStep(step_type, line_no, enabled)
+    test_step.children.extend(children)
+    return test_step
+
+
+def package_with_disabled_steps():
+    test_steps = [
+        step('TsBlock', 1, children=[
+            step('TsTodo', 2, enabled=False),
+            step('TsWait', 3)]),
+        step('TsTodo', 4),
+        step('TsBlock', 5, enabled=False, children=[
+            step('TsTodo', 6)]),
+    ]
+    return WalkedPackage('TC_Disabled', '/ws/Packages/testcases/TC_Disabled.pkg', True, '1.0',
+                         'a package with disabled test steps', {}, [], test_steps, [])
+
+
+@pytest.fixture
+def package_checks():
+    checks = discover_checks()[CheckType.PACKAGE.value]
+    return [check(None) for check in checks]
+
+
+def standalone_results(checks, package):
+    return {check.GetName(): BatchRunner.run_check(check, package.filename,
+                                                    ItemSnapshot(package))
+            for check in checks}
+
+
+def fused_results(checks, package):
+    return BatchRunner.run_fused(checks, package.filename, ItemSnapshot(package))
+
+
+def test_disabled_steps_are_not_forbidden(package_checks):
+    package = package_with_disabled_steps()
+    fused = fused_results(package_checks, package)['CheckPackageContentForbidden']
+    assert fused.error is None
+    assert [result.line for result in fused.results] == [4]
+    # the test steps of all checks are read by one walk, layer by layer
+    assert package.recursive_calls == [False]
+
+
+def test_fused_results_equal_standalone_results(package_checks):
+    packages = generate_packages(Scale(packages=30, steps=40, variables=12, seed=3))
+    packages.append(package_with_disabled_steps())
+    for package in packages:
+        standalone = standalone_results(package_checks, package)
+        fused = fused_results(package_checks, package)
+        assert fused.keys() == standalone.keys()
+        for name, item_result in standalone.items():
+            assert item_result.error is None, item_result.error
+            assert fused[name].results == item_result.results, (name, package.name)
+
+
+class Recorder(PackageVisitor):
+    search_depth = 1
+
+    def __init__(self):
+        self.calls = []
+
+    def on_step(self, layer, test_step):
+        self.calls.append(('step', layer, test_step.GetLineNo()))
+
+    def on_recursive_step(self, test_step):
+        self.calls.append(('recursive', test_step.GetLineNo()))
+
+
+class Failing(PackageVisitor):
+
+    def on_step(self, layer, test_step):
+        raise RuntimeError('broken visitor')
+
+
+def test_traverse_hands_each_visitor_its_test_steps():
+    recorder = Recorder()
+    failing = Failing()
+    errors = traverse(ItemSnapshot(package_with_disabled_steps()), [failing, recorder])
+    assert recorder.calls == [('step', 0, 1), ('recursive', 1), ('recursive', 3),
+                              ('step', 0, 4), ('recursive', 4), ('step', 0, 5)]
+    assert list(errors) == [id(failing)]
+    assert str(errors[id(failing)]) == 'broken visitor'
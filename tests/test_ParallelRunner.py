@@ -0,0 +1,60 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import os
+
+from UserPyModules.CustomChecks.batch.BatchRunner import OFFLINE_LOADER, BatchRunner, main
+from UserPyModules.CustomChecks.batch.OfflineLoader import OfflineLoader
+from UserPyModules.CustomChecks.batch.ParallelRunner import ParallelRunner
+
+
+def as_records(item_results):
+    return [(item_result.path, item_result.check_name,
+             [result.to_dict() for result in item_result.results], item_result.error)
+            for item_result in item_results]
+
+
+def parallel_runner(config_file, tmp_path=None):
+    return ParallelRunner(workers=2, shard_size=1, config_file=config_file,
+                          loader_spec=OFFLINE_LOADER,
+                          cache_file=tmp_path and str(tmp_path / 'cache.db'),
+                          index_file=tmp_path and str(tmp_path / 'index.db'))
+
+
+def test_iter_shards(offline_workspace):
+    runner = ParallelRunner(workers=2, shard_size=2)
+    assert list(runner.iter_shards([offline_workspace])) == [
+        [os.path.join(offline_workspace, 'Packages', 'TC_Sample.pkg'),
+         os.path.join(offline_workspace, 'Packages', 'lib', 'Library.pkg')],
+        [os.path.join(offline_workspace, 'Projects', 'Sample.prj')]]
+
+
+def test_results_equal_the_sequential_run(config_file, offline_workspace):
+    expected = as_records(BatchRunner(loader=OfflineLoader()).run([offline_workspace]))
+    assert expected
+
+    runner = parallel_runner(config_file)
+    assert as_records(runner.run([offline_workspace])) == expected
+    assert sum(stats.items for stats in runner.worker_stats.values()) == 3
+    assert len(runner.format_worker_stats().splitlines()) == len(runner.worker_stats)
+
+
+def test_shared_cache_and_index(config_file, offline_workspace, tmp_path):
+    expected = as_records(BatchRunner(loader=OfflineLoader()).run([offline_workspace]))
+
+    # the workers fill the cache and the index in the first run and read them in the second
+    for _ in range(2):
+        runner = parallel_runner(config_file, tmp_path)
+        assert as_records(runner.run([offline_workspace])) == expected
+
+
+def test_main_with_jobs(config_file, offline_workspace, tmp_path):
+    outputs = []
+    for options in ([], ['--jobs', '2', '--shard-size', '1']):
+        output = str(tmp_path / f'{len(outputs)}.jsonl')
+        assert main(['--offline', '--config', config_file, '--output', output, *options,
+                     offline_workspace]) == 1
+        with open(output, encoding='utf-8') as stream:
+            outputs.append(stream.read())
+    assert outputs[0] and outputs[1] == outputs[0]
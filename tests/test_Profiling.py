@@ -0,0 +1,97 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+from benchmarks.Fakes import FakeMappingItem, FakePackage, FakeTestStep
+
+from UserPyModules.CustomChecks.helper.ApiRecorder import ApiRecorder
+from UserPyModules.CustomChecks.helper.Profiling import OBJECT_API, Profiler, TimedItem
+
+
+def make_package():
+    test_step = FakeTestStep('TsTodo', 3)
+    test_step.children.append(FakeTestStep('TsBlock', 4))
+    return FakePackage('TC', '/ws/TC.pkg', True, '1', 'description', {'Owner': 'me'}, [],
+                       [test_step], [FakeMappingItem('Speed', 'READ')])
+
+
+def timed_calls(profiler):
+    return {name: calls for (category, name), (calls, _) in profiler.timings.items()
+            if category == OBJECT_API}
+
+
+def test_returned_objects_are_timed():
+    profiler = Profiler()
+    package = TimedItem(make_package(), profiler)
+
+    test_steps = package.GetTestSteps(recursive=True)
+    assert [test_step.GetType() for test_step in test_steps] == ['TsTodo', 'TsBlock']
+    assert [str(test_step) for test_step in test_steps] == ['TsTodo: line 3', 'TsBlock: line 4']
+    assert package.GetMapping().GetItems()[0].GetReferenceName() == 'Speed'
+    assert package.Attributes.GetNamesAndValues() == {'Owner': 'me'}
+    assert package.GetName() == 'TC'
+
+    assert timed_calls(profiler) == {
+        'GetTestSteps': 1,
+        'FakeTestStep.GetType': 2,
+        'FakeTestStep.__str__': 2,
+        'GetMapping': 1,
+        'FakeMapping.GetItems': 1,
+        'FakeMappingItem.GetReferenceName': 1,
+        'Attributes.GetNamesAndValues': 1,
+        'GetName': 1,
+    }
+
+
+def test_recorded_objects_keep_their_type_name():
+    profiler = Profiler()
+    package = TimedItem(ApiRecorder().wrap(make_package()), profiler)
+
+    assert package.GetTestSteps(recursive=False)[0].GetLineNo() == 3
+    assert 'FakeTestStep.GetLineNo' in timed_calls(profiler)
+
+
+class Collection:
+    """
+    Collection object of the object API, e.g. the test steps of a package.
+    """
+
+    def __init__(self, elements):
+        self.elements = elements
+
+    def __iter__(self):
+        return iter(self.elements)
+
+    def __len__(self):
+        return len(self.elements)
+
+
+class CollectionPackage(FakePackage):
+    """
+    Package returning its test steps as collection object.
+    """
+
+    def GetTestSteps(self, *args, **kwargs):  # pylint: disable=C0103
+        return Collection(super().GetTestSteps(*args, **kwargs))
+
+
+def test_special_methods_are_forwarded():
+    profiler = Profiler()
+    item = CollectionPackage('TC', '/ws/TC.pkg', True, '1', '', {}, [],
+                             [FakeTestStep('TsTodo', 3), FakeTestStep('TsBlock', 4)], [])
+    package = TimedItem(item, profiler)
+
+    test_steps = package.GetTestSteps(recursive=False)
+    assert len(test_steps) == 2 and test_steps
+    assert not package.GetMapping().GetItems()
+    assert [test_step.GetLineNo() for test_step in test_steps] == [3, 4]
+    assert package == TimedItem(item, Profiler()) == item
+    assert package != TimedItem(make_package(), profiler)
+    assert len({package, TimedItem(item, profiler)}) == 1
+
+    calls = timed_calls(profiler)
+    assert calls['Collection.__len__'] == 1
+    assert calls['Collection.__bool__'] == 1
+    assert calls['Collection.__iter__'] == 1
+    assert calls['FakeTestStep.GetLineNo'] == 2
+    assert calls['__eq__'] == 3
@@ -0,0 +1,91 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import os
+
+import pytest
+
+from UserPyModules.CustomChecks.batch import ProjectFile as project_file
+from UserPyModules.CustomChecks.batch.BatchRunner import get_item_type
+from UserPyModules.CustomChecks.batch.OfflineLoader import OfflineLoader
+from UserPyModules.CustomChecks.batch.ProjectFile import (PackageIndex, expand_references,
+                                                          read_project)
+from UserPyModules.CustomChecks.helper.CheckType import CheckType
+
+from conftest import FIXTURES
+
+SAMPLE = os.path.join(FIXTURES, 'Sample.prj')
+PACKAGE = os.path.join(FIXTURES, 'Sample.pkg')
+MISSING = os.path.join(FIXTURES, 'Library', 'Missing.pkg')
+
+
+def test_values():
+    project = read_project(SAMPLE)
+    assert project.GetName() == 'Sample'
+    assert project.GetFilename() == SAMPLE
+    assert project.Attributes.GetNamesAndValues() == {'Designer': 'Jane Doe',
+                                                      'Status': 'released'}
+    # normalized, in file order, every package once
+    assert project.package_references == [PACKAGE, MISSING]
+
+
+@pytest.mark.parametrize('content, message', [
+    ('<PACKAGE/>', "no project file, root element is 'PACKAGE'"),
+    ('<PROJECT/>', 'project is empty'),
+    ('<PROJECT><PACKAGEREFERENCE/></PROJECT>', "element 'PACKAGEREFERENCE' has no 'PATH'"),
+    ('<PROJECT><ATTRIBUTES><ATTRIBUTE>x</ATTRIBUTE></ATTRIBUTES></PROJECT>',
+     "element 'ATTRIBUTE' has no 'NAME'"),
+])
+def test_unexpected_structure(tmp_path, content, message):
+    path = tmp_path / 'Broken.prj'
+    path.write_text(content)
+    with pytest.raises(ValueError, match=message):
+        read_project(str(path))
+
+
+def test_unknown_elements_are_ignored(tmp_path):
+    path = tmp_path / 'Extended.prj'
+    path.write_text('<PROJECT><SETTINGS><ATTRIBUTE/></SETTINGS>'
+                    '<FOLDER NAME="Lib"><ATTRIBUTES><ATTRIBUTE NAME="x"/></ATTRIBUTES>'
+                    '<PACKAGEREFERENCE PATH="Lib/A.pkg"><NOTE/></PACKAGEREFERENCE></FOLDER>'
+                    '<PACKAGES><PACKAGEREFERENCE PATH="B.pkg"/></PACKAGES></PROJECT>')
+    project = read_project(str(path))
+    assert project.Attributes.GetNamesAndValues() == {}
+    assert project.package_references == [str(tmp_path / 'Lib' / 'A.pkg')]
+
+    path.write_text('<PROJECT><SETTINGS/></PROJECT>')
+    assert read_project(str(path)).package_references == []
+
+
+def test_expand_references(tmp_path):
+    broken = tmp_path / 'Broken.prj'
+    broken.write_text('<PROJECT/>')
+    index, missing, parsed = PackageIndex(), [], {}
+    paths = list(expand_references([SAMPLE, PACKAGE, str(broken)], index, missing, parsed))
+
+    assert paths == [SAMPLE, PACKAGE, str(broken)]
+    assert missing == [MISSING]
+    assert index.packages == {SAMPLE: [PACKAGE, MISSING]}
+    assert index.projects == {PACKAGE: [SAMPLE], MISSING: [SAMPLE]}
+    assert list(parsed) == [SAMPLE]
+
+
+def test_projects_are_read_once(monkeypatch):
+    reads = []
+
+    def read(path):
+        reads.append(path)
+        return read_project(path)
+
+    monkeypatch.setattr(project_file, 'read_project', read)
+    loader = OfflineLoader()
+    for path in expand_references([SAMPLE], parsed=loader.parsed_projects):
+        loader.open_item(path, get_item_type(path))
+    assert reads == [SAMPLE]
+    assert loader.parsed_projects == {}
+
+
+def test_loader_reads_unparsed_projects():
+    project = OfflineLoader().open_item(SAMPLE, CheckType.PROJECT.value)
+    assert project.package_references == [PACKAGE, MISSING]
@@ -0,0 +1,108 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import json
+import re
+
+import pytest
+
+from UserPyModules.CustomChecks.CheckPackageNamespace import CheckPackageNamespace
+from UserPyModules.CustomChecks.helper.Configuration import Configuration, set_config_file
+from UserPyModules.CustomChecks.helper.RegexRegistry import RegexRegistry
+
+from benchmarks.Fakes import FakePackage
+
+PATTERNS = ['^TC_', '^TC_[A-Z][a-z]+$', 'Login|Speed', '(?i)^tc_', r'^\d+\.\d+$', '',
+            '^(?!lib).*']
+INVALID_PATTERNS = ['^TC_(', '[a-', '*']
+NAMES = ['TC_Login', 'tc_login', 'TC_', 'Login', 'lib_Speed', '1.2', '', 'TC_Login2']
+
+CONFIG = '''
+CheckPackageNamespace:
+    Enabled: true
+    CheckName:
+        Parameters:
+            RegexPattern: {regex}
+'''
+
+
+def baseline_namespace(package_name, parameters):
+    """
+    Messages of CheckPackageNamespace before the patterns were compiled at config load, which
+    compiled and matched the pattern for every package.
+    """
+    try:
+        regex = parameters['RegexPattern']
+        re.compile(regex)
+    except KeyError:
+        return ['No pattern configuration provided.']
+    except re.error:
+        return [f'"{regex}" is not a valid pattern.']
+    if not re.match(regex, package_name):
+        return [f'{package_name} does not follow name pattern: "{regex}"']
+    return []
+
+
+def use_config(tmp_path, regex):
+    path = tmp_path / 'config.yaml'
+    # double quoted YAML scalars are JSON strings
+    path.write_text(CONFIG.format(regex=json.dumps(regex)))
+    set_config_file(str(path))
+
+
+@pytest.mark.parametrize('regex', PATTERNS)
+def test_valid_patterns_match_like_the_baseline(regex):
+    registry = RegexRegistry({'Check': {'Parameters': {'RegexPattern': regex}}}, 'config.yaml')
+    pattern = registry.get(regex)
+    assert registry.errors == []
+    for name in NAMES:
+        for function in ('match', 'search', 'fullmatch'):
+            expected = getattr(re, function)(regex, name)
+            found = getattr(pattern, function)(name)
+            assert (found and found.span()) == (expected and expected.span())
+
+
+@pytest.mark.parametrize('regex', PATTERNS)
+def test_check_results_equal_the_baseline(regex, tmp_path):
+    use_config(tmp_path, regex)
+    check = CheckPackageNamespace(None)
+    for name in NAMES:
+        package = FakePackage(name, f'/ws/{name}.pkg', True, '', '', {}, [], [], [])
+        assert [result.message for result in check.Run(package)] == baseline_namespace(
+            name, {'RegexPattern': regex})
+
+
+@pytest.mark.parametrize('regex', INVALID_PATTERNS)
+def test_invalid_patterns_are_reported_once(regex, tmp_path, caplog):
+    # the baseline reported the invalid pattern for every package
+    assert baseline_namespace('TC_Login', {'RegexPattern': regex}) == [
+        f'"{regex}" is not a valid pattern.']
+
+    use_config(tmp_path, regex)
+    check = CheckPackageNamespace(None)
+    for name in NAMES:
+        assert check.Run(FakePackage(name, f'/ws/{name}.pkg', True, '', '', {}, [], [],
+                                     [])) == []
+
+    errors = [error for error in Configuration().config_errors
+              if 'is not a valid pattern' in error]
+    assert len(errors) == 1
+    assert errors[0].startswith(f'"{regex}" is not a valid pattern (')
+    assert 'CheckPackageNamespace > CheckName > Parameters > RegexPattern' in errors[0]
+    assert caplog.text.count('is not a valid pattern') == 1
+
+
+def test_each_invalid_pattern_is_reported_once():
+    config = {'First': {'RegexPattern': '[a-'}, 'Second': [{'RegexPattern': '[a-'}],
+              'Third': {'RegexPattern': '^ok$'}}
+    registry = RegexRegistry(config, 'config.yaml')
+    assert len(registry.errors) == 1 and 'First > RegexPattern' in registry.errors[0]
+    assert registry.get('[a-') is None
+    assert registry.get('^ok$').match('ok')
+
+    # patterns outside of RegexPattern entries are compiled on first use
+    assert registry.get('^other$').match('other')
+    assert registry.get('(') is None and len(registry.errors) == 2
+    with pytest.raises(TypeError):
+        registry.get(42)
@@ -0,0 +1,99 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import os
+
+import pytest
+
+from UserPyModules.CustomChecks.api.CheckResult import CheckResult
+from UserPyModules.CustomChecks.batch import ResultCache as result_cache
+from UserPyModules.CustomChecks.batch.ResultCache import ResultCache, package_source_hash
+from UserPyModules.CustomChecks.CheckPackageNamespace import CheckPackageNamespace
+from UserPyModules.CustomChecks.CheckPackageVariables import CheckPackageVariables
+
+
+@pytest.fixture
+def item(tmp_path):
+    path = tmp_path / 'TC_Login.pkg'
+    path.write_text('<PACKAGE/>')
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache.db'))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def checks():
+    return [CheckPackageNamespace(None), CheckPackageVariables(None)]
+
+
+def test_keys_are_stable(cache, item, checks):
+    keys = cache.item_keys(item, checks)
+    assert list(keys) == ['CheckPackageNamespace', 'CheckPackageVariables']
+    assert keys['CheckPackageNamespace'] != keys['CheckPackageVariables']
+    assert cache.item_keys(item, checks) == keys
+
+
+def test_content_changes_the_keys(cache, item, checks):
+    keys = cache.item_keys(item, checks)
+    with open(item, 'a', encoding='utf-8') as stream:
+        stream.write(' ')
+    new_keys = cache.item_keys(item, checks)
+    assert all(new_keys[name] != key for name, key in keys.items())
+
+
+def test_package_source_changes_the_keys(cache, item, checks, monkeypatch):
+    keys = cache.item_keys(item, checks)
+    monkeypatch.setattr(result_cache, 'package_source_hash', lambda: 'changed helper')
+    new_keys = cache.item_keys(item, checks)
+    assert all(new_keys[name] != key for name, key in keys.items())
+
+
+def test_package_source_hash_covers_all_modules(monkeypatch):
+    hashed = []
+
+    def hash_file(path):
+        hashed.append(path)
+        return 'hash'
+
+    monkeypatch.setattr(result_cache, 'hash_file', hash_file)
+    assert package_source_hash.__wrapped__() == package_source_hash.__wrapped__()
+
+    root = os.path.dirname(os.path.dirname(result_cache.__file__))
+    modules = {os.path.relpath(path, root).replace(os.sep, '/') for path in hashed}
+    assert {'CheckPackageNamespace.py', 'api/CheckResult.py', 'helper/RunHelper.py',
+            'helper/Configuration.py', 'batch/ResultCache.py'} <= modules
+
+
+def test_store_and_lookup(cache, item, checks):
+    keys = cache.item_keys(item, checks)
+    results = [CheckResult('Login does not follow name pattern', check_name='CheckPackageNamespace',
+                           sub_check='CheckName', item_path=item)]
+    cache.store(item, keys, {'CheckPackageNamespace': results, 'CheckPackageVariables': []})
+    assert cache.lookup(item, keys) == {'CheckPackageNamespace': results,
+                                        'CheckPackageVariables': []}
+
+    keys['CheckPackageVariables'] = 'stale'
+    assert list(cache.lookup(item, keys)) == ['CheckPackageNamespace']
+
+
+def test_config_changes_the_keys(cache, item, checks, config_file):
+    keys = cache.item_keys(item, checks)
+    with open(config_file, encoding='utf-8') as stream:
+        content = stream.read()
+    try:
+        with open(config_file, 'w', encoding='utf-8') as stream:
+            stream.write(content.replace("RegexPattern: '^P_(.*)'", "RegexPattern: '^Par_(.*)'"))
+        new_keys = cache.item_keys(item, checks)
+    finally:
+        with open(config_file, 'w', encoding='utf-8') as stream:
+            stream.write(content)
+
+    # only the section of the changed check is different
+    assert new_keys['CheckPackageNamespace'] == keys['CheckPackageNamespace']
+    assert new_keys['CheckPackageVariables'] != keys['CheckPackageVariables']
@@ -0,0 +1,57 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from UserPyModules.CustomChecks.helper.Configuration import Configuration, set_config_file
+from UserPyModules.CustomChecks.helper.RunHelper import get_active_checks
+
+
+def check_names(active_checks):
+    return [active_check.name for active_check in active_checks]
+
+
+@pytest.mark.parametrize('error', [ValueError('bad value'), TypeError('bad type'),
+                                   AttributeError('no get'), KeyError('Order')])
+def test_invalid_parameters_are_reported_once(error):
+    config = Configuration()
+
+    def parse_parameters(parameters):
+        if 'Order' in parameters:
+            raise error
+        return parameters
+
+    for _ in range(2):
+        active_checks = get_active_checks(config, 'CheckPackageVariables', parse_parameters)
+        assert check_names(active_checks) == []
+
+    errors = [message for message in config.config_errors
+              if message.startswith('Invalid parameters of CheckPackageVariables')]
+    assert len(errors) == 1
+    assert str(error) in errors[0]
+
+
+def test_other_errors_are_raised():
+    def parse_parameters(parameters):
+        raise RuntimeError('bug')
+
+    with pytest.raises(RuntimeError):
+        get_active_checks(Configuration(), 'CheckPackageVariables', parse_parameters)
+
+
+def test_unknown_conditions_are_no_config_errors(tmp_path):
+    path = tmp_path / 'config.yaml'
+    path.write_text('CheckPackageNamespace:\n'
+                    '    Enabled: true\n'
+                    '    CheckName:\n'
+                    '        Conditions:\n'
+                    '            PackageSize: {RegexPattern: "."}\n'
+                    '        Parameters:\n'
+                    '            RegexPattern: "^TC_"\n')
+    set_config_file(str(path))
+    config = Configuration()
+    assert config.config_errors == []
+
+    (active_check,) = get_active_checks(config, 'CheckPackageNamespace')
+    assert active_check.conditions.unknown == ('PackageSize',)
@@ -0,0 +1,77 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import yaml
+
+from UserPyModules.CustomChecks.helper.Configuration import JSON_SCHEMA
+from UserPyModules.CustomChecks.helper.SchemaValidator import format_error, is_type, validate
+
+from conftest import TEMPLATE
+
+
+def test_template_is_valid():
+    with open(TEMPLATE, encoding='utf-8') as file:
+        config = yaml.safe_load(file)
+    assert validate(config, JSON_SCHEMA) == []
+
+
+def test_is_type_keeps_booleans_apart_from_numbers():
+    assert is_type(1, 'integer')
+    assert is_type(1.5, 'number')
+    assert not is_type(True, 'integer')
+    assert not is_type(False, 'number')
+    assert is_type(True, 'boolean')
+    assert is_type(None, 'null')
+
+
+def test_type_error_stops_at_the_value():
+    errors = validate({'a': 'text'}, {'properties': {'a': {'type': ['object', 'null'],
+                                                            'required': ['b']}}})
+    assert errors == [(('a',), "'text' is not of type object or null")]
+
+
+def test_required_and_unknown_entries():
+    schema = {'type': 'object', 'required': ['Parameters'],
+              'properties': {'Parameters': {}}, 'additionalProperties': False}
+    assert validate({'Other': 1}, schema, ('Check',)) == [
+        (('Check',), "'Parameters' is required"),
+        (('Check',), "unknown entry 'Other'")]
+
+
+def test_additional_properties_schema():
+    schema = {'additionalProperties': {'type': 'boolean'}}
+    assert validate({'a': True, 'b': 'yes'}, schema) == [(('b',), "'yes' is not of type boolean")]
+
+
+def test_items_enum_minimum_and_min_items():
+    schema = {'type': 'array', 'minItems': 1,
+              'items': {'enum': ['a', 'b']}}
+    assert validate([], schema) == [((), 'must not be empty')]
+    assert validate(['a', 'c'], schema) == [(('[1]',), "'c' is not one of ['a', 'b']")]
+    assert validate(0, {'minimum': 1}) == [((), '0 is less than 1')]
+
+
+def test_any_of():
+    schema = {'anyOf': [{'type': 'string'}, {'type': 'integer'}]}
+    assert validate(1, schema) == []
+    assert validate(1.5, schema) == [((), '1.5 is not valid here')]
+
+
+def test_config_errors():
+    config = {
+        'CheckPackageVariables': {
+            'Enabled': 'yes',
+            'CheckVariables': {'Parameters': {'Order': 1}, 'Condition': {}}
+        }
+    }
+    messages = sorted(format_error(error) for error in validate(config, JSON_SCHEMA))
+    assert messages == [
+        "CheckPackageVariables > CheckVariables > Parameters > Order: 1 is not of type object",
+        "CheckPackageVariables > CheckVariables: unknown entry 'Condition'",
+        "CheckPackageVariables > Enabled: 'yes' is not of type boolean",
+    ]
+
+
+def test_format_error_top_level():
+    assert format_error(((), 'is not of type object')) == 'top level: is not of type object'
@@ -0,0 +1,86 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+import time
+
+import pytest
+
+from UserPyModules.CustomChecks.batch.BatchRunner import BatchRunner, main
+from UserPyModules.CustomChecks.batch.OfflineLoader import OfflineLoader
+from UserPyModules.CustomChecks.batch.ResultCache import ResultCache
+from UserPyModules.CustomChecks.batch.ThreadedRunner import ThreadedRunner
+from UserPyModules.CustomChecks.batch.WorkspaceIndex import WorkspaceIndex
+
+
+def as_records(item_results):
+    return [(item_result.path, item_result.check_name,
+             [result.to_dict() for result in item_result.results], item_result.error)
+            for item_result in item_results]
+
+
+class SlowLoader(OfflineLoader):
+    """
+    Loader which waits like a remote object API and counts the test items open at once.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.open = 0
+        self.max_open = 0
+        self.threads = set()
+
+    def open_item(self, path, item_type):
+        with self.lock:
+            self.open += 1
+            self.max_open = max(self.max_open, self.open)
+            self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return super().open_item(path, item_type)
+
+    def close_item(self, item):
+        super().close_item(item)
+        with self.lock:
+            self.open -= 1
+
+
+@pytest.mark.parametrize('threads, max_in_flight', [(1, None), (3, None), (3, 1)])
+def test_results_equal_the_sequential_run(offline_workspace, threads, max_in_flight):
+    expected = as_records(BatchRunner(loader=OfflineLoader()).run([offline_workspace]))
+    assert expected
+
+    loader = SlowLoader()
+    runner = ThreadedRunner(threads=threads, max_in_flight=max_in_flight, loader=loader)
+    assert as_records(runner.run([offline_workspace])) == expected
+    assert loader.max_open <= min(threads, max_in_flight or threads)
+
+
+def test_threads_overlap_the_test_items(offline_workspace):
+    loader = SlowLoader()
+    list(ThreadedRunner(threads=3, loader=loader).run([offline_workspace]))
+    assert len(loader.threads) > 1
+
+
+def test_shared_cache_and_index(offline_workspace, tmp_path):
+    expected = as_records(BatchRunner(loader=OfflineLoader()).run([offline_workspace]))
+
+    cache = ResultCache(str(tmp_path / 'cache.db'))
+    index = WorkspaceIndex(str(tmp_path / 'index.db'))
+    for _ in range(2):
+        runner = ThreadedRunner(threads=3, loader=OfflineLoader(), cache=cache, index=index)
+        assert as_records(runner.run([offline_workspace])) == expected
+    cache.close()
+    index.close()
+
+
+def test_main_with_threads(config_file, offline_workspace, tmp_path):
+    outputs = []
+    for options in ([], ['--threads', '2', '--max-in-flight', '1']):
+        output = str(tmp_path / f'{len(outputs)}.jsonl')
+        assert main(['--offline', '--config', config_file, '--output', output, *options,
+                     offline_workspace]) == 1
+        with open(output, encoding='utf-8') as stream:
+            outputs.append(stream.read())
+    assert outputs[0] and outputs[1] == outputs[0]
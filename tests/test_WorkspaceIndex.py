@@ -0,0 +1,104 @@
+# Copyright (C) 2023 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import sqlite3
+
+import pytest
+
+from UserPyModules.CustomChecks.batch.WorkspaceIndex import WorkspaceIndex
+
+from benchmarks.Fakes import FakeMappingItem, FakePackage, FakeVariable
+
+
+class UntraversablePackage(FakePackage):
+    """
+    Package whose test steps and variables must not be read for the index.
+    """
+
+    def GetTestSteps(self, *args, **kwargs):  # pylint: disable=C0103
+        raise AssertionError('test steps are not indexed')
+
+    def GetVariables(self):  # pylint: disable=C0103
+        raise AssertionError('variables are not indexed')
+
+
+@pytest.fixture
+def package_path(tmp_path):
+    path = tmp_path / 'TC_Login.pkg'
+    path.write_text('<PACKAGE/>')
+    return str(path)
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = WorkspaceIndex(str(tmp_path / 'index.db'))
+    yield index
+    index.close()
+
+
+def package(path):
+    return UntraversablePackage(
+        'TC_Login', path, True, '1.0', 'login', {'Designer': 'Jane Doe', 'Status': ''},
+        [FakeVariable('V_a', 'Integer', False, False, '')], [],
+        [FakeMappingItem('Ignition', 'SIGNAL'), FakeMappingItem('Speed', 'MODEL')])
+
+
+def test_store_and_lookup(index, package_path, tmp_path):
+    assert index.store(package_path, 'hash', package(package_path))
+
+    # read back from the database by another instance
+    other = WorkspaceIndex(str(tmp_path / 'index.db'))
+    indexed = other.lookup(package_path, 'hash')
+    assert (indexed.GetName(), indexed.GetFilename(), indexed.HasTestCaseFlag(),
+            indexed.GetVersion(), indexed.GetDescription()) == (
+        'TC_Login', package_path, True, '1.0', 'login')
+    assert indexed.Attributes.GetNamesAndValues() == {'Designer': 'Jane Doe', 'Status': ''}
+    assert [(item.GetReferenceName(), item.GetAccessType())
+            for item in indexed.GetMapping().GetItems()] == [('Ignition', 'SIGNAL'),
+                                                             ('Speed', 'MODEL')]
+    assert other.lookup(package_path, 'changed') is None
+    other.close()
+
+
+def test_query_is_read_only(index, package_path):
+    index.store(package_path, 'hash', package(package_path))
+    assert index.query('SELECT folder, COUNT(*) FROM packages GROUP BY folder') == [
+        (os.path.dirname(package_path), 1)]
+
+    for statement in ('DELETE FROM packages', 'DROP TABLE attributes',
+                      "INSERT INTO attributes VALUES ('x', 'y', 'z')"):
+        with pytest.raises(sqlite3.OperationalError):
+            index.query(statement)
+
+    # the index is still writable and unchanged
+    assert index.query('SELECT COUNT(*) FROM attributes') == [(2,)]
+    assert index.store(package_path, 'new hash', package(package_path))
+    assert index.lookup(package_path, 'new hash') is not None
+
+
+def test_evict(index, package_path, tmp_path):
+    deleted = str(tmp_path / 'Deleted.pkg')
+    index.store(package_path, 'hash', package(package_path))
+    index.store(deleted, 'hash', package(deleted))
+    assert index.evict() == 1
+    assert index.query('SELECT path FROM packages') == [(package_path,)]
+    assert index.query('SELECT DISTINCT path FROM mapping_items') == [(package_path,)]
+
+
+def test_lookup_reads_the_current_entries(index, package_path, tmp_path):
+    other_path = str(tmp_path / 'TC_Other.pkg')
+    index.store(package_path, 'hash', package(package_path))
+    assert index.lookup(other_path, 'hash') is None
+
+    # entries stored by other workers are found without reopening the index
+    other = WorkspaceIndex(str(tmp_path / 'index.db'))
+    other.store(other_path, 'hash', package(other_path))
+    other.store(package_path, 'new hash', package(package_path))
+    other.close()
+
+    assert index.lookup(other_path, 'hash').GetFilename() == other_path
+    assert index.lookup(package_path, 'hash') is None
+    assert index.lookup(package_path, 'new hash').Attributes.GetNamesAndValues() == {
+        'Designer': 'Jane Doe', 'Status': ''}